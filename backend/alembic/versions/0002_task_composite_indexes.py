@@ -0,0 +1,65 @@
+"""Composite and partial indexes for task list queries
+
+Replaces the single-column status/priority/category_id indexes with
+composites that end in created_at, so filtered lists are served in
+(created_at, id) order straight from the index, and adds a partial
+due_date index covering only tasks that are not completed.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_TASKS = sa.text("status != 'COMPLETED'")
+
+
+def upgrade() -> None:
+    op.drop_index("ix_tasks_status", table_name="tasks")
+    op.drop_index("ix_tasks_priority", table_name="tasks")
+    op.drop_index("ix_tasks_category_id", table_name="tasks")
+
+    op.create_index("ix_tasks_created_at", "tasks", ["created_at"])
+    op.create_index("ix_tasks_status_created_at", "tasks", ["status", "created_at"])
+    op.create_index(
+        "ix_tasks_priority_created_at", "tasks", ["priority", "created_at"]
+    )
+    op.create_index(
+        "ix_tasks_category_id_created_at", "tasks", ["category_id", "created_at"]
+    )
+    op.create_index(
+        "ix_tasks_category_id_status_created_at",
+        "tasks",
+        ["category_id", "status", "created_at"],
+    )
+    op.create_index(
+        "ix_tasks_open_due_date",
+        "tasks",
+        ["due_date"],
+        sqlite_where=OPEN_TASKS,
+        postgresql_where=OPEN_TASKS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_open_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_category_id_status_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_category_id_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_priority_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_status_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_created_at", table_name="tasks")
+
+    op.create_index("ix_tasks_category_id", "tasks", ["category_id"])
+    op.create_index("ix_tasks_priority", "tasks", ["priority"])
+    op.create_index("ix_tasks_status", "tasks", ["status"])
@@ -0,0 +1,59 @@
+"""Materialized task counters for statistics
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reuse the enum types created with the tasks table on PostgreSQL
+    status = sa.Enum("TODO", "IN_PROGRESS", "COMPLETED", name="taskstatus")
+    priority = sa.Enum("LOW", "MEDIUM", "HIGH", name="taskpriority")
+    op.create_table(
+        "task_counters",
+        sa.Column(
+            "status",
+            status.with_variant(
+                postgresql.ENUM(name="taskstatus", create_type=False), "postgresql"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "priority",
+            priority.with_variant(
+                postgresql.ENUM(name="taskpriority", create_type=False), "postgresql"
+            ),
+            nullable=False,
+        ),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("status", "priority", "category_id"),
+    )
+
+    # Seed the counters from existing tasks
+    op.execute(
+        """
+        INSERT INTO task_counters (status, priority, category_id, count)
+        SELECT status, priority, COALESCE(category_id, 0), COUNT(*)
+        FROM tasks
+        GROUP BY status, priority, COALESCE(category_id, 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_counters")
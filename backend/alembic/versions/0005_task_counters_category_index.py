@@ -0,0 +1,35 @@
+"""Covering index on task_counters by category
+
+The task_counters primary key leads with status, so reading the counters
+of one category, or of every category grouped by category, had no index
+to use. This adds (category_id, status, count).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_counters_category_id_status_count",
+        "task_counters",
+        ["category_id", "status", "count"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_task_counters_category_id_status_count", table_name="task_counters"
+    )
@@ -0,0 +1,48 @@
+"""Task change feed
+
+Adds tasks.change_seq, stamped with the tasks table version by every
+write, and task_tombstones, recording deleted tasks at the version of the
+delete. Both are indexed by that sequence so GET /api/tasks/changes reads
+only what changed since a client's cursor. Existing tasks start at 0.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("change_seq", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index("ix_tasks_change_seq", "tasks", ["change_seq"])
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("change_seq", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index(
+        "ix_task_tombstones_change_seq", "task_tombstones", ["change_seq"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_tombstones_change_seq", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_index("ix_tasks_change_seq", table_name="tasks")
+    op.drop_column("tasks", "change_seq")
@@ -1,7 +1,7 @@
 """API router configuration."""
 
 from fastapi import APIRouter
-from app.api import tasks, categories
+from app.api import admin, events, tasks, categories
 
 # Create main API router
 api_router = APIRouter()
@@ -9,3 +9,5 @@ api_router = APIRouter()
 # Include sub-routers
 api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
 api_router.include_router(categories.router, prefix="/categories", tags=["Categories"])
+api_router.include_router(events.router, prefix="/events", tags=["Events"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
@@ -0,0 +1,107 @@
+"""Admin and diagnostics API endpoints."""
+
+from fastapi import APIRouter
+
+from app.core import database
+from app.core.category_cache import category_cache
+from app.core.events import event_broker
+from app.core.pool import pool_statistics
+from app.core.response_cache import task_list_cache
+from app.schemas.admin import (
+    CacheStatsResponse,
+    EventStatsResponse,
+    PoolStatsResponse,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/pool",
+    response_model=PoolStatsResponse,
+    response_model_exclude_none=True,
+    summary="Get connection pool statistics",
+    description=(
+        "Report live connection pool occupancy (checked out, idle, overflow) "
+        "and checkout wait times for each database engine."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved pool statistics",
+            "model": PoolStatsResponse,
+        }
+    },
+)
+async def get_pool_stats() -> PoolStatsResponse:
+    """
+    Get connection pool statistics.
+
+    Returns:
+        PoolStatsResponse: Statistics keyed by engine name
+    """
+    engines = {"primary": pool_statistics(database.engine)}
+    if database.read_engine is not None:
+        engines["replica"] = pool_statistics(database.read_engine)
+    if database.async_engine is not None:
+        engines["async"] = pool_statistics(database.async_engine.sync_engine)
+    if database.async_read_engine is not None:
+        engines["async_replica"] = pool_statistics(
+            database.async_read_engine.sync_engine
+        )
+    return PoolStatsResponse(engines=engines)
+
+
+@router.get(
+    "/cache",
+    response_model=CacheStatsResponse,
+    response_model_exclude_none=True,
+    summary="Get in-process cache statistics",
+    description=(
+        "Report size and hit/miss counters of this worker's in-process caches. "
+        "Each worker keeps its own caches, so numbers differ between workers."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved cache statistics",
+            "model": CacheStatsResponse,
+        }
+    },
+)
+async def get_cache_stats() -> CacheStatsResponse:
+    """
+    Get in-process cache statistics.
+
+    Returns:
+        CacheStatsResponse: Statistics keyed by cache name
+    """
+    return CacheStatsResponse(
+        caches={
+            "categories": category_cache.statistics(),
+            "task_lists": task_list_cache.statistics(),
+        }
+    )
+
+
+@router.get(
+    "/events",
+    response_model=EventStatsResponse,
+    summary="Get event stream statistics",
+    description=(
+        "Report open Server-Sent Events subscriptions, queue settings and "
+        "published / resync counters of this worker."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved event statistics",
+            "model": EventStatsResponse,
+        }
+    },
+)
+async def get_event_stats() -> EventStatsResponse:
+    """
+    Get event stream statistics.
+
+    Returns:
+        EventStatsResponse: Subscriber count, configuration and counters
+    """
+    return EventStatsResponse(**event_broker.statistics())
@@ -1,37 +1,71 @@
 """Category API endpoints."""
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.services.category_service import CategoryService
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryListResponse
+from typing import Union
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from app.core.conditional import NOT_MODIFIED_RESPONSE, conditional_get
+from app.core.database import SessionRunner, get_session_runner
+from app.core.serialization import ModelJSONResponse
+from app.models.category import Category
+from app.models.task import Task
+from app.services.category_service import AsyncCategoryService
+from app.schemas.category import (
+    CategoryCreate,
+    CategoryResponse,
+    CategoryListResponse,
+    CategoryWithCountsListResponse,
+)
 from app.schemas.common import ErrorResponse
 
 router = APIRouter()
 
+# Category lists may carry task counts, so task writes change them too
+category_list_preconditions = conditional_get(
+    Category.__tablename__, Task.__tablename__
+)
+category_preconditions = conditional_get(Category.__tablename__)
+
 
 @router.get(
     "",
-    response_model=CategoryListResponse,
+    response_model=Union[CategoryWithCountsListResponse, CategoryListResponse],
+    dependencies=[Depends(category_list_preconditions)],
     summary="Get all categories",
-    description="Retrieve a list of all categories in the system.",
+    description=(
+        "Retrieve a list of all categories in the system. With "
+        "`with_counts=true` each category also carries its total task count "
+        "and its task count per status, computed in a single aggregate query."
+    ),
     responses={
         200: {
             "description": "Successfully retrieved categories",
-            "model": CategoryListResponse,
-        }
+        },
+        **NOT_MODIFIED_RESPONSE,
     },
 )
-def get_categories(db: Session = Depends(get_db)) -> CategoryListResponse:
+async def get_categories(
+    response: Response,
+    with_counts: bool = Query(
+        False, description="Include task counts (total and per status) per category"
+    ),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
     Get all categories.
 
+    Args:
+        response: Response whose validator headers are carried over
+        with_counts: Include task counts per category
+        db: Database session runner
+
     Returns:
-        CategoryListResponse: List of all categories with total count
+        Response: JSON CategoryListResponse with all categories and the total
+        count, or CategoryWithCountsListResponse when with_counts is set
     """
-    service = CategoryService(db)
-    return service.get_all_categories()
+    service = AsyncCategoryService(db)
+    categories = await service.get_all_categories(with_counts=with_counts)
+    return ModelJSONResponse(categories, headers=response.headers)
 
 
 @router.post(
@@ -49,49 +83,58 @@ def get_categories(db: Session = Depends(get_db)) -> CategoryListResponse:
         422: {"description": "Validation error", "model": ErrorResponse},
     },
 )
-def create_category(
-    category_data: CategoryCreate, db: Session = Depends(get_db)
-) -> CategoryResponse:
+async def create_category(
+    category_data: CategoryCreate, db: SessionRunner = Depends(get_session_runner)
+) -> Response:
     """
     Create a new category.
 
     Args:
         category_data: Category creation data
-        db: Database session
+        db: Database session runner
 
     Returns:
-        CategoryResponse: The created category
+        Response: JSON CategoryResponse of the created category
 
     Raises:
         DuplicateException: If category with the same name already exists
     """
-    service = CategoryService(db)
-    return service.create_category(category_data)
+    service = AsyncCategoryService(db)
+    category = await service.create_category(category_data)
+    return ModelJSONResponse(category, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/{category_id}",
     response_model=CategoryResponse,
+    dependencies=[Depends(category_preconditions)],
     summary="Get a specific category",
     description="Retrieve a category by its ID.",
     responses={
         200: {"description": "Category found", "model": CategoryResponse},
+        **NOT_MODIFIED_RESPONSE,
         404: {"description": "Category not found", "model": ErrorResponse},
     },
 )
-def get_category(category_id: int, db: Session = Depends(get_db)) -> CategoryResponse:
+async def get_category(
+    response: Response,
+    category_id: int,
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
     Get a category by ID.
 
     Args:
+        response: Response whose validator headers are carried over
         category_id: The category ID to retrieve
-        db: Database session
+        db: Database session runner
 
     Returns:
-        CategoryResponse: The category data
+        Response: JSON CategoryResponse with the category data
 
     Raises:
         NotFoundException: If category is not found
     """
-    service = CategoryService(db)
-    return service.get_category_by_id(category_id)
+    service = AsyncCategoryService(db)
+    category = await service.get_category_by_id(category_id)
+    return ModelJSONResponse(category, headers=response.headers)
@@ -0,0 +1,48 @@
+"""Server-Sent Events endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.events import event_broker
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="Subscribe to task and category changes",
+    description=(
+        "Server-Sent Events stream of committed changes: task.created, "
+        "task.updated, task.status_changed and task.deleted with the task (or "
+        "its id), tasks.changed with an action and count for bulk writes and "
+        "imports, and category.created. A resync event means events were "
+        "dropped because the client fell behind; catch up through "
+        "GET /api/tasks/changes. Idle streams carry a heartbeat comment."
+    ),
+    responses={
+        200: {
+            "description": "Event stream",
+            "content": {"text/event-stream": {}},
+        }
+    },
+)
+async def stream_events() -> StreamingResponse:
+    """
+    Stream change events to the client until it disconnects.
+
+    The body is an async generator, so every open stream is a coroutine on
+    the event loop rather than a threadpool thread.
+
+    Returns:
+        StreamingResponse: text/event-stream body
+    """
+    return StreamingResponse(
+        event_broker.stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Keeps reverse proxies such as nginx from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
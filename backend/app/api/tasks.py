@@ -1,38 +1,139 @@
 """Task API endpoints."""
 
-from typing import Optional
-from fastapi import APIRouter, Depends, status, Query
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.services.task_service import TaskService
+from datetime import date, datetime, timezone
+from typing import Iterator, Optional, Tuple
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.compression import negotiate
+from app.core.conditional import NOT_MODIFIED_RESPONSE, conditional_get, make_etag
+from app.core.database import (
+    SessionRunner,
+    get_db,
+    get_session_factory,
+    get_session_runner,
+)
+from app.core.exceptions import ValidationException
+from app.core.export import MEDIA_TYPES, ExportFormat
+from app.core.fieldsets import include_fields, parse_fields
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.response_cache import task_list_cache
+from app.core.serialization import ModelJSONResponse, render_json
+from app.repositories.table_version_repository import Versions
+from app.services.task_service import IMPORT_BATCH_SIZE, AsyncTaskService, TaskService
 from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskStatusUpdate,
     TaskResponse,
     TaskListResponse,
+    TaskChangesResponse,
+    TaskStatsResponse,
+    TaskCalendarResponse,
+    TaskBulkCreate,
+    TaskBulkCreateResponse,
+    TaskBulkUpdate,
+    TaskBulkUpdateResponse,
+    TaskBulkDeleteResponse,
+    TaskImportResponse,
+    TaskSelection,
+    CALENDAR_MAX_DAYS,
+    TASK_FIELDS,
 )
 from app.schemas.common import ErrorResponse
-from app.models.task import TaskStatus, TaskPriority
+from app.models.category import Category
+from app.models.task import Task, TaskStatus, TaskPriority
 
 router = APIRouter()
 
+FIELDS_DESCRIPTION = (
+    "Comma-separated task fields to return, e.g. id,title,status. id is always "
+    "included; omitted fields are not read from the database. Available: "
+    + ", ".join(TASK_FIELDS)
+)
+
+# Task responses embed their category, so both tables feed the validators
+task_preconditions = conditional_get(Task.__tablename__, Category.__tablename__)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive UTC, the form due dates are stored in."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _due_filters(
+    status: Optional[TaskStatus],
+    due_before: Optional[datetime],
+    due_after: Optional[datetime],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Validate the due-date filters and bring them to naive UTC.
+
+    Args:
+        status: Status filter of the request
+        due_before: Exclusive upper bound on due_date
+        due_after: Inclusive lower bound on due_date
+
+    Returns:
+        Tuple of (due_before, due_after), offsets converted to UTC
+
+    Raises:
+        ValidationException: If a bound is combined with status=completed,
+            which matches nothing since due filters only match open tasks
+    """
+    if status == TaskStatus.COMPLETED and (
+        due_before is not None or due_after is not None
+    ):
+        raise ValidationException(
+            message="due_before and due_after only match open tasks; "
+            "they cannot be combined with status=completed",
+            details={"status": status.value},
+        )
+    return _naive_utc(due_before), _naive_utc(due_after)
+
 
 @router.get(
     "",
     response_model=TaskListResponse,
     summary="Get all tasks",
-    description="Retrieve a list of all tasks with optional filtering by status, priority, and category.",
+    description=(
+        "Retrieve a page of tasks, newest first, with optional filtering by status, "
+        "priority, and category. With q, only tasks whose title or description "
+        "contain every word are returned, most relevant first. due_before and "
+        "due_after restrict results to open (not completed) tasks due in a range "
+        "and cannot be combined with status=completed. fields limits each task to "
+        "the listed fields. Pass the returned next_cursor to fetch the next page."
+    ),
     responses={
         200: {"description": "Successfully retrieved tasks", "model": TaskListResponse},
+        **NOT_MODIFIED_RESPONSE,
         404: {
             "description": "Category not found (when filtering by category)",
             "model": ErrorResponse,
         },
+        422: {
+            "description": (
+                "Invalid pagination cursor, search text, fields or filter combination"
+            ),
+            "model": ErrorResponse,
+        },
     },
 )
-def get_tasks(
+async def get_tasks(
+    request: Request,
+    response: Response,
     status: Optional[TaskStatus] = Query(
         None, description="Filter tasks by status (todo, in_progress, completed)"
     ),
@@ -42,27 +143,98 @@ def get_tasks(
     category_id: Optional[int] = Query(
         None, description="Filter tasks by category ID"
     ),
-    db: Session = Depends(get_db),
-) -> TaskListResponse:
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of tasks to return",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous response's next_cursor"
+    ),
+    q: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=200,
+        description="Full-text search over task title and description",
+    ),
+    due_before: Optional[datetime] = Query(
+        None, description="Only open tasks due strictly before this time"
+    ),
+    due_after: Optional[datetime] = Query(
+        None, description="Only open tasks due at or after this time"
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    current: Versions = Depends(task_preconditions),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
-    Get all tasks with optional filters.
+    Get a page of tasks with optional filters and search.
+
+    Serialized pages are kept in the task list cache, keyed by the parsed
+    parameters and tied to the current table versions, so repeated
+    requests skip the queries and serialization until the next write.
+    Bodies are compressed here rather than by the middleware, so cached
+    pages keep their gzip / brotli variants as well.
 
     Args:
+        request: Incoming request, for its Accept-Encoding header
+        response: Response whose validator headers are carried over
         status: Optional filter by task status
         priority: Optional filter by task priority
         category_id: Optional filter by category ID
-        db: Database session
+        limit: Maximum number of tasks to return
+        cursor: Optional cursor to continue from
+        q: Optional full-text search text
+        due_before: Optional exclusive upper bound on due_date
+        due_after: Optional inclusive lower bound on due_date
+        fields: Optional comma-separated list of task fields to return
+        current: Table versions read by the conditional GET check
+        db: Database session runner
 
     Returns:
-        TaskListResponse: List of tasks matching the filters with total count
+        Response: JSON TaskListResponse with the page of tasks and total count
 
     Raises:
         NotFoundException: If specified category_id doesn't exist
+        ValidationException: If the cursor, search text or fields are invalid,
+            or due filters are combined with status=completed
     """
-    service = TaskService(db)
-    return service.get_all_tasks(
-        status=status, priority=priority, category_id=category_id
+    due_before, due_after = _due_filters(status, due_before, due_after)
+    selected = parse_fields(fields, TASK_FIELDS)
+    generation = make_etag(current)
+    # Search words are split on whitespace, so spacing never changes results
+    key = (
+        status,
+        priority,
+        category_id,
+        limit,
+        cursor,
+        " ".join(q.split()) if q is not None else None,
+        due_before,
+        due_after,
+        selected,
     )
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    encoded = task_list_cache.get(generation, key, encoding)
+    if encoded is None:
+        service = AsyncTaskService(db)
+        page = await service.get_all_tasks(
+            status=status,
+            priority=priority,
+            category_id=category_id,
+            limit=limit,
+            cursor=cursor,
+            q=q,
+            due_before=due_before,
+            due_after=due_after,
+            fields=selected,
+        )
+        body = render_json(page, include_fields(selected, TaskListResponse, "tasks"))
+        encoded = task_list_cache.put(generation, key, body, encoding)
+    # Already encoded, so the compression middleware passes the body through
+    headers = {**response.headers, **encoded.headers}
+    return ModelJSONResponse(encoded.body, headers=headers)
 
 
 @router.post(
@@ -80,53 +252,484 @@ def get_tasks(
         422: {"description": "Validation error", "model": ErrorResponse},
     },
 )
-def create_task(
-    task_data: TaskCreate, db: Session = Depends(get_db)
-) -> TaskResponse:
+async def create_task(
+    task_data: TaskCreate, db: SessionRunner = Depends(get_session_runner)
+) -> Response:
     """
     Create a new task.
 
     Args:
         task_data: Task creation data
-        db: Database session
+        db: Database session runner
 
     Returns:
-        TaskResponse: The created task
+        Response: JSON TaskResponse of the created task
 
     Raises:
         NotFoundException: If specified category_id doesn't exist
         ValidationException: If validation fails
     """
-    service = TaskService(db)
-    return service.create_task(task_data)
+    service = AsyncTaskService(db)
+    task = await service.create_task(task_data)
+    return ModelJSONResponse(task, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch(
+    "",
+    response_model=TaskBulkUpdateResponse,
+    summary="Update many tasks",
+    description=(
+        "Apply the same changes to every task selected by a list of IDs or by "
+        "status/priority/category filters, using a single UPDATE statement."
+    ),
+    responses={
+        200: {"description": "Tasks updated", "model": TaskBulkUpdateResponse},
+        404: {"description": "Category not found", "model": ErrorResponse},
+        422: {"description": "Validation error", "model": ErrorResponse},
+    },
+)
+async def update_tasks_bulk(
+    bulk_data: TaskBulkUpdate, db: SessionRunner = Depends(get_session_runner)
+) -> Response:
+    """
+    Update many tasks at once.
+
+    Args:
+        bulk_data: Task selection and the changes to apply
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskBulkUpdateResponse with the number of updated
+        tasks, and the tasks if requested
+
+    Raises:
+        NotFoundException: If the new category_id doesn't exist
+        ValidationException: If a required field is set to null
+    """
+    service = AsyncTaskService(db)
+    result = await service.update_tasks_bulk(bulk_data)
+    return ModelJSONResponse(result)
+
+
+@router.delete(
+    "",
+    response_model=TaskBulkDeleteResponse,
+    summary="Delete many tasks",
+    description=(
+        "Delete every task selected by a list of IDs or by status/priority/category "
+        "filters. Rows are removed by set-based DELETE statements in chunks, each "
+        "committed separately to keep write locks short."
+    ),
+    responses={
+        200: {"description": "Tasks deleted", "model": TaskBulkDeleteResponse},
+        422: {"description": "Validation error", "model": ErrorResponse},
+    },
+)
+async def delete_tasks_bulk(
+    selection: TaskSelection, db: SessionRunner = Depends(get_session_runner)
+) -> Response:
+    """
+    Delete many tasks at once.
+
+    Args:
+        selection: Task IDs or filters selecting the tasks to delete
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskBulkDeleteResponse with the number of deleted tasks
+    """
+    service = AsyncTaskService(db)
+    result = await service.delete_tasks_bulk(selection)
+    return ModelJSONResponse(result)
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many tasks",
+    description=(
+        "Create up to 10,000 tasks in one transaction. The request is atomic: "
+        "if any task references a missing category, nothing is created and the "
+        "error details list every failing item by index."
+    ),
+    responses={
+        201: {
+            "description": "Tasks created successfully",
+            "model": TaskBulkCreateResponse,
+        },
+        422: {
+            "description": "Validation error or missing categories",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def create_tasks_bulk(
+    bulk_data: TaskBulkCreate, db: SessionRunner = Depends(get_session_runner)
+) -> Response:
+    """
+    Create many tasks at once.
+
+    Args:
+        bulk_data: Tasks to create
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskBulkCreateResponse with the created tasks
+
+    Raises:
+        ValidationException: If any task references a missing category
+    """
+    service = AsyncTaskService(db)
+    created = await service.create_tasks_bulk(bulk_data)
+    return ModelJSONResponse(created, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsResponse,
+    dependencies=[Depends(task_preconditions)],
+    summary="Get task statistics",
+    description=(
+        "Retrieve task counts by status and priority, optionally for one category. "
+        "Served from incrementally maintained counters."
+    ),
+    responses={
+        200: {"description": "Task statistics", "model": TaskStatsResponse},
+        **NOT_MODIFIED_RESPONSE,
+        404: {
+            "description": "Category not found (when filtering by category)",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def get_task_stats(
+    response: Response,
+    category_id: Optional[int] = Query(
+        None, description="Restrict statistics to one category ID"
+    ),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
+    """
+    Get task statistics.
+
+    Args:
+        response: Response whose validator headers are carried over
+        category_id: Optional category ID to restrict statistics to
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskStatsResponse with total and per-status/priority
+        task counts
+
+    Raises:
+        NotFoundException: If specified category_id doesn't exist
+    """
+    service = AsyncTaskService(db)
+    stats = await service.get_task_stats(category_id=category_id)
+    return ModelJSONResponse(stats, headers=response.headers)
+
+
+@router.get(
+    "/calendar",
+    response_model=TaskCalendarResponse,
+    dependencies=[Depends(task_preconditions)],
+    summary="Get open tasks by due date",
+    description=(
+        "Count the open (not completed) tasks due on each day between from and to, "
+        "inclusive, and list their IDs. Days are UTC; days without tasks are omitted. "
+        f"The range may span at most {CALENDAR_MAX_DAYS} days."
+    ),
+    responses={
+        200: {"description": "Per-day due tasks", "model": TaskCalendarResponse},
+        **NOT_MODIFIED_RESPONSE,
+        422: {"description": "Invalid date range", "model": ErrorResponse},
+    },
+)
+async def get_task_calendar(
+    response: Response,
+    start: date = Query(..., alias="from", description="First day (inclusive)"),
+    end: date = Query(..., alias="to", description="Last day (inclusive)"),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
+    """
+    Get per-day counts of open tasks by due date.
+
+    Args:
+        response: Response whose validator headers are carried over
+        start: First day of the range
+        end: Last day of the range
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskCalendarResponse with the days with open tasks
+        due, with counts and IDs
+
+    Raises:
+        ValidationException: If the range is reversed or too long
+    """
+    service = AsyncTaskService(db)
+    calendar = await service.get_task_calendar(start, end)
+    return ModelJSONResponse(calendar, headers=response.headers)
+
+
+@router.get(
+    "/changes",
+    response_model=TaskChangesResponse,
+    dependencies=[Depends(task_preconditions)],
+    summary="Get task changes",
+    description=(
+        "Return the tasks created or updated and the IDs of tasks deleted since a "
+        "cursor, oldest change first. Without since, every task is returned. "
+        "Apply deleted before tasks, then call again with next_cursor; has_more "
+        "says whether to continue right away. Polls with If-None-Match get 304 "
+        "until something changes."
+    ),
+    responses={
+        200: {"description": "Changes since the cursor", "model": TaskChangesResponse},
+        **NOT_MODIFIED_RESPONSE,
+        422: {"description": "Invalid cursor", "model": ErrorResponse},
+    },
+)
+async def get_task_changes(
+    response: Response,
+    since: Optional[str] = Query(
+        None, description="Cursor from a previous response's next_cursor"
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of changes to return",
+    ),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
+    """
+    Get the task changes since a cursor.
+
+    Args:
+        response: Response whose validator headers are carried over
+        since: Optional cursor to continue from
+        limit: Maximum number of changes to return
+        db: Database session runner
+
+    Returns:
+        Response: JSON TaskChangesResponse with the changed tasks, deleted
+        task IDs and the next cursor
+
+    Raises:
+        ValidationException: If the cursor is invalid
+    """
+    service = AsyncTaskService(db)
+    changes = await service.get_changes(since=since, limit=limit)
+    return ModelJSONResponse(changes, headers=response.headers)
+
+
+def _closing(chunks: Iterator[bytes], db: Session) -> Iterator[bytes]:
+    """Yield the chunks, closing the session when the stream ends or is dropped."""
+    try:
+        yield from chunks
+    finally:
+        db.close()
+
+
+@router.get(
+    "/export",
+    dependencies=[Depends(task_preconditions)],
+    summary="Export tasks",
+    description=(
+        "Stream every task matching the filters as NDJSON (one task object per "
+        "line, as in the other endpoints) or CSV (with a header row, the category "
+        "flattened into category_name and category_color). Tasks are read and sent "
+        "in batches, so exports of any size use constant memory."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Matching tasks, newest first",
+            "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+        },
+        **NOT_MODIFIED_RESPONSE,
+        404: {
+            "description": "Category not found (when filtering by category)",
+            "model": ErrorResponse,
+        },
+        422: {
+            "description": "Invalid search text or filter combination",
+            "model": ErrorResponse,
+        },
+    },
+)
+def export_tasks(
+    response: Response,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson or csv"),
+    status: Optional[TaskStatus] = Query(
+        None, description="Filter tasks by status (todo, in_progress, completed)"
+    ),
+    priority: Optional[TaskPriority] = Query(
+        None, description="Filter tasks by priority (low, medium, high)"
+    ),
+    category_id: Optional[int] = Query(
+        None, description="Filter tasks by category ID"
+    ),
+    q: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=200,
+        description="Full-text search over task title and description",
+    ),
+    due_before: Optional[datetime] = Query(
+        None, description="Only open tasks due strictly before this time"
+    ),
+    due_after: Optional[datetime] = Query(
+        None, description="Only open tasks due at or after this time"
+    ),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """
+    Stream all matching tasks as NDJSON or CSV.
+
+    The body outlives the request's dependencies, so the export opens its
+    own session and closes it once the stream ends. This is a plain (sync)
+    endpoint in both database modes: the rows are read through a regular
+    Session and Starlette pulls each rendered batch in the threadpool.
+
+    Args:
+        response: Response whose validator headers are carried over
+        format: Export format
+        status: Optional filter by task status
+        priority: Optional filter by task priority
+        category_id: Optional filter by category ID
+        q: Optional full-text search text
+        due_before: Optional exclusive upper bound on due_date
+        due_after: Optional inclusive lower bound on due_date
+        session_factory: Factory for the export's own session
+
+    Returns:
+        StreamingResponse: The rendered tasks, sent as an attachment
+
+    Raises:
+        NotFoundException: If specified category_id doesn't exist
+        ValidationException: If the search text is invalid, or due filters are
+            combined with status=completed
+    """
+    due_before, due_after = _due_filters(status, due_before, due_after)
+    db = session_factory()
+    try:
+        chunks = TaskService(db).export_tasks(
+            format=format,
+            status=status,
+            priority=priority,
+            category_id=category_id,
+            q=q,
+            due_before=due_before,
+            due_after=due_after,
+        )
+    except BaseException:
+        db.close()
+        raise
+    headers = dict(response.headers)
+    headers["Content-Disposition"] = f'attachment; filename="tasks.{format.value}"'
+    return StreamingResponse(
+        _closing(chunks, db), media_type=MEDIA_TYPES[format], headers=headers
+    )
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResponse,
+    summary="Import tasks from a file",
+    description=(
+        "Upload an NDJSON (one task object per line) or CSV (header row with a "
+        "title column) file of tasks, e.g. an export. Records are validated one by "
+        "one; a category may be given by category_id or category_name. Valid "
+        f"tasks are inserted in transactions of {IMPORT_BATCH_SIZE}, invalid "
+        "records are skipped and reported by line."
+    ),
+    responses={
+        200: {"description": "Import summary", "model": TaskImportResponse},
+        422: {
+            "description": "Missing file or unusable CSV header",
+            "model": ErrorResponse,
+        },
+    },
+)
+def import_tasks(
+    file: UploadFile = File(..., description="NDJSON or CSV file of tasks"),
+    format: Optional[ExportFormat] = Query(
+        None, description="ndjson or csv (default: csv for .csv files, else ndjson)"
+    ),
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Import tasks from an uploaded NDJSON or CSV file.
+
+    The upload is spooled to a temporary file while the request is parsed
+    and then read line by line, so the file is never held in memory. Like
+    the export, this is a plain (sync) endpoint in both database modes: the
+    import runs through a regular Session in the threadpool.
+
+    Args:
+        file: Uploaded file
+        format: File format; inferred from the file name if omitted
+        db: Database session
+
+    Returns:
+        Response: JSON TaskImportResponse with counts and per-line errors
+
+    Raises:
+        ValidationException: If a CSV file has no usable header row
+    """
+    if format is None:
+        is_csv = (file.filename or "").lower().endswith(".csv")
+        format = ExportFormat.CSV if is_csv else ExportFormat.NDJSON
+    result = TaskService(db).import_tasks(file.file, format)
+    return ModelJSONResponse(result)
 
 
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
+    dependencies=[Depends(task_preconditions)],
     summary="Get a specific task",
-    description="Retrieve a task by its ID.",
+    description=(
+        "Retrieve a task by its ID. fields limits the task to the listed fields."
+    ),
     responses={
         200: {"description": "Task found", "model": TaskResponse},
+        **NOT_MODIFIED_RESPONSE,
         404: {"description": "Task not found", "model": ErrorResponse},
+        422: {"description": "Invalid fields", "model": ErrorResponse},
     },
 )
-def get_task(task_id: int, db: Session = Depends(get_db)) -> TaskResponse:
+async def get_task(
+    response: Response,
+    task_id: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
     Get a task by ID.
 
     Args:
+        response: Response whose validator headers are carried over
         task_id: The task ID to retrieve
-        db: Database session
+        fields: Optional comma-separated list of task fields to return
+        db: Database session runner
 
     Returns:
-        TaskResponse: The task data
+        Response: JSON TaskResponse with the task data
 
     Raises:
         NotFoundException: If task is not found
+        ValidationException: If fields names an unknown field
     """
-    service = TaskService(db)
-    return service.get_task_by_id(task_id)
+    selected = parse_fields(fields, TASK_FIELDS)
+    service = AsyncTaskService(db)
+    task = await service.get_task_by_id(task_id, fields=selected)
+    return ModelJSONResponse(
+        task, headers=response.headers, include=include_fields(selected, TaskResponse)
+    )
 
 
 @router.put(
@@ -143,26 +746,29 @@ def get_task(task_id: int, db: Session = Depends(get_db)) -> TaskResponse:
         422: {"description": "Validation error", "model": ErrorResponse},
     },
 )
-def update_task(
-    task_id: int, task_data: TaskUpdate, db: Session = Depends(get_db)
-) -> TaskResponse:
+async def update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
     Update an existing task.
 
     Args:
         task_id: The task ID to update
         task_data: Updated task data
-        db: Database session
+        db: Database session runner
 
     Returns:
-        TaskResponse: The updated task
+        Response: JSON TaskResponse of the updated task
 
     Raises:
         NotFoundException: If task or category is not found
         ValidationException: If validation fails
     """
-    service = TaskService(db)
-    return service.update_task(task_id, task_data)
+    service = AsyncTaskService(db)
+    task = await service.update_task(task_id, task_data)
+    return ModelJSONResponse(task)
 
 
 @router.patch(
@@ -176,25 +782,28 @@ def update_task(
         422: {"description": "Validation error", "model": ErrorResponse},
     },
 )
-def update_task_status(
-    task_id: int, status_data: TaskStatusUpdate, db: Session = Depends(get_db)
-) -> TaskResponse:
+async def update_task_status(
+    task_id: int,
+    status_data: TaskStatusUpdate,
+    db: SessionRunner = Depends(get_session_runner),
+) -> Response:
     """
     Update task status only.
 
     Args:
         task_id: The task ID to update
         status_data: New status data
-        db: Database session
+        db: Database session runner
 
     Returns:
-        TaskResponse: The updated task
+        Response: JSON TaskResponse of the updated task
 
     Raises:
         NotFoundException: If task is not found
     """
-    service = TaskService(db)
-    return service.update_task_status(task_id, status_data)
+    service = AsyncTaskService(db)
+    task = await service.update_task_status(task_id, status_data)
+    return ModelJSONResponse(task)
 
 
 @router.delete(
@@ -207,16 +816,18 @@ def update_task_status(
         404: {"description": "Task not found", "model": ErrorResponse},
     },
 )
-def delete_task(task_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_task(
+    task_id: int, db: SessionRunner = Depends(get_session_runner)
+) -> None:
     """
     Delete a task.
 
     Args:
         task_id: The task ID to delete
-        db: Database session
+        db: Database session runner
 
     Raises:
         NotFoundException: If task is not found
     """
-    service = TaskService(db)
-    service.delete_task(task_id)
+    service = AsyncTaskService(db)
+    await service.delete_task(task_id)
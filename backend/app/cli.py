@@ -0,0 +1,45 @@
+"""Command line maintenance tasks.
+
+Usage:
+    python -m app.cli rebuild-task-stats
+"""
+
+import argparse
+from typing import List, Optional
+
+from app.core.database import SessionLocal, init_db
+from app.repositories.task_stats_repository import TaskStatsRepository
+
+
+def rebuild_task_stats() -> None:
+    """Recompute the task_counters table from the tasks table."""
+    db = SessionLocal()
+    try:
+        buckets = TaskStatsRepository(db).rebuild()
+    finally:
+        db.close()
+    print(f"Rebuilt task statistics: {buckets} counter buckets")
+
+
+COMMANDS = {
+    "rebuild-task-stats": rebuild_task_stats,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Parse command line arguments and run the selected command.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+
+    init_db()
+    COMMANDS[args.command]()
+
+
+if __name__ == "__main__":
+    main()
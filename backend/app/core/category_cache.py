@@ -0,0 +1,256 @@
+"""In-process cache of the categories table."""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+
+class CachedCategory(NamedTuple):
+    """Immutable copy of a category row, safe to share across sessions."""
+
+    id: int
+    name: str
+    color: Optional[str]
+
+
+class _Snapshot(NamedTuple):
+    """Categories loaded in one read, indexed by id and by name."""
+
+    by_id: Dict[int, CachedCategory]
+    by_name: Dict[str, CachedCategory]
+    # True when every category fitted within max_size
+    complete: bool
+    loaded_at: float
+
+
+# Loads up to the given number of categories from the database
+TableLoader = Callable[[int], List[CachedCategory]]
+# Loads one category by key when the snapshot cannot answer
+RowLoader = Callable[[], Optional[CachedCategory]]
+# Loads the categories with the given IDs when the snapshot cannot answer
+RowsLoader = Callable[[List[int]], List[CachedCategory]]
+
+
+class CategoryCache:
+    """
+    Thread-safe, size-bounded copy of the categories table.
+
+    Categories are few and rarely change, so the whole table is loaded in
+    one query and answers lookups by id and by name. If the table outgrows
+    max_size only the first max_size rows are kept.
+
+    Only categories found in the snapshot are answered from memory; any
+    other key is read from the database, so a category created by another
+    worker is never reported missing. If that read finds a category a
+    complete snapshot lacks, the snapshot is stale and is dropped. Writes
+    made through this process invalidate the cache at once; changes made
+    by other workers to cached categories are seen once the snapshot
+    expires after ttl seconds.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to read the database
+        loads: Number of times the table was (re)loaded
+        invalidations: Number of explicit invalidations
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of categories kept (0 disables caching)
+            ttl: Seconds a loaded snapshot stays valid
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        # Bumped on every invalidation so a load that raced with a write
+        # does not store what it read before the write
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def _current(self, load_table: TableLoader) -> Tuple[_Snapshot, bool]:
+        """Return a fresh snapshot and whether it had to be loaded."""
+        with self._lock:
+            snapshot = self._snapshot
+            generation = self._generation
+        if snapshot is not None and self._clock() - snapshot.loaded_at < self.ttl:
+            return snapshot, False
+
+        loaded_at = self._clock()
+        rows = load_table(self.max_size + 1)
+        complete = len(rows) <= self.max_size
+        rows = rows[: self.max_size]
+        snapshot = _Snapshot(
+            by_id={row.id: row for row in rows},
+            by_name={row.name: row for row in rows},
+            complete=complete,
+            loaded_at=loaded_at,
+        )
+        with self._lock:
+            self.loads += 1
+            if generation == self._generation:
+                self._snapshot = snapshot
+        return snapshot, True
+
+    def _get(
+        self,
+        index: str,
+        key: object,
+        load_table: TableLoader,
+        load_row: RowLoader,
+    ) -> Optional[CachedCategory]:
+        """Look a key up in one index of the snapshot, then in the database."""
+        snapshot = None
+        if self.max_size > 0:
+            snapshot, loaded = self._current(load_table)
+            found = getattr(snapshot, index).get(key)
+            if found is not None:
+                with self._lock:
+                    if loaded:
+                        self.misses += 1
+                    else:
+                        self.hits += 1
+                return found
+
+        with self._lock:
+            self.misses += 1
+        found = load_row()
+        if found is not None and snapshot is not None and snapshot.complete:
+            with self._lock:
+                if self._snapshot is snapshot:
+                    self._snapshot = None
+        return found
+
+    def get_by_id(
+        self, category_id: int, load_table: TableLoader, load_row: RowLoader
+    ) -> Optional[CachedCategory]:
+        """
+        Look up a category by ID.
+
+        Args:
+            category_id: Category ID
+            load_table: Loads up to N categories when the snapshot is stale
+            load_row: Reads this category from the database on a miss
+
+        Returns:
+            CachedCategory if the category exists, None otherwise
+        """
+        return self._get("by_id", category_id, load_table, load_row)
+
+    def get_by_name(
+        self, name: str, load_table: TableLoader, load_row: RowLoader
+    ) -> Optional[CachedCategory]:
+        """
+        Look up a category by name.
+
+        Args:
+            name: Category name
+            load_table: Loads up to N categories when the snapshot is stale
+            load_row: Reads this category from the database on a miss
+
+        Returns:
+            CachedCategory if the category exists, None otherwise
+        """
+        return self._get("by_name", name, load_table, load_row)
+
+    def get_many_by_id(
+        self,
+        category_ids: Iterable[int],
+        load_table: TableLoader,
+        load_rows: RowsLoader,
+    ) -> Dict[int, CachedCategory]:
+        """
+        Look up several categories by ID, reading all misses in one query.
+
+        Args:
+            category_ids: Category IDs
+            load_table: Loads up to N categories when the snapshot is stale
+            load_rows: Reads the given categories from the database
+
+        Returns:
+            Mapping of ID to CachedCategory for the categories that exist
+        """
+        wanted = set(category_ids)
+        if not wanted:
+            return {}
+
+        found: Dict[int, CachedCategory] = {}
+        snapshot = None
+        loaded = False
+        if self.max_size > 0:
+            snapshot, loaded = self._current(load_table)
+            found = {i: snapshot.by_id[i] for i in wanted if i in snapshot.by_id}
+        missing = sorted(wanted - found.keys())
+
+        with self._lock:
+            if loaded or missing:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not missing:
+            return found
+
+        rows = load_rows(missing)
+        if rows and snapshot is not None and snapshot.complete:
+            with self._lock:
+                if self._snapshot is snapshot:
+                    self._snapshot = None
+        found.update((row.id, row) for row in rows)
+        return found
+
+    def invalidate(self) -> None:
+        """Drop the snapshot after a category write; the next lookup reloads."""
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop the snapshot and reset the counters."""
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+            self.hits = self.misses = self.loads = self.invalidations = 0
+
+    def statistics(self) -> Dict[str, object]:
+        """
+        Report cache size, configuration and counters.
+
+        Returns:
+            Dictionary suitable for the admin cache statistics endpoint
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            lookups = self.hits + self.misses
+            return {
+                "size": len(snapshot.by_id) if snapshot else 0,
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "complete": snapshot.complete if snapshot else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
+
+
+# Process-wide cache shared by every CategoryRepository
+category_cache = CategoryCache(
+    max_size=settings.CATEGORY_CACHE_SIZE, ttl=settings.CATEGORY_CACHE_TTL
+)
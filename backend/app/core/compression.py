@@ -0,0 +1,240 @@
+"""Negotiated gzip / brotli response compression."""
+
+import gzip
+import zlib
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Media types worth compressing; everything else (images, already
+# compressed archives) is sent as is
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# Textual types sent as is anyway: event streams stay open indefinitely, and
+# a compressor per idle connection would cost far more memory than it saves
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+# Encodings in order of preference when a client accepts several equally
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli else ("gzip",)
+
+
+class Encoded(NamedTuple):
+    """A response body together with the content coding applied to it."""
+
+    body: bytes
+    encoding: Optional[str] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the body's coding."""
+        headers = {"Vary": "Accept-Encoding"}
+        if self.encoding is not None:
+            headers["Content-Encoding"] = self.encoding
+        return headers
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Choose a content coding from an Accept-Encoding header.
+
+    The supported coding with the highest q-value wins; on ties brotli is
+    preferred. "*" stands for any coding not listed explicitly.
+
+    Args:
+        accept_encoding: Accept-Encoding header value, if any
+
+    Returns:
+        "br", "gzip", or None to send the body uncompressed (also when
+        compression is disabled)
+    """
+    if not settings.COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a complete body at the configured level.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def encode(body: bytes, encoding: Optional[str]) -> Encoded:
+    """
+    Compress a body if a coding was negotiated and it is large enough.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: Negotiated coding, or None
+
+    Returns:
+        Encoded body; bodies below COMPRESSION_MINIMUM_SIZE stay uncompressed
+    """
+    if encoding is None or len(body) < settings.COMPRESSION_MINIMUM_SIZE:
+        return Encoded(body)
+    return Encoded(compress(body, encoding), encoding)
+
+
+class _StreamCompressor:
+    """Incremental compressor for responses sent in several chunks."""
+
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._brotli = brotli.Compressor(
+                quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits 31: zlib deflate with a gzip header and trailer
+            self._zlib = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+            )
+
+    def process(self, chunk: bytes) -> bytes:
+        """Compress one chunk, flushing so the client can decode it at once."""
+        if self._brotli is not None:
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses the client accepts compressed.
+
+    Complete bodies are compressed when they reach COMPRESSION_MINIMUM_SIZE;
+    streamed bodies (sent in several chunks) are compressed chunk by chunk.
+    Responses that already carry a Content-Encoding, e.g. precompressed
+    bytes from a response cache, non-textual media types and event streams
+    pass through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app: Application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingResponder:
+    """ASGI send wrapper that compresses one response."""
+
+    def __init__(self, send: Send, encoding: str) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows how to send it
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+                or content_type.startswith(UNCOMPRESSED_TYPES)
+            )
+            if self.passthrough:
+                await self._flush_start()
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None and not more_body:
+            # The whole body in one message
+            encoded = encode(body, self.encoding) if body else Encoded(body)
+            self._set_headers(encoded, len(encoded.body))
+            await self._flush_start()
+            await self.send({**message, "body": encoded.body})
+            return
+
+        if self.compressor is None:
+            self.compressor = _StreamCompressor(self.encoding)
+            self._set_headers(Encoded(b"", self.encoding), None)
+            await self._flush_start()
+        chunk = self.compressor.process(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({**message, "body": chunk})
+
+    def _set_headers(self, encoded: Encoded, length: Optional[int]) -> None:
+        """Describe the (possibly) compressed body in the held-back start."""
+        headers = MutableHeaders(raw=self.start["headers"])
+        # Responses negotiated by the endpoint (Encoded.headers) carry it already
+        vary = {token.strip().lower() for token in headers.get("vary", "").split(",")}
+        if "accept-encoding" not in vary:
+            headers.add_vary_header("Accept-Encoding")
+        if encoded.encoding is None:
+            return
+        headers["Content-Encoding"] = encoded.encoding
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+
+    async def _flush_start(self) -> None:
+        """Send the response start if it has not been sent yet."""
+        if self.start is not None:
+            await self.send(self.start)
+            self.start = None
+
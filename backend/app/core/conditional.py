@@ -0,0 +1,189 @@
+"""Conditional GET support (ETag / Last-Modified validators)."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app.core.config import settings
+from app.core.database import SessionRunner, get_session_runner
+from app.repositories.table_version_repository import (
+    TableVersionRepository,
+    Versions,
+)
+
+# Responses are revalidated on every use instead of being reused blindly
+CACHE_CONTROL = "private, no-cache"
+
+# OpenAPI description of the 304 answer, for routes using conditional_get
+NOT_MODIFIED_RESPONSE = {
+    304: {"description": "Not modified since the ETag or date the client sent"}
+}
+
+
+def make_etag(current: Versions) -> str:
+    """
+    Build a weak entity tag from table versions.
+
+    The latest write time is included so versions restarting from zero
+    (e.g. a recreated database) never reproduce an old tag.
+
+    Args:
+        current: Versions of the tables a response is built from
+
+    Returns:
+        Weak ETag header value, e.g. W/"12-3-1760700000123456"
+    """
+    parts = [str(version) for version in current.versions.values()]
+    if current.last_modified is not None:
+        stamp = current.last_modified.replace(tzinfo=timezone.utc).timestamp()
+        parts.append(str(int(stamp * 1_000_000)))
+    return 'W/"' + "-".join(parts) + '"'
+
+
+def _http_date_settled(last_modified: Optional[datetime]) -> bool:
+    """
+    Tell whether a write time can safely be used as an HTTP date.
+
+    HTTP dates have one-second resolution, so a date is only a reliable
+    validator once its second is over; otherwise a second write in the same
+    second would carry the same date.
+    """
+    if last_modified is None:
+        return False
+    return last_modified.replace(microsecond=0) < datetime.utcnow().replace(
+        microsecond=0
+    )
+
+
+def validator_headers(current: Versions) -> Dict[str, str]:
+    """
+    Build the validator headers sent with a response.
+
+    Args:
+        current: Versions of the tables a response is built from
+
+    Returns:
+        ETag and Cache-Control headers, plus Last-Modified once the second
+        of the latest write is over
+    """
+    headers = {"ETag": make_etag(current), "Cache-Control": CACHE_CONTROL}
+    if _http_date_settled(current.last_modified):
+        headers["Last-Modified"] = format_datetime(
+            current.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def _strip_weak(tag: str) -> str:
+    """Return an entity tag without its weakness prefix."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Tell whether an If-None-Match header matches an entity tag.
+
+    Uses weak comparison, as required for If-None-Match.
+
+    Args:
+        if_none_match: Header value, a list of entity tags or "*"
+        etag: Current entity tag
+
+    Returns:
+        True if any listed tag matches
+    """
+    if if_none_match.strip() == "*":
+        return True
+    current = _strip_weak(etag)
+    return any(
+        _strip_weak(tag.strip()) == current for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_since(if_modified_since: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Tell whether nothing changed after an If-Modified-Since date.
+
+    Args:
+        if_modified_since: Header value (HTTP-date)
+        last_modified: Latest write time (naive UTC), if known
+
+    Returns:
+        True if the resource is known not to have changed; False if it
+        changed, its write time is unknown or too recent to compare at
+        one-second resolution, or the date cannot be parsed
+    """
+    if not _http_date_settled(last_modified):
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    return modified <= since
+
+
+def is_not_modified(request: Request, current: Versions, etag: str) -> bool:
+    """
+    Evaluate a request's preconditions against the current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when it is absent.
+
+    Args:
+        request: Incoming request
+        current: Current table versions
+        etag: Current entity tag
+
+    Returns:
+        True if a 304 Not Modified response should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        return not_modified_since(if_modified_since, current.last_modified)
+    return False
+
+
+def conditional_get(*tables: str) -> Callable[..., Awaitable[Versions]]:
+    """
+    Create a route dependency that answers conditional GETs.
+
+    The dependency reads the versions of the given tables (one primary key
+    lookup) before the endpoint runs. If the client's validators still
+    match it ends the request with 304 Not Modified, so the endpoint's
+    queries and serialization are skipped; otherwise it attaches ETag and
+    Last-Modified headers to the response.
+
+    Args:
+        tables: Names of the tables the endpoint's response is built from
+
+    Returns:
+        Dependency for a route's dependencies list; as a parameter
+        dependency it provides the versions it read
+    """
+
+    async def check_preconditions(
+        request: Request,
+        response: Response,
+        db: SessionRunner = Depends(get_session_runner),
+    ) -> Versions:
+        current = await db.run_sync(
+            lambda session: TableVersionRepository(session).get(tables)
+        )
+        headers = validator_headers(current)
+        if is_not_modified(request, current, headers["ETag"]):
+            if settings.COMPRESSION_ENABLED:
+                # The 200 varies by Accept-Encoding; caches key the 304 the same way
+                headers["Vary"] = "Accept-Encoding"
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return current
+
+    return check_preconditions
@@ -1,6 +1,6 @@
 """Application configuration management."""
 
-from typing import List
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,6 +9,68 @@ class Settings(BaseSettings):
 
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./taskflow.db"
+    # "sync" serves requests from the threadpool with a sync engine,
+    # "async" runs them on the event loop with an AsyncEngine
+    DATABASE_MODE: Literal["sync", "async"] = "sync"
+    # Async URL; derived from DATABASE_URL when unset (e.g. sqlite -> sqlite+aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Optional read replica for GET requests, e.g. a read-only SQLite URI:
+    # sqlite:///file:./taskflow.db?mode=ro&uri=true
+    READ_DATABASE_URL: Optional[str] = None
+
+    # Connection Pool Configuration
+    # Unset values use per-dialect defaults: a QueuePool for file SQLite and
+    # server databases (with pre-ping and recycling for the latter), and a
+    # StaticPool for in-memory SQLite
+    DB_POOL_CLASS: Optional[Literal["queue", "singleton", "static", "null"]] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+
+    # SQLite Configuration (PRAGMAs applied to every new connection)
+    SQLITE_JOURNAL_MODE: Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    # Page cache size; negative values are KiB (-64000 = ~64 MB)
+    SQLITE_CACHE_SIZE: int = -64000
+    # Bytes of the database file to memory-map (0 disables mmap)
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    # Milliseconds to wait for a lock before failing with "database is locked"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    SQLITE_FOREIGN_KEYS: bool = True
+
+    # Category Cache Configuration
+    # Maximum number of categories kept in memory per process (0 disables)
+    CATEGORY_CACHE_SIZE: int = 1024
+    # Seconds before a worker reloads categories changed by other workers
+    CATEGORY_CACHE_TTL: float = 60.0
+
+    # Task List Cache Configuration
+    # Serialized GET /api/tasks responses kept per process, keyed by the
+    # filters and invalidated by any task or category write
+    TASK_LIST_CACHE_ENABLED: bool = True
+    TASK_LIST_CACHE_MAX_BYTES: int = 33554432
+    TASK_LIST_CACHE_TTL: float = 30.0
+
+    # Response Compression Configuration
+    # gzip / brotli for clients that accept it; bodies below the minimum size
+    # are sent as is, since compressing them saves too little to pay off
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    # zlib level 1 (fastest) - 9 (smallest)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    # brotli quality 0 (fastest) - 11 (smallest)
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Server-Sent Events Configuration (GET /api/events)
+    # Events queued per subscriber before it is told to resync
+    EVENTS_QUEUE_SIZE: int = 256
+    # Seconds between heartbeat comments to idle subscribers
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    # Reconnection delay suggested to EventSource clients (milliseconds)
+    EVENTS_RETRY_MS: int = 3000
 
     # API Configuration
     API_V1_PREFIX: str = "/api"
@@ -1,30 +1,267 @@
 """Database configuration and session management."""
 
-from typing import Generator
-from sqlalchemy import create_engine
+import logging
+from functools import partial
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Optional,
+    Protocol,
+    TypeVar,
+)
+import anyio
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
+from app.core.pool import pool_options
+
+T = TypeVar("T")
+
+# Async drivers used when ASYNC_DATABASE_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+logger = logging.getLogger(__name__)
+
+# Readable names for PRAGMAs that report their value as a number
+SQLITE_PRAGMA_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+    "foreign_keys": {0: "OFF", 1: "ON"},
+}
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Return the PRAGMAs to apply to SQLite connections, from settings.
+
+    Returns:
+        Mapping of PRAGMA name to value, in the order they are applied
+    """
+    return {
+        # busy_timeout first so the journal_mode switch can wait for locks
+        "busy_timeout": int(settings.SQLITE_BUSY_TIMEOUT),
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "cache_size": int(settings.SQLITE_CACHE_SIZE),
+        "mmap_size": int(settings.SQLITE_MMAP_SIZE),
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """
+    Apply the configured PRAGMAs to every new connection of an SQLite engine.
+
+    Most PRAGMAs are per connection, so they are set from a connect event
+    rather than once. Read-only (mode=ro) URLs keep the file's journal mode.
+    Engines for other databases are left untouched.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+    if engine.url.query.get("mode") == "ro":
+        # The journal mode is stored in the database file and set by the
+        # primary; a read-only connection cannot change it
+        del pragmas["journal_mode"]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def effective_sqlite_pragmas(engine: Engine) -> Dict[str, Any]:
+    """
+    Read back the PRAGMA values in force on a connection of an SQLite engine.
+
+    Args:
+        engine: Sync SQLite engine
+
+    Returns:
+        Mapping of PRAGMA name to its effective value
+    """
+    values: Dict[str, Any] = {}
+    with engine.connect() as conn:
+        for name in sqlite_pragmas():
+            value = conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            values[name] = SQLITE_PRAGMA_NAMES.get(name, {}).get(value, value)
+    return values
+
+
+def create_db_engine(url: str) -> Engine:
+    """
+    Create a sync engine with the configured pool and SQLite settings.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Engine for the database
+    """
+    db_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if "sqlite" in url else {},
+        echo=settings.DEBUG,
+        **pool_options(url),
+    )
+    configure_sqlite(db_engine)
+    return db_engine
+
 
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG,
-)
+engine = create_db_engine(settings.DATABASE_URL)
 
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read engine (replica) serving read-only requests
+read_engine: Optional[Engine] = (
+    create_db_engine(settings.READ_DATABASE_URL) if settings.READ_DATABASE_URL else None
+)
+ReadSessionLocal: Optional[sessionmaker] = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    if read_engine is not None
+    else None
+)
+
+# HTTP methods routed to the read engine when one is configured
+READ_METHODS = frozenset({"GET", "HEAD"})
+
 # Create Base class for declarative models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+def async_database_url(url: str) -> str:
+    """
+    Derive an async driver URL from a sync database URL.
+
+    Args:
+        url: Database URL, with or without an explicit driver
+
+    Returns:
+        The same URL using the async driver for its dialect
+    """
+    parsed = make_url(url)
+    if parsed.drivername in ASYNC_DRIVERS.values():
+        return url
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create the AsyncEngine used in async database mode.
+
+    Args:
+        url: Async database URL (defaults to the configured one)
+
+    Returns:
+        AsyncEngine for the database
+    """
+    url = url or settings.ASYNC_DATABASE_URL or async_database_url(
+        settings.DATABASE_URL
+    )
+    db_engine = create_async_engine(
+        url, echo=settings.DEBUG, **pool_options(url, is_async=True)
+    )
+    configure_sqlite(db_engine.sync_engine)
+    return db_engine
+
+
+# Async engine and session factory, only created in async mode so the async
+# driver is not required otherwise
+async_engine: Optional[AsyncEngine] = (
+    create_async_db_engine() if settings.DATABASE_MODE == "async" else None
+)
+AsyncSessionLocal: Optional[async_sessionmaker] = (
+    async_sessionmaker(async_engine, autoflush=False)
+    if async_engine is not None
+    else None
+)
+async_read_engine: Optional[AsyncEngine] = (
+    create_async_db_engine(async_database_url(settings.READ_DATABASE_URL))
+    if async_engine is not None and settings.READ_DATABASE_URL
+    else None
+)
+AsyncReadSessionLocal: Optional[async_sessionmaker] = (
+    async_sessionmaker(async_read_engine, autoflush=False)
+    if async_read_engine is not None
+    else None
+)
+
+
+def is_read_request(request: Request) -> bool:
+    """
+    Tell whether a request may be served from the read engine.
+
+    Routing is decided once per request, so a request that writes reads from
+    the primary throughout and always sees its own writes.
+
+    Args:
+        request: Incoming HTTP request
+
+    Returns:
+        True for read-only HTTP methods
+    """
+    return request.method in READ_METHODS
+
+
+def get_session_factory(request: Request) -> sessionmaker:
+    """
+    Dependency function to get a session factory instead of a session.
+
+    For streamed responses: sessions from get_db are closed before the body
+    is sent, so a streaming endpoint opens (and closes) its own session.
+    Read-only requests get the read engine's factory when READ_DATABASE_URL
+    is set.
+
+    Args:
+        request: Incoming HTTP request
+
+    Returns:
+        sessionmaker for the read engine (read-only requests, if configured)
+        or the primary engine
+    """
+    if ReadSessionLocal is not None and is_read_request(request):
+        return ReadSessionLocal
+    return SessionLocal
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
 
+    Read-only requests get a session on the read engine when
+    READ_DATABASE_URL is set; everything else uses the primary.
+
+    Args:
+        request: Incoming HTTP request
+
     Yields:
         Session: SQLAlchemy database session
 
@@ -33,16 +270,105 @@ def get_db() -> Generator[Session, None, None]:
         def get_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
-    db = SessionLocal()
+    db = get_session_factory(request)()
     try:
         yield db
     finally:
         db.close()
 
 
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+
+    Routed like get_db: read-only requests use the read engine if configured.
+
+    Args:
+        request: Incoming HTTP request
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+
+    Raises:
+        RuntimeError: If the application is not running in async mode
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database sessions require DATABASE_MODE=async")
+    factory = AsyncSessionLocal
+    if AsyncReadSessionLocal is not None and is_read_request(request):
+        factory = AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
+
+
+class SessionRunner(Protocol):
+    """
+    Anything that can run synchronous session code from async endpoints.
+
+    AsyncSession satisfies this natively: run_sync executes the code in a
+    greenlet on the event loop while each query awaits the async driver.
+    """
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call fn(session, *args, **kwargs) and return its result."""
+        ...
+
+
+class ThreadedSession:
+    """
+    SessionRunner for sync database mode.
+
+    Runs the code in the threadpool with a regular Session, exactly as
+    FastAPI runs sync endpoints.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize runner with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call fn(session, *args, **kwargs) in a worker thread.
+
+        Returns:
+            The result of fn
+        """
+        return await anyio.to_thread.run_sync(partial(fn, self.db, *args, **kwargs))
+
+
+def get_threaded_session(db: Session = Depends(get_db)) -> ThreadedSession:
+    """
+    Dependency function to get a threadpool-backed session runner.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        ThreadedSession wrapping the session
+    """
+    return ThreadedSession(db)
+
+
+# Session runner dependency used by the API, selected by DATABASE_MODE
+get_session_runner = (
+    get_async_db if settings.DATABASE_MODE == "async" else get_threaded_session
+)
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables.
     Should be called on application startup.
     """
     Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == "sqlite":
+        pragmas = effective_sqlite_pragmas(engine)
+        logger.info(
+            "SQLite settings: %s",
+            ", ".join(f"{name}={value}" for name, value in pragmas.items()),
+        )
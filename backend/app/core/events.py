@@ -0,0 +1,265 @@
+"""In-process publish/subscribe of task and category changes (Server-Sent Events)."""
+
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Mapping, Set, Union
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.serialization import render_json
+
+# Sent in place of the events a slow subscriber could not take; the client
+# has missed changes and must catch up (e.g. through GET /api/tasks/changes)
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+# SSE comment line keeping idle connections (and proxies) from timing out
+HEARTBEAT_FRAME = b": heartbeat\n\n"
+
+# Queued in place of RESYNC_FRAME, so the subscriber knows it was taken
+_RESYNC = object()
+
+
+def format_event(event_id: int, event_type: str, data: bytes) -> bytes:
+    """
+    Build one SSE frame.
+
+    Args:
+        event_id: Event sequence number, sent as the id field
+        event_type: Event name, e.g. "task.created"
+        data: JSON payload on a single line
+
+    Returns:
+        Frame bytes terminated by a blank line
+    """
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, event_type.encode(), data)
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue of pending frames.
+
+    Only touched from the event loop that created it.
+
+    Attributes:
+        queue: Frames waiting to be sent
+        dropping: Whether events are dropped until the queued resync is sent
+    """
+
+    __slots__ = ("queue", "dropping")
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+        self.dropping = False
+
+    def offer(self, frame: bytes) -> bool:
+        """
+        Queue a frame without waiting.
+
+        When the queue is full, everything queued is discarded and replaced
+        by a single resync marker; later frames are dropped until the
+        subscriber has taken it, since it refetches their changes anyway.
+
+        Args:
+            frame: Rendered event
+
+        Returns:
+            False if the subscriber overflowed and was told to resync
+        """
+        if self.dropping:
+            return True
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+            self.dropping = True
+            return False
+
+
+class EventBroker:
+    """
+    Fan-out of change events to SSE subscribers in this process.
+
+    Subscribers are coroutines waiting on their own bounded queue, so an
+    idle connection costs a queue, not a thread or a timer: one heartbeat
+    task per event loop serves every subscriber on it. publish may be
+    called from any thread (services run in the threadpool or on the event
+    loop): the event is rendered once by the caller and handed to each
+    subscriber loop with a single call_soon_threadsafe, where it is offered
+    to every queue without blocking. A subscriber that falls behind by
+    queue_size events is sent a resync event instead of stalling the others.
+
+    Events only reach clients connected to the same worker process.
+
+    Attributes:
+        published: Events published while someone was subscribed
+        resyncs: Times a subscriber overflowed and was told to resync
+    """
+
+    def __init__(self, queue_size: int, heartbeat: float, retry_ms: int) -> None:
+        """
+        Initialize a broker without subscribers.
+
+        Args:
+            queue_size: Maximum number of events queued per subscriber
+            heartbeat: Seconds between heartbeats to idle subscribers
+            retry_ms: Reconnection delay suggested to clients
+        """
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.retry_ms = retry_ms
+        self._lock = threading.Lock()
+        # Subscriptions grouped by the event loop serving them, and the
+        # heartbeat task running on each of those loops
+        self._loops: Dict[asyncio.AbstractEventLoop, Set[Subscription]] = {}
+        self._heartbeats: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self._next_id = 1
+        self.published = 0
+        self.resyncs = 0
+
+    @property
+    def subscribers(self) -> int:
+        """Number of open subscriptions."""
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._loops.values())
+
+    def subscribe(self) -> Subscription:
+        """
+        Register a subscription on the running event loop.
+
+        Returns:
+            Subscription to release with unsubscribe()
+        """
+        subscription = Subscription(self.queue_size)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._loops.setdefault(loop, set()).add(subscription)
+            if loop not in self._heartbeats:
+                self._heartbeats[loop] = loop.create_task(self._beat(loop))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription; unknown subscriptions are ignored.
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        with self._lock:
+            for loop, subscriptions in list(self._loops.items()):
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._loops[loop]
+
+    def publish(
+        self, event_type: str, data: Union[BaseModel, Mapping[str, Any]]
+    ) -> None:
+        """
+        Send an event to every current subscriber.
+
+        Call after the change is committed. Without subscribers this returns
+        before rendering anything.
+
+        Args:
+            event_type: Event name, e.g. "task.created"
+            data: Response model or JSON-serializable mapping
+        """
+        if not self._loops:
+            return
+        if isinstance(data, BaseModel):
+            payload = render_json(data)
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+        # Ids are assigned and callbacks scheduled under the lock, so every
+        # loop receives the events in id order
+        with self._lock:
+            frame = format_event(self._next_id, event_type, payload)
+            self._next_id += 1
+            self.published += 1
+            for loop in list(self._loops):
+                try:
+                    loop.call_soon_threadsafe(self._deliver, loop, frame)
+                except RuntimeError:
+                    # Loop already closed; its subscriptions are gone too
+                    del self._loops[loop]
+
+    def _deliver(self, loop: asyncio.AbstractEventLoop, frame: bytes) -> None:
+        """Offer a frame to every subscription of a loop (runs on that loop)."""
+        with self._lock:
+            subscriptions = list(self._loops.get(loop, ()))
+        overflowed = sum(
+            not subscription.offer(frame) for subscription in subscriptions
+        )
+        if overflowed:
+            with self._lock:
+                self.resyncs += overflowed
+
+    async def _beat(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Queue a heartbeat for idle subscriptions of a loop until none are left."""
+        try:
+            while True:
+                await asyncio.sleep(self.heartbeat)
+                with self._lock:
+                    subscriptions = list(self._loops.get(loop, ()))
+                    if not subscriptions:
+                        return
+                for subscription in subscriptions:
+                    if subscription.queue.empty():
+                        subscription.queue.put_nowait(HEARTBEAT_FRAME)
+        finally:
+            with self._lock:
+                self._heartbeats.pop(loop, None)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """
+        Subscribe and yield the events as an SSE body until the client leaves.
+
+        The subscription starts when the body is first iterated, so it is
+        always released when the stream ends or is cancelled. Heartbeat
+        comments are sent every heartbeat seconds while no events are queued.
+
+        Yields:
+            SSE frames, starting with the reconnection delay
+        """
+        subscription = self.subscribe()
+        try:
+            # Tells EventSource how long to wait before reconnecting, and
+            # sends the response headers right away
+            yield b"retry: %d\n\n" % self.retry_ms
+            while True:
+                frame = await subscription.queue.get()
+                if frame is _RESYNC:
+                    subscription.dropping = False
+                    frame = RESYNC_FRAME
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def statistics(self) -> Dict[str, object]:
+        """
+        Report subscribers, configuration and counters.
+
+        Returns:
+            Mapping matching the EventStats schema
+        """
+        subscribers = self.subscribers
+        with self._lock:
+            return {
+                "subscribers": subscribers,
+                "queue_size": self.queue_size,
+                "heartbeat": self.heartbeat,
+                "published": self.published,
+                "resyncs": self.resyncs,
+            }
+
+
+# Process-wide broker behind GET /api/events
+event_broker = EventBroker(
+    queue_size=settings.EVENTS_QUEUE_SIZE,
+    heartbeat=settings.EVENTS_HEARTBEAT_SECONDS,
+    retry_ms=settings.EVENTS_RETRY_MS,
+)
@@ -0,0 +1,103 @@
+"""NDJSON and CSV rendering of task exports."""
+
+import csv
+import enum
+import io
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.core.serialization import render_json
+from app.schemas.task import TaskResponse
+
+
+class ExportFormat(str, enum.Enum):
+    """Enum for task export formats."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# Content type of each export format
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+# CSV header; the embedded category is flattened into its name and color
+CSV_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "category_id",
+    "category_name",
+    "category_color",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+
+
+def render_ndjson(tasks: List[Dict[str, Any]]) -> bytes:
+    """
+    Render task mappings as NDJSON: one TaskResponse JSON object per line.
+
+    Args:
+        tasks: Task mappings from TaskRepository.iter_batches
+
+    Returns:
+        UTF-8 bytes, each line terminated by a newline
+    """
+    return b"".join(
+        render_json(TaskResponse.model_validate(task)) + b"\n" for task in tasks
+    )
+
+
+def _csv_value(value: Any) -> Any:
+    """Format one value the way the JSON responses do."""
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def render_csv(tasks: List[Dict[str, Any]], header: bool = False) -> bytes:
+    """
+    Render task mappings as CSV rows in CSV_COLUMNS order.
+
+    Missing values are empty cells; enums and datetimes are written as in
+    the JSON responses.
+
+    Args:
+        tasks: Task mappings from TaskRepository.iter_batches
+        header: Whether to start with the header row
+
+    Returns:
+        UTF-8 bytes with CRLF line endings (RFC 4180)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for task in tasks:
+        category = task["category"] or {}
+        writer.writerow(
+            [
+                _csv_value(task["id"]),
+                task["title"],
+                _csv_value(task["description"]),
+                _csv_value(task["status"]),
+                _csv_value(task["priority"]),
+                _csv_value(task["category_id"]),
+                _csv_value(category.get("name")),
+                _csv_value(category.get("color")),
+                _csv_value(task["due_date"]),
+                _csv_value(task["created_at"]),
+                _csv_value(task["updated_at"]),
+            ]
+        )
+    return buffer.getvalue().encode()
@@ -0,0 +1,68 @@
+"""Sparse fieldset (?fields=) helpers."""
+
+from typing import Any, Dict, FrozenSet, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from app.core.exceptions import ValidationException
+
+# Fields returned whatever a client asks for
+ALWAYS_INCLUDED = frozenset({"id"})
+
+
+def parse_fields(
+    fields: Optional[str], allowed: Sequence[str]
+) -> Optional[FrozenSet[str]]:
+    """
+    Parse a comma-separated list of response field names.
+
+    Names are trimmed, empty entries and duplicates are ignored, and "id"
+    is always added so clients can address what they receive.
+
+    Args:
+        fields: Query parameter value, e.g. "title,status"
+        allowed: Field names of the response model
+
+    Returns:
+        Set of field names, or None (every field) if fields is None
+
+    Raises:
+        ValidationException: If the list is empty or names an unknown field
+    """
+    if fields is None:
+        return None
+    names = frozenset(name.strip() for name in fields.split(",")) - {""}
+    unknown = names.difference(allowed)
+    if not names or unknown:
+        raise ValidationException(
+            message="Invalid fields parameter",
+            details={"unknown": sorted(unknown), "allowed": list(allowed)},
+        )
+    return names | ALWAYS_INCLUDED
+
+
+def include_fields(
+    fields: Optional[FrozenSet[str]],
+    model: Type[BaseModel],
+    collection: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a pydantic include specification for a sparse fieldset.
+
+    Args:
+        fields: Field names to keep, or None to keep everything
+        model: Response model being serialized
+        collection: For list responses, the field holding the items; the
+            model's other fields (totals, cursors) are kept in full
+
+    Returns:
+        Include mapping for model serialization, or None for no filtering
+    """
+    if fields is None:
+        return None
+    selected = {name: True for name in fields}
+    if collection is None:
+        return selected
+    include: Dict[str, Any] = {name: True for name in model.model_fields}
+    include[collection] = {"__all__": selected}
+    return include
@@ -0,0 +1,145 @@
+"""Incremental NDJSON and CSV parsing of task imports."""
+
+import csv
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional
+
+from pydantic import ValidationError
+
+# Fields a CSV import reads; other columns (e.g. id or created_at from an
+# export) are ignored
+CSV_IMPORT_COLUMNS = frozenset(
+    {
+        "title",
+        "description",
+        "status",
+        "priority",
+        "category_id",
+        "category_name",
+        "due_date",
+    }
+)
+
+
+class ImportLine(NamedTuple):
+    """One record of an import file, or why it could not be read."""
+
+    line: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def _decode(raw: bytes, line: int) -> str:
+    """Decode one line of UTF-8 input, dropping a leading byte order mark."""
+    text = raw.decode("utf-8")
+    if line == 1:
+        text = text.lstrip("\ufeff")
+    return text
+
+
+def read_ndjson(file: BinaryIO) -> Iterator[ImportLine]:
+    """
+    Read an NDJSON file one line at a time.
+
+    Blank lines are skipped; a line that is not UTF-8 or not a JSON object
+    becomes an error entry and reading continues with the next one.
+
+    Args:
+        file: Binary file positioned at the start
+
+    Yields:
+        ImportLine per non-blank line, numbered from 1
+    """
+    for line, raw in enumerate(file, start=1):
+        try:
+            text = _decode(raw, line)
+            if not text.strip():
+                continue
+            data = json.loads(text)
+        except UnicodeDecodeError:
+            yield ImportLine(line, error="Line is not valid UTF-8")
+            continue
+        except json.JSONDecodeError as exc:
+            yield ImportLine(line, error=f"Invalid JSON: {exc.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportLine(line, error="Expected a JSON object")
+            continue
+        yield ImportLine(line, data)
+
+
+def read_csv(file: BinaryIO) -> Iterator[ImportLine]:
+    """
+    Read a CSV file with a header row one record at a time.
+
+    Columns outside CSV_IMPORT_COLUMNS are ignored and empty cells are
+    treated as missing values. Records are numbered by the file line they
+    end on (quoted values may span lines).
+
+    Args:
+        file: Binary file positioned at the start
+
+    Returns:
+        Iterator of ImportLine, one per data record
+
+    Raises:
+        ValueError: If the header is not UTF-8 or has no title column (raised
+            immediately, before any record is read)
+    """
+    lines = (_decode(raw, line) for line, raw in enumerate(file, start=1))
+    reader = csv.reader(lines)
+    try:
+        header = next(reader, None)
+    except UnicodeDecodeError:
+        raise ValueError("CSV header is not valid UTF-8") from None
+    if header is None or "title" not in header:
+        raise ValueError("CSV header must include a 'title' column")
+    return _csv_records(reader, header)
+
+
+def _csv_records(reader: Any, header: List[str]) -> Iterator[ImportLine]:
+    """Yield the data records of a CSV reader positioned after the header."""
+    columns = [
+        (index, name) for index, name in enumerate(header) if name in CSV_IMPORT_COLUMNS
+    ]
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except UnicodeDecodeError:
+            # The reader cannot resume after a bad line; stop with an error
+            yield ImportLine(reader.line_num + 1, error="Line is not valid UTF-8")
+            return
+        except csv.Error as exc:
+            yield ImportLine(reader.line_num, error=f"Invalid CSV: {exc}")
+            return
+        if not record:
+            continue
+        if len(record) != len(header):
+            yield ImportLine(
+                reader.line_num,
+                error=f"Expected {len(header)} columns, got {len(record)}",
+            )
+            continue
+        yield ImportLine(
+            reader.line_num,
+            {name: record[index] for index, name in columns if record[index] != ""},
+        )
+
+
+def describe_validation_error(exc: ValidationError) -> str:
+    """
+    Summarize a pydantic validation error in one line.
+
+    Args:
+        exc: Validation error raised for one record
+
+    Returns:
+        "field: message" parts separated by semicolons
+    """
+    parts: List[str] = []
+    for error in exc.errors():
+        location = ".".join(str(part) for part in error["loc"])
+        parts.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return "; ".join(parts)
@@ -0,0 +1,144 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from app.core.exceptions import ValidationException
+
+# Default and maximum number of items returned per page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def _encode(key: Any, item_id: int) -> str:
+    """Encode a JSON-serializable (key, id) pair as a URL-safe string."""
+    payload = json.dumps([key, item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> Tuple[Any, int]:
+    """Decode a string produced by _encode, raising ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, item_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError) as exc:
+        raise ValueError("malformed cursor") from exc
+    if not isinstance(item_id, int):
+        raise ValueError("cursor id must be an integer")
+    return key, item_id
+
+
+def _invalid_cursor(cursor: str) -> ValidationException:
+    """Build the error raised for cursors that cannot be decoded."""
+    return ValidationException(
+        message="Invalid pagination cursor", details={"cursor": cursor}
+    )
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """
+    Encode a keyset position into an opaque cursor string.
+
+    Args:
+        created_at: Creation timestamp of the last item on the page
+        item_id: ID of the last item on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode(created_at.isoformat(), item_id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode an opaque cursor string back into a keyset position.
+
+    Args:
+        cursor: Cursor string previously returned by encode_cursor
+
+    Returns:
+        Tuple of (created_at, item_id)
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        created_at, item_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), item_id
+    except (TypeError, ValueError) as exc:
+        raise _invalid_cursor(cursor) from exc
+
+
+def encode_rank_cursor(rank: float, item_id: int) -> str:
+    """
+    Encode a position in relevance-ranked results into a cursor string.
+
+    Args:
+        rank: Search rank of the last item on the page
+        item_id: ID of the last item on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode(rank, item_id)
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor string produced by encode_rank_cursor.
+
+    Args:
+        cursor: Cursor string previously returned by encode_rank_cursor
+
+    Returns:
+        Tuple of (rank, item_id)
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        rank, item_id = _decode(cursor)
+    except ValueError as exc:
+        raise _invalid_cursor(cursor) from exc
+    if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+        raise _invalid_cursor(cursor)
+    return float(rank), item_id
+
+
+def encode_change_cursor(change_seq: int, item_id: int) -> str:
+    """
+    Encode a change feed position into a cursor string.
+
+    Args:
+        change_seq: Change sequence of the last change returned
+        item_id: ID of the task that change applies to
+
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode(change_seq, item_id)
+
+
+def decode_change_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Decode a cursor string produced by encode_change_cursor.
+
+    Args:
+        cursor: Cursor string previously returned by encode_change_cursor
+
+    Returns:
+        Tuple of (change_seq, item_id)
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        change_seq, item_id = _decode(cursor)
+    except ValueError as exc:
+        raise _invalid_cursor(cursor) from exc
+    if isinstance(change_seq, bool) or not isinstance(change_seq, int):
+        raise _invalid_cursor(cursor)
+    return change_seq, item_id
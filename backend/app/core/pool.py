@@ -0,0 +1,212 @@
+"""Connection pool configuration and monitoring."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    Pool,
+    QueuePool,
+    SingletonThreadPool,
+    StaticPool,
+)
+
+from app.core.config import settings
+
+# Number of recent checkout waits kept for percentile calculations
+WAIT_SAMPLE_SIZE = 1000
+
+# Pool defaults per kind of database, used when a setting is left unset
+SQLITE_FILE_DEFAULTS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": -1,
+    "pool_pre_ping": False,
+}
+SERVER_DEFAULTS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
+
+
+class PoolMonitor:
+    """
+    Thread-safe record of connection checkouts from a pool.
+
+    Attributes:
+        checkouts: Number of successful checkouts
+        timeouts: Number of checkouts that gave up after pool_timeout
+        max_wait: Longest checkout wait in seconds
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self._total_wait = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        """
+        Record one checkout attempt.
+
+        Args:
+            wait: Seconds spent waiting for a connection
+            timed_out: Whether the attempt ended in a pool timeout
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self._total_wait += wait
+            self._waits.append(wait)
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Return wait statistics in milliseconds.
+
+        Returns:
+            Dict with checkouts, timeouts and average/p50/p99/max wait
+        """
+        with self._lock:
+            waits = sorted(self._waits)
+            checkouts, timeouts = self.checkouts, self.timeouts
+            total, maximum = self._total_wait, self.max_wait
+
+        def percentile(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(len(waits) * fraction))] * 1000
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms_avg": (total / checkouts * 1000) if checkouts else 0.0,
+            "wait_ms_p50": percentile(0.50),
+            "wait_ms_p99": percentile(0.99),
+            "wait_ms_max": maximum * 1000,
+        }
+
+
+class MonitoredQueuePoolMixin:
+    """
+    Time every connection checkout of a QueuePool.
+
+    Overrides Pool._do_get, the single place where QueuePool blocks waiting
+    for a free connection, so waits and timeouts are measured exactly. The
+    wait includes opening a new connection when the pool is not yet full.
+    """
+
+    monitor: PoolMonitor
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.monitor = PoolMonitor()
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.monitor.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.monitor.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> Pool:
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(MonitoredQueuePoolMixin, QueuePool):
+    """QueuePool that records checkout waits."""
+
+
+class MonitoredAsyncAdaptedQueuePool(MonitoredQueuePoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waits."""
+
+
+def pool_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Build create_engine pool arguments from settings and dialect defaults.
+
+    File-based SQLite and server databases default to a monitored QueuePool;
+    in-memory SQLite defaults to a StaticPool so every thread shares the one
+    database. Unset DB_POOL_* settings fall back to per-dialect defaults.
+
+    Args:
+        url: Database URL the engine will connect to
+        is_async: Whether the options are for an AsyncEngine
+
+    Returns:
+        Keyword arguments for create_engine/create_async_engine
+    """
+    parsed = make_url(url)
+    is_sqlite = parsed.get_backend_name() == "sqlite"
+    in_memory = is_sqlite and parsed.database in (None, "", ":memory:")
+    defaults = SQLITE_FILE_DEFAULTS if is_sqlite else SERVER_DEFAULTS
+
+    kind = settings.DB_POOL_CLASS or ("static" if in_memory else "queue")
+    pre_ping = settings.DB_POOL_PRE_PING
+    recycle = settings.DB_POOL_RECYCLE
+    options: Dict[str, Any] = {
+        "pool_pre_ping": defaults["pool_pre_ping"] if pre_ping is None else pre_ping,
+        "pool_recycle": defaults["pool_recycle"] if recycle is None else recycle,
+    }
+
+    if kind == "queue":
+        size, overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+        options.update(
+            poolclass=MonitoredAsyncAdaptedQueuePool if is_async else MonitoredQueuePool,
+            pool_size=defaults["pool_size"] if size is None else size,
+            max_overflow=defaults["max_overflow"] if overflow is None else overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    elif kind == "singleton":
+        if is_async:
+            raise ValueError("SingletonThreadPool cannot be used with an AsyncEngine")
+        options["poolclass"] = SingletonThreadPool
+        if settings.DB_POOL_SIZE is not None:
+            options["pool_size"] = settings.DB_POOL_SIZE
+    else:
+        options["poolclass"] = {"static": StaticPool, "null": NullPool}[kind]
+    return options
+
+
+def pool_statistics(engine: Engine) -> Dict[str, Any]:
+    """
+    Describe the current state of an engine's connection pool.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+
+    Returns:
+        Dict with pool class, occupancy and, for monitored pools, wait times
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # overflow() counts down from -size while the pool is filling
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    monitor: Optional[PoolMonitor] = getattr(pool, "monitor", None)
+    if monitor is not None:
+        stats.update(monitor.snapshot())
+    return stats
@@ -0,0 +1,233 @@
+"""In-process cache of serialized API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from app.core.compression import Encoded, encode
+from app.core.config import settings
+
+
+class _Entry:
+    """Cached body with its compressed variants, keyed by content coding."""
+
+    __slots__ = ("variants", "stored_at", "size")
+
+    def __init__(self, body: bytes, stored_at: float) -> None:
+        self.variants: Dict[Optional[str], bytes] = {None: body}
+        self.stored_at = stored_at
+        self.size = len(body)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of response bodies, bounded by their total size.
+
+    Entries belong to a generation, an opaque token that changes whenever
+    the data behind the responses changes (here the ETag built from the
+    table versions). A lookup with a new generation drops every entry of
+    the previous one, so a stale body is never served, and a body computed
+    for an old generation is never stored.
+
+    Compressed variants of a body (see app.core.compression) are kept in
+    the same entry and count towards max_bytes, so a hit for a client that
+    accepts gzip or brotli costs no compression at all.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found no usable entry
+        compressions: Compressed variants produced for cached bodies
+        evictions: Entries dropped to stay within max_bytes or past their TTL
+        invalidations: Generation changes that emptied the cache
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached bodies
+            ttl: Seconds an entry stays valid, as a safety net for writes
+                that do not change the generation
+            enabled: Whether lookups and stores are performed at all
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._generation: Optional[Hashable] = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.compressions = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _use_generation(self, generation: Hashable) -> None:
+        """Switch to a generation, dropping the entries of the previous one."""
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.bytes = 0
+            self._generation = generation
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove one entry and account for its size."""
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        self.evictions += 1
+
+    def _make_room(self, size: int, keep: Optional[Hashable] = None) -> None:
+        """Evict least recently used entries (except keep) until size bytes fit."""
+        for key in list(self._entries):
+            if self.bytes + size <= self.max_bytes:
+                return
+            if key != keep:
+                self._drop(key)
+
+    def get(
+        self, generation: Hashable, key: Hashable, encoding: Optional[str] = None
+    ) -> Optional[Encoded]:
+        """
+        Look up a cached body, in the client's content coding if possible.
+
+        A compressed variant missing from a cached entry is produced outside
+        the lock and added to the entry, so each body is compressed at most
+        once per coding.
+
+        Args:
+            generation: Current data generation
+            key: Normalized request parameters
+            encoding: Negotiated content coding, or None for the plain body
+
+        Returns:
+            Cached body, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._use_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry.stored_at >= self.ttl:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            variant = entry.variants.get(encoding)
+            body = entry.variants[None]
+        if variant is not None:
+            return Encoded(variant, encoding)
+        encoded = encode(body, encoding)
+        if encoded.encoding is not None:
+            self._add_variant(generation, key, entry, encoded)
+        return encoded
+
+    def put(
+        self,
+        generation: Hashable,
+        key: Hashable,
+        body: bytes,
+        encoding: Optional[str] = None,
+    ) -> Encoded:
+        """
+        Store a body, evicting least recently used entries to make room.
+
+        Bodies larger than max_bytes, or computed for a generation that is
+        no longer current, are not stored.
+
+        Args:
+            generation: Generation the body was computed for
+            key: Normalized request parameters
+            body: Serialized response body
+            encoding: Negotiated content coding; that variant is stored too
+
+        Returns:
+            The body in the negotiated coding, whether it was stored or not
+        """
+        encoded = encode(body, encoding)
+        if not self.enabled or len(body) > self.max_bytes:
+            return encoded
+        with self._lock:
+            if generation != self._generation:
+                return encoded
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key).size
+            self._make_room(len(body))
+            entry = _Entry(body, self._clock())
+            self._entries[key] = entry
+            self.bytes += entry.size
+        if encoded.encoding is not None:
+            self._add_variant(generation, key, entry, encoded)
+        return encoded
+
+    def _add_variant(
+        self, generation: Hashable, key: Hashable, entry: _Entry, encoded: Encoded
+    ) -> None:
+        """Attach a compressed variant to an entry if it is still cached."""
+        size = len(encoded.body)
+        with self._lock:
+            self.compressions += 1
+            if (
+                generation != self._generation
+                or self._entries.get(key) is not entry
+                or encoded.encoding in entry.variants
+                or entry.size + size > self.max_bytes
+            ):
+                return
+            self._make_room(size, keep=key)
+            entry.variants[encoded.encoding] = encoded.body
+            entry.size += size
+            self.bytes += size
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self.bytes = self.hits = self.misses = self.compressions = 0
+            self.evictions = self.invalidations = 0
+
+    def statistics(self) -> Dict[str, object]:
+        """
+        Report cache size, configuration and counters.
+
+        Returns:
+            Dictionary suitable for the admin cache statistics endpoint
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "compressions": self.compressions,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Process-wide cache of GET /api/tasks response bodies
+task_list_cache = ResponseCache(
+    max_bytes=settings.TASK_LIST_CACHE_MAX_BYTES,
+    ttl=settings.TASK_LIST_CACHE_TTL,
+    enabled=settings.TASK_LIST_CACHE_ENABLED,
+)
@@ -0,0 +1,34 @@
+"""Full-text search query helpers."""
+
+import re
+
+from app.core.exceptions import ValidationException
+
+# Words as the FTS5 unicode61 tokenizer sees them
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def build_search_query(text: str) -> str:
+    """
+    Turn free text typed by a user into a safe FTS5 MATCH expression.
+
+    Every word must match (implicit AND). Words are quoted so operators
+    and punctuation in the input (AND, NOT, quotes, '-', '*') are searched
+    for literally instead of being parsed as FTS5 query syntax.
+
+    Args:
+        text: Search text from the request
+
+    Returns:
+        FTS5 query string
+
+    Raises:
+        ValidationException: If the text contains no searchable words
+    """
+    words = WORD.findall(text)
+    if not words:
+        raise ValidationException(
+            message="Search query must contain at least one word",
+            details={"q": text},
+        )
+    return " ".join(f'"{word}"' for word in words)
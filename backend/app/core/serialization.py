@@ -0,0 +1,79 @@
+"""Single-pass JSON serialization of response models."""
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_type: Type[BaseModel]) -> TypeAdapter:
+    """Return the (cached) TypeAdapter of a response model class."""
+    return TypeAdapter(model_type)
+
+
+def render_json(model: BaseModel, include: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Serialize a response model to JSON bytes in one pass.
+
+    The bytes are identical to what FastAPI sends for the same model through
+    response_model (compact separators, non-ASCII characters unescaped), but
+    the model is not validated again and no intermediate dict is built.
+
+    Args:
+        model: Response model instance
+        include: Pydantic include specification restricting the output to
+            some fields (see app.core.fieldsets)
+
+    Returns:
+        JSON body bytes
+    """
+    return _adapter(type(model)).dump_json(model, include=include)
+
+
+class ModelJSONResponse(Response):
+    """
+    JSON response rendered straight from a response model.
+
+    Endpoints return it instead of the model itself: FastAPI passes Response
+    instances through untouched, so the model validated by the service is
+    not validated and encoded a second time. The route's response_model
+    still documents the body in the OpenAPI schema.
+
+    Content may also be bytes already produced by render_json, e.g. taken
+    from a response cache.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        include: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the response.
+
+        Args:
+            content: Response model instance, or serialized JSON bytes
+            status_code: HTTP status code
+            headers: Extra headers, e.g. the validators set on the injected
+                Response by a dependency, which FastAPI does not copy onto
+                returned Response instances
+            include: Fields of the model to render (all if None)
+        """
+        self.include = include
+        super().__init__(
+            content=content,
+            status_code=status_code,
+            headers=dict(headers) if headers is not None else None,
+        )
+
+    def render(self, content: Any) -> bytes:
+        """Serialize a model; pass already serialized bytes through."""
+        if isinstance(content, BaseModel):
+            return render_json(content, include=self.include)
+        return super().render(content)
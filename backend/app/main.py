@@ -1,17 +1,33 @@
 """Main FastAPI application module."""
 
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import async_engine, async_read_engine, init_db
 from app.core.exceptions import TaskFlowException
 from app.api import api_router
 
 
+def configure_logging() -> None:
+    """Send application log records (the "app" logger tree) to stderr at LOG_LEVEL."""
+    logger = logging.getLogger("app")
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+
+configure_logging()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -21,7 +37,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup: Initialize database
     init_db()
     yield
-    # Shutdown: Add cleanup logic here if needed
+    # Shutdown: Release async database connections
+    for db_engine in (async_engine, async_read_engine):
+        if db_engine is not None:
+            await db_engine.dispose()
 
 
 # Create FastAPI application
@@ -66,6 +85,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses for clients that accept gzip or brotli
+app.add_middleware(CompressionMiddleware)
+
 
 # Global exception handler for custom exceptions
 @app.exception_handler(TaskFlowException)
@@ -2,5 +2,16 @@
 
 from app.models.task import Task
 from app.models.category import Category
+from app.models.task_counter import TaskCounter
+from app.models.table_version import TableVersion
+from app.models.task_tombstone import TaskTombstone
+from app.models.task_search import tasks_fts
 
-__all__ = ["Task", "Category"]
+__all__ = [
+    "Task",
+    "Category",
+    "TaskCounter",
+    "TableVersion",
+    "TaskTombstone",
+    "tasks_fts",
+]
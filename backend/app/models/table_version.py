@@ -0,0 +1,29 @@
+"""Table version database model."""
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.core.database import Base
+
+
+class TableVersion(Base):
+    """
+    Change counter for one table.
+
+    Bumped by the repositories in the same transaction as every write to
+    the table, so reading one row tells whether anything in the table
+    changed since a client last fetched it (HTTP ETag / Last-Modified).
+
+    Attributes:
+        name: Name of the versioned table
+        version: Number of committed write operations on the table
+        updated_at: Time of the last write operation
+    """
+
+    __tablename__ = "table_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TableVersion(name='{self.name}', version={self.version})>"
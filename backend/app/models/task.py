@@ -1,7 +1,17 @@
 """Task database model."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    text,
+)
 from sqlalchemy.orm import relationship
 import enum
 
@@ -24,6 +34,11 @@ class TaskPriority(str, enum.Enum):
     HIGH = "high"
 
 
+# Predicate of the partial due_date index. Queries must repeat it verbatim
+# (not as a bound parameter) for the planner to choose that index.
+OPEN_TASKS = text("status != 'COMPLETED'")
+
+
 class Task(Base):
     """
     Task model representing a user's task.
@@ -38,10 +53,36 @@ class Task(Base):
         due_date: Optional deadline for the task
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last updated
+        change_seq: tasks table version of the last write to the task
         category: Relationship to category object
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Every list query sorts by (created_at, id); id is the rowid and is
+        # implicitly the last key of each index, so these serve the filter
+        # and the keyset order without a temp sort.
+        Index("ix_tasks_created_at", "created_at"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        Index("ix_tasks_priority_created_at", "priority", "created_at"),
+        Index("ix_tasks_category_id_created_at", "category_id", "created_at"),
+        Index(
+            "ix_tasks_category_id_status_created_at",
+            "category_id",
+            "status",
+            "created_at",
+        ),
+        # Deadlines only matter for open tasks; completed history stays out
+        Index(
+            "ix_tasks_open_due_date",
+            "due_date",
+            sqlite_where=OPEN_TASKS,
+            postgresql_where=OPEN_TASKS,
+        ),
+        # The change feed seeks by (change_seq, id), so it reads only the
+        # tasks written since a client's cursor
+        Index("ix_tasks_change_seq", "change_seq"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
@@ -50,15 +91,13 @@ class Task(Base):
         Enum(TaskStatus),
         nullable=False,
         default=TaskStatus.TODO,
-        index=True,
     )
     priority = Column(
         Enum(TaskPriority),
         nullable=False,
         default=TaskPriority.MEDIUM,
-        index=True,
     )
-    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     due_date = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(
@@ -67,6 +106,7 @@ class Task(Base):
         default=datetime.utcnow,
         onupdate=datetime.utcnow,
     )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationship to category
     category = relationship("Category", back_populates="tasks")
@@ -0,0 +1,49 @@
+"""Task counter database model."""
+
+from sqlalchemy import Column, Enum, Index, Integer
+
+from app.core.database import Base
+from app.models.task import TaskPriority, TaskStatus
+
+# category_id value used for tasks that have no category
+UNCATEGORIZED = 0
+
+
+class TaskCounter(Base):
+    """
+    Materialized task count for one (status, priority, category) bucket.
+
+    Maintained by TaskRepository in the same transaction as every task
+    write, so statistics are read from a handful of rows instead of
+    scanning the tasks table.
+
+    Attributes:
+        status: Task status of the bucket
+        priority: Task priority of the bucket
+        category_id: Category of the bucket (0 for uncategorized tasks)
+        count: Number of tasks in the bucket
+    """
+
+    __tablename__ = "task_counters"
+    __table_args__ = (
+        # The primary key leads with status; per-category reads (category
+        # lists with counts, stats for one category) need category_id
+        # first. Including status and count lets them skip the table.
+        Index(
+            "ix_task_counters_category_id_status_count",
+            "category_id",
+            "status",
+            "count",
+        ),
+    )
+
+    status = Column(Enum(TaskStatus), primary_key=True)
+    priority = Column(Enum(TaskPriority), primary_key=True)
+    category_id = Column(Integer, primary_key=True, default=UNCATEGORIZED)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskCounter(status='{self.status}', priority='{self.priority}', "
+            f"category_id={self.category_id}, count={self.count})>"
+        )
@@ -0,0 +1,78 @@
+"""Full-text search index over task titles and descriptions (SQLite FTS5)."""
+
+from sqlalchemy import DDL, Float, Integer, column, event, table
+
+from app.models.task import Task
+
+# External-content FTS5 table: it stores only the index and reads the text
+# back from tasks, keyed by rowid = tasks.id. The Porter stemmer lets
+# "deploying" match "deploy". Triggers keep it in step with every write path,
+# including the Core bulk INSERT/UPDATE/DELETE statements.
+FTS_CREATE_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+# Lightweight handle for querying the index. It is deliberately not part of
+# Base.metadata: the virtual table is created by the DDL above.
+tasks_fts = table(
+    "tasks_fts",
+    column("rowid", Integer),
+    # bm25() score of the row for the current MATCH; lower is more relevant
+    column("rank", Float),
+    # Hidden column named after the table, the left operand of MATCH
+    column("tasks_fts"),
+)
+
+
+def is_search_index_table(name: str) -> bool:
+    """
+    Tell whether a table belongs to the full-text index.
+
+    The FTS5 table and its shadow tables (tasks_fts_data, ...) are managed
+    by DDL rather than metadata, so schema comparisons must skip them.
+
+    Args:
+        name: Table name
+
+    Returns:
+        True for tasks_fts and its shadow tables
+    """
+    return name == "tasks_fts" or name.startswith("tasks_fts_")
+
+
+for statement in FTS_CREATE_STATEMENTS:
+    event.listen(
+        Task.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Task.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+)
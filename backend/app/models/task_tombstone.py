@@ -0,0 +1,32 @@
+"""Task tombstone database model."""
+
+from sqlalchemy import Column, DateTime, Index, Integer
+
+from app.core.database import Base
+
+
+class TaskTombstone(Base):
+    """
+    Record of a deleted task for the change feed.
+
+    Written by TaskRepository in the same transaction as the delete, so
+    clients syncing from a cursor learn which tasks to drop. A task deleted
+    again after its id was reused only moves its tombstone forward.
+
+    Attributes:
+        task_id: ID of the deleted task
+        change_seq: tasks table version of the delete
+        deleted_at: Timestamp when the task was deleted
+    """
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (Index("ix_task_tombstones_change_seq", "change_seq"),)
+
+    task_id = Column(Integer, primary_key=True, autoincrement=False)
+    change_seq = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskTombstone(task_id={self.task_id}, change_seq={self.change_seq})>"
+        )
@@ -1,11 +1,19 @@
 """Repository for category data access operations."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
+from app.core.category_cache import CachedCategory, category_cache
 from app.models.category import Category
+from app.models.task import TaskStatus
+from app.models.task_counter import TaskCounter
+from app.repositories.table_version_repository import TableVersionRepository
 from app.schemas.category import CategoryCreate
 
+# Columns of a CachedCategory, in field order
+CATEGORY_COLUMNS = (Category.id, Category.name, Category.color)
+
 
 class CategoryRepository:
     """
@@ -21,15 +29,53 @@ class CategoryRepository:
             db: SQLAlchemy database session
         """
         self.db = db
+        self.versions = TableVersionRepository(db)
+
+    def get_all_rows(self) -> List[CachedCategory]:
+        """
+        Retrieve all categories as plain rows, for read-only listing.
+
+        Only the columns are selected, so no ORM objects or identity map
+        entries are created.
+
+        Returns:
+            List of CachedCategory rows ordered by name
+        """
+        query = select(*CATEGORY_COLUMNS).order_by(Category.name)
+        return [CachedCategory(*row) for row in self.db.execute(query)]
 
-    def get_all(self) -> List[Category]:
+    def get_all_with_counts(
+        self,
+    ) -> List[Tuple[CachedCategory, Dict[TaskStatus, int]]]:
         """
-        Retrieve all categories from the database.
+        Retrieve all categories together with their task counts per status.
+
+        Counts are summed from the materialized task_counters table in a
+        single GROUP BY joined to categories, so the cost depends on the
+        number of categories rather than on the number of tasks, and no
+        per-category query is issued. Categories are read as plain rows.
 
         Returns:
-            List of all Category objects
+            List of (CachedCategory, {status: count}) tuples ordered by name
         """
-        return self.db.query(Category).order_by(Category.name).all()
+        status_counts = [
+            func.coalesce(
+                func.sum(case((TaskCounter.status == status, TaskCounter.count), else_=0)),
+                0,
+            )
+            for status in TaskStatus
+        ]
+        query = (
+            select(*CATEGORY_COLUMNS, *status_counts)
+            .outerjoin(TaskCounter, TaskCounter.category_id == Category.id)
+            .group_by(Category.id)
+            .order_by(Category.name)
+        )
+        size = len(CATEGORY_COLUMNS)
+        return [
+            (CachedCategory(*row[:size]), dict(zip(TaskStatus, row[size:])))
+            for row in self.db.execute(query)
+        ]
 
     def get_by_id(self, category_id: int) -> Optional[Category]:
         """
@@ -43,6 +89,88 @@ class CategoryRepository:
         """
         return self.db.query(Category).filter(Category.id == category_id).first()
 
+    def get_by_ids(self, category_ids: Iterable[int]) -> List[Category]:
+        """
+        Retrieve several categories with a single IN query.
+
+        Args:
+            category_ids: Category IDs to look up
+
+        Returns:
+            List of the Category objects that exist
+        """
+        category_ids = set(category_ids)
+        if not category_ids:
+            return []
+        return self.db.query(Category).filter(Category.id.in_(category_ids)).all()
+
+    def _load_cached(self, limit: int) -> List[CachedCategory]:
+        """Read up to limit categories as cache entries, in ID order."""
+        query = (
+            select(*CATEGORY_COLUMNS)
+            .order_by(Category.id)
+            .limit(limit)
+        )
+        return [CachedCategory(*row) for row in self.db.execute(query)]
+
+    @staticmethod
+    def _to_cached(category: Optional[Category]) -> Optional[CachedCategory]:
+        """Copy a Category into a cache entry."""
+        if category is None:
+            return None
+        return CachedCategory(category.id, category.name, category.color)
+
+    def lookup(self, category_id: int) -> Optional[CachedCategory]:
+        """
+        Look up a category by ID through the process-wide category cache.
+
+        Use this instead of get_by_id when only the category's fields are
+        needed, e.g. to check that it exists.
+
+        Args:
+            category_id: The category ID to search for
+
+        Returns:
+            CachedCategory if found, None otherwise
+        """
+        return category_cache.get_by_id(
+            category_id,
+            self._load_cached,
+            lambda: self._to_cached(self.get_by_id(category_id)),
+        )
+
+    def lookup_by_name(self, name: str) -> Optional[CachedCategory]:
+        """
+        Look up a category by name through the process-wide category cache.
+
+        Args:
+            name: The category name to search for
+
+        Returns:
+            CachedCategory if found, None otherwise
+        """
+        return category_cache.get_by_name(
+            name,
+            self._load_cached,
+            lambda: self._to_cached(self.get_by_name(name)),
+        )
+
+    def lookup_many(self, category_ids: Iterable[int]) -> Dict[int, CachedCategory]:
+        """
+        Look up several categories through the cache, with one query for misses.
+
+        Args:
+            category_ids: Category IDs to look up
+
+        Returns:
+            Mapping of ID to CachedCategory for the categories that exist
+        """
+        return category_cache.get_many_by_id(
+            category_ids,
+            self._load_cached,
+            lambda ids: [self._to_cached(c) for c in self.get_by_ids(ids)],
+        )
+
     def get_by_name(self, name: str) -> Optional[Category]:
         """
         Retrieve a category by its name.
@@ -67,7 +195,9 @@ class CategoryRepository:
         """
         db_category = Category(**category_data.model_dump())
         self.db.add(db_category)
+        self.versions.bump(Category.__tablename__)
         self.db.commit()
+        category_cache.invalidate()
         self.db.refresh(db_category)
         return db_category
 
@@ -79,7 +209,9 @@ class CategoryRepository:
             category: Category object to delete
         """
         self.db.delete(category)
+        self.versions.bump(Category.__tablename__)
         self.db.commit()
+        category_cache.invalidate()
 
     def count(self) -> int:
         """
@@ -0,0 +1,86 @@
+"""Repository for per-table change versions."""
+
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.table_version import TableVersion
+
+
+class Versions(NamedTuple):
+    """Current versions of a set of tables."""
+
+    # Version of each requested table; 0 for tables never written through
+    # the repositories
+    versions: Dict[str, int]
+    # Latest write time over the requested tables, if any was recorded
+    last_modified: Optional[datetime]
+
+
+class TableVersionRepository:
+    """
+    Repository class for the table_versions table.
+
+    bump never commits; it runs inside the caller's transaction so a
+    table's version changes exactly when its rows do.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def _insert(self):
+        """Return the dialect-specific INSERT construct supporting upserts."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(TableVersion)
+        return sqlite.insert(TableVersion)
+
+    def bump(self, name: str) -> int:
+        """
+        Record a write to a table.
+
+        The version row stays locked until the caller's transaction ends, so
+        writers to one table commit in version order.
+
+        Args:
+            name: Name of the table that was written
+
+        Returns:
+            The table's new version
+        """
+        now = datetime.utcnow()
+        stmt = self._insert().values(name=name, version=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TableVersion.name],
+            set_={"version": TableVersion.version + 1, "updated_at": now},
+        )
+        return self.db.execute(stmt.returning(TableVersion.version)).scalar_one()
+
+    def get(self, names: Iterable[str]) -> Versions:
+        """
+        Read the current versions of several tables with one query.
+
+        Args:
+            names: Table names
+
+        Returns:
+            Versions of the tables and their latest write time
+        """
+        versions = {name: 0 for name in names}
+        rows = self.db.execute(
+            select(TableVersion.name, TableVersion.version, TableVersion.updated_at)
+            .where(TableVersion.name.in_(versions))
+        ).all()
+        for name, version, _ in rows:
+            versions[name] = version
+        return Versions(
+            versions=versions,
+            last_modified=max((row.updated_at for row in rows), default=None),
+        )
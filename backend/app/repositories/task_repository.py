@@ -1,12 +1,170 @@
 """Repository for task data access operations."""
 
-from typing import List, Optional
+from collections import Counter
+from datetime import date, datetime
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from sqlalchemy import delete, exists, func, insert, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql import FromClause, Select
 from sqlalchemy.orm import Session, joinedload
 
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.core.pagination import DEFAULT_PAGE_SIZE
+from app.models.category import Category
+from app.models.task import OPEN_TASKS, Task, TaskStatus, TaskPriority
+from app.models.task_search import tasks_fts
+from app.repositories.table_version_repository import TableVersionRepository
+from app.repositories.task_tombstone_repository import (
+    TaskTombstoneRepository,
+    read_changes_after,
+)
+from app.repositories.task_stats_repository import TaskStatsRepository
 from app.schemas.task import TaskCreate, TaskUpdate
 
 
+# Rows per multi-row INSERT statement in bulk writes; keeps the number of
+# bound parameters well below SQLite's limit
+BULK_CHUNK_SIZE = 500
+
+# Rows fetched per round trip when streaming an export
+EXPORT_BATCH_SIZE = 1000
+
+
+# Columns read by the list query: every task column, then the embedded
+# category's, selected as plain values so no ORM objects are built.
+# change_seq is bookkeeping for the change feed, not a response field.
+TASK_COLUMNS = tuple(
+    column for column in Task.__table__.c if column is not Task.__table__.c.change_seq
+)
+EMBEDDED_CATEGORY_COLUMNS = (
+    Category.name.label("category_name"),
+    Category.color.label("category_color"),
+)
+
+# Columns read whatever fields are requested: the keyset position
+KEY_COLUMNS = frozenset({"id", "created_at"})
+
+
+class RowShape:
+    """
+    Columns a task read selects, and how its rows become response mappings.
+
+    Attributes:
+        columns: Task columns selected, in table order
+        with_category: Whether the category is joined and nested
+    """
+
+    def __init__(self, columns: Sequence[Any], with_category: bool) -> None:
+        """
+        Initialize a row shape.
+
+        Args:
+            columns: Task columns to select
+            with_category: Whether to join and nest the category
+        """
+        self.columns = tuple(columns)
+        self.with_category = with_category
+        self._keys = tuple(column.key for column in self.columns)
+
+    @classmethod
+    def for_fields(cls, fields: Optional[AbstractSet[str]] = None) -> "RowShape":
+        """
+        Choose the columns needed for a set of response fields.
+
+        Args:
+            fields: TaskResponse field names to return (all if None)
+
+        Returns:
+            RowShape selecting the requested task columns plus the keyset
+            columns, joining the category only if "category" is requested
+        """
+        if fields is None:
+            return FULL_ROW
+        with_category = "category" in fields
+        names = KEY_COLUMNS | fields
+        if with_category:
+            names |= {"category_id"}
+        return cls(
+            [column for column in TASK_COLUMNS if column.key in names], with_category
+        )
+
+    def select(self, *extra: Any, source: Optional[FromClause] = None) -> Select:
+        """
+        Build a SELECT of the shape's columns followed by extra columns.
+
+        Args:
+            extra: Additional columns, e.g. window or scalar subqueries
+            source: FROM clause to start from (the tasks table if None)
+
+        Returns:
+            SELECT statement; the category is outer-joined if needed
+        """
+        columns = list(self.columns)
+        if source is None:
+            source = Task.__table__
+        if self.with_category:
+            columns.extend(EMBEDDED_CATEGORY_COLUMNS)
+            source = source.outerjoin(
+                Category.__table__, Category.id == Task.category_id
+            )
+        return select(*columns, *extra).select_from(source)
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        """
+        Build a task response mapping from a row of select().
+
+        Args:
+            row: Row starting with the shape's columns
+
+        Returns:
+            Task column values, with the category nested under "category"
+            when it is joined
+        """
+        task = dict(zip(self._keys, row))
+        if self.with_category:
+            size = len(self._keys)
+            name, color = row[size], row[size + 1]
+            task["category"] = (
+                {"id": task["category_id"], "name": name, "color": color}
+                if name is not None
+                else None
+            )
+        return task
+
+
+# Every column, with the category: the shape of a full TaskResponse
+FULL_ROW = RowShape(TASK_COLUMNS, with_category=True)
+
+
+class TaskPage(NamedTuple):
+    """A page of tasks together with the filtered total."""
+
+    # Column mappings with the category nested, ready for TaskResponse
+    tasks: List[Dict[str, Any]]
+    total: int
+    category_exists: bool
+    # bm25 rank of each task when the page comes from a search
+    ranks: Optional[List[float]] = None
+
+
+class TaskChanges(NamedTuple):
+    """Tasks written and deleted after a change feed position."""
+
+    # (change_seq, task mapping) pairs ordered by (change_seq, id)
+    tasks: List[Tuple[int, Dict[str, Any]]]
+    # (change_seq, task id) pairs ordered the same way
+    deleted: List[Tuple[int, int]]
+
+
 class TaskRepository:
     """
     Repository class for Task database operations.
@@ -21,34 +179,72 @@ class TaskRepository:
             db: SQLAlchemy database session
         """
         self.db = db
+        self.stats = TaskStatsRepository(db)
+        self.versions = TableVersionRepository(db)
+        self.tombstones = TaskTombstoneRepository(db)
 
-    def get_all(
-        self,
+    @staticmethod
+    def _filters(
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
         category_id: Optional[int] = None,
-    ) -> List[Task]:
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+    ) -> list:
         """
-        Retrieve tasks with optional filtering.
+        Build the WHERE criteria shared by the list and count queries.
 
         Args:
             status: Filter by task status
             priority: Filter by task priority
             category_id: Filter by category ID
+            due_before: Only open tasks due strictly before this time
+            due_after: Only open tasks due at or after this time
 
         Returns:
-            List of Task objects matching the filters
+            List of SQLAlchemy filter expressions
         """
-        query = self.db.query(Task).options(joinedload(Task.category))
-
+        criteria = []
         if status is not None:
-            query = query.filter(Task.status == status)
+            criteria.append(Task.status == status)
         if priority is not None:
-            query = query.filter(Task.priority == priority)
+            criteria.append(Task.priority == priority)
         if category_id is not None:
-            query = query.filter(Task.category_id == category_id)
+            criteria.append(Task.category_id == category_id)
+        if due_before is not None or due_after is not None:
+            # Deadlines only apply to open tasks; the literal predicate lets
+            # the partial due_date index serve the range
+            criteria.append(OPEN_TASKS)
+        if due_before is not None:
+            criteria.append(Task.due_date < due_before)
+        if due_after is not None:
+            criteria.append(Task.due_date >= due_after)
+        return criteria
+
+    @classmethod
+    def _selection(
+        cls,
+        ids: Optional[List[int]] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+    ) -> list:
+        """
+        Build the WHERE criteria selecting tasks for a set-based write.
+
+        Args:
+            ids: Select tasks with these IDs
+            status: Select tasks with this status
+            priority: Select tasks with this priority
+            category_id: Select tasks in this category
 
-        return query.order_by(Task.created_at.desc()).all()
+        Returns:
+            List of SQLAlchemy filter expressions
+        """
+        criteria = cls._filters(status, priority, category_id)
+        if ids is not None:
+            criteria.append(Task.id.in_(ids))
+        return criteria
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -67,6 +263,23 @@ class TaskRepository:
             .first()
         )
 
+    def get_row(
+        self, task_id: int, fields: Optional[AbstractSet[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read one task as a plain mapping, selecting only the needed columns.
+
+        Args:
+            task_id: The task ID to search for
+            fields: TaskResponse field names to return (all if None)
+
+        Returns:
+            Task mapping shaped like the list query's rows, or None if not found
+        """
+        shape = RowShape.for_fields(fields)
+        row = self.db.execute(shape.select().where(Task.id == task_id)).first()
+        return shape.to_dict(row) if row is not None else None
+
     def create(self, task_data: TaskCreate) -> Task:
         """
         Create a new task in the database.
@@ -77,14 +290,56 @@ class TaskRepository:
         Returns:
             Created Task object
         """
-        db_task = Task(**task_data.model_dump())
+        change_seq = self.versions.bump(Task.__tablename__)
+        db_task = Task(**task_data.model_dump(), change_seq=change_seq)
         self.db.add(db_task)
+        self.stats.record_created([self.stats.key_for(db_task)])
         self.db.commit()
         self.db.refresh(db_task)
         # Explicitly load category relationship
         self.db.refresh(db_task, ["category"])
         return db_task
 
+    def create_many(self, tasks_data: List[TaskCreate]) -> List[Dict[str, Any]]:
+        """
+        Create many tasks in a single transaction.
+
+        Rows are sent as multi-row INSERT ... RETURNING statements of
+        BULK_CHUNK_SIZE rows each, so no per-row round trips or refreshes
+        are needed.
+
+        Args:
+            tasks_data: Pydantic schemas with task data
+
+        Returns:
+            Column mappings of the created tasks, ordered by id
+        """
+        if not tasks_data:
+            return []
+
+        change_seq = self.versions.bump(Task.__tablename__)
+        rows = [
+            {**task_data.model_dump(), "change_seq": change_seq}
+            for task_data in tasks_data
+        ]
+        created = (
+            self.db.execute(
+                insert(Task.__table__).returning(*TASK_COLUMNS),
+                rows,
+                execution_options={"insertmanyvalues_page_size": BULK_CHUNK_SIZE},
+            )
+            .mappings()
+            .all()
+        )
+        # RETURNING order is unspecified; ids follow insertion order
+        created = sorted(created, key=lambda row: row["id"])
+
+        self.stats.record_created(
+            (row["status"], row["priority"], row["category_id"]) for row in created
+        )
+        self.db.commit()
+        return [dict(row) for row in created]
+
     def update(self, task: Task, task_data: TaskUpdate) -> Task:
         """
         Update an existing task with provided data.
@@ -96,16 +351,90 @@ class TaskRepository:
         Returns:
             Updated Task object
         """
+        # Bumped first: it takes the write lock, so the task re-read below
+        # cannot change before commit and its old counter bucket is exact; the
+        # bump's autoflush has nothing to write, and the new sequence goes out
+        # with the task's own UPDATE
+        change_seq = self.versions.bump(Task.__tablename__)
+        self.db.refresh(task)
+        old_key = self.stats.key_for(task)
+        task.change_seq = change_seq
         update_data = task_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(task, field, value)
 
+        self.stats.record_moved(old_key, self.stats.key_for(task))
         self.db.commit()
         self.db.refresh(task)
         # Explicitly load category relationship
         self.db.refresh(task, ["category"])
         return task
 
+    def update_many(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[List[int]] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+        returning: bool = False,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Apply the same values to every selected task with one UPDATE.
+
+        updated_at and change_seq are set for every affected row. When the
+        values move tasks between counter buckets, the affected buckets are
+        counted first, after the table version bump has taken the write lock,
+        so the statistics are adjusted from the rows the UPDATE changes.
+
+        Args:
+            values: Column values to set
+            ids: Select tasks with these IDs
+            status: Select tasks with this status
+            priority: Select tasks with this priority
+            category_id: Select tasks in this category
+            returning: Whether to return the updated rows
+
+        Returns:
+            Tuple of (number of updated tasks, updated rows if requested)
+        """
+        criteria = self._selection(ids, status, priority, category_id)
+        # Bumped first so the count below and the UPDATE share one write
+        # transaction: no other write can commit in between
+        change_seq = self.versions.bump(Task.__tablename__)
+
+        deltas: Counter = Counter()
+        if values.keys() & {"status", "priority", "category_id"}:
+            for old_key, count in self.stats.count_by_key(criteria).items():
+                new_key = (
+                    values.get("status", old_key[0]),
+                    values.get("priority", old_key[1]),
+                    values.get("category_id", old_key[2]),
+                )
+                deltas[old_key] -= count
+                deltas[new_key] += count
+
+        stmt = (
+            update(Task.__table__)
+            .where(*criteria)
+            .values(**values, updated_at=datetime.utcnow(), change_seq=change_seq)
+        )
+        if returning:
+            rows = self.db.execute(stmt.returning(*TASK_COLUMNS)).mappings().all()
+            rows = sorted((dict(row) for row in rows), key=lambda row: row["id"])
+            updated = len(rows)
+        else:
+            rows = []
+            updated = self.db.execute(stmt).rowcount
+
+        if not updated:
+            # Nothing matched: leave the table version alone
+            self.db.rollback()
+            return 0, []
+        self.stats.adjust(deltas)
+        self.db.commit()
+        return updated, rows
+
     def update_status(self, task: Task, status: TaskStatus) -> Task:
         """
         Update only the status of a task.
@@ -117,47 +446,309 @@ class TaskRepository:
         Returns:
             Updated Task object
         """
+        # Bumped first to take the write lock before reading the old bucket
+        change_seq = self.versions.bump(Task.__tablename__)
+        self.db.refresh(task)
+        old_key = self.stats.key_for(task)
+        task.change_seq = change_seq
         task.status = status
+        self.stats.record_moved(old_key, self.stats.key_for(task))
         self.db.commit()
         self.db.refresh(task)
         # Explicitly load category relationship
         self.db.refresh(task, ["category"])
         return task
 
-    def delete(self, task: Task) -> None:
+    def delete_many(
+        self,
+        ids: Optional[List[int]] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> int:
+        """
+        Delete every selected task with set-based DELETE statements.
+
+        Rows are removed in chunks of chunk_size, each committed on its own,
+        so a large delete never holds the write lock for long. A failure part
+        way through leaves earlier chunks deleted.
+
+        Args:
+            ids: Select tasks with these IDs
+            status: Select tasks with this status
+            priority: Select tasks with this priority
+            category_id: Select tasks in this category
+            chunk_size: Maximum number of rows deleted per transaction
+
+        Returns:
+            Number of deleted tasks
+        """
+        deleted = 0
+        if ids is not None:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start : start + chunk_size]
+                deleted += self._delete_chunk(Task.id.in_(chunk))
+            return deleted
+
+        criteria = self._filters(status, priority, category_id)
+        while True:
+            chunk = select(Task.id).where(*criteria).limit(chunk_size)
+            count = self._delete_chunk(Task.id.in_(chunk))
+            deleted += count
+            if count < chunk_size:
+                return deleted
+
+    def _delete_chunk(self, criterion) -> int:
         """
-        Delete a task from the database.
+        Delete the tasks matching a criterion, record their tombstones and
+        commit.
 
         Args:
-            task: Task object to delete
+            criterion: SQLAlchemy filter expression selecting the tasks
+
+        Returns:
+            Number of deleted tasks
         """
-        self.db.delete(task)
+        table = Task.__table__
+        rows = self.db.execute(
+            delete(table)
+            .where(criterion)
+            .returning(
+                table.c.status, table.c.priority, table.c.category_id, table.c.id
+            )
+        ).all()
+        self.stats.record_deleted(tuple(row[:3]) for row in rows)
+        if rows:
+            change_seq = self.versions.bump(Task.__tablename__)
+            self.tombstones.record((row.id for row in rows), change_seq)
         self.db.commit()
+        return len(rows)
 
-    def count(
+    def get_page(
         self,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
         category_id: Optional[int] = None,
-    ) -> int:
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Tuple[Any, int]] = None,
+        search: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> TaskPage:
         """
-        Count tasks with optional filtering.
+        Retrieve a page of tasks, the filtered total and category existence.
+
+        The total and the category check ride along as uncorrelated scalar
+        subqueries on the page query, so a non-empty page is answered by a
+        single statement from one snapshot. Only an empty page needs a second,
+        row-less statement to read those two values.
+
+        Without a search, tasks are ordered newest first by (created_at, id).
+        With one, only tasks matching the full-text index are returned, most
+        relevant (lowest bm25 rank) first, ordered by (rank, id).
+
+        This is a read-only path: only the needed columns are selected and
+        each row becomes a plain mapping, so no ORM objects, identity map
+        entries or relationship loads are created. With fields, only the
+        columns those response fields need are read (the keyset columns are
+        always included) and categories are joined only if requested.
 
         Args:
             status: Filter by task status
             priority: Filter by task priority
             category_id: Filter by category ID
+            limit: Maximum number of tasks to return
+            after: Sort key and id of the last task on the previous page:
+                (created_at, id), or (rank, id) when searching
+            search: FTS5 MATCH expression (see app.core.search)
+            due_before: Only open tasks due strictly before this time
+            due_after: Only open tasks due at or after this time
+            fields: TaskResponse field names to return (all if None)
 
         Returns:
-            Count of tasks matching the filters
+            TaskPage with the task mappings, total count, category
+            existence flag and, when searching, the rank of each task
         """
-        query = self.db.query(Task)
-
-        if status is not None:
-            query = query.filter(Task.status == status)
-        if priority is not None:
-            query = query.filter(Task.priority == priority)
+        criteria = self._filters(status, priority, category_id, due_before, due_after)
+        total = select(func.count(Task.id)).where(*criteria)
+        hits = None
+        if search is not None:
+            match = tasks_fts.c.tasks_fts.match(search)
+            hits = select(
+                tasks_fts.c.rowid.label("id"), tasks_fts.c.rank.label("rank")
+            ).where(match)
+            if criteria:
+                total = total.join(tasks_fts, tasks_fts.c.rowid == Task.id).where(match)
+            else:
+                # Without filters, count in the index and cut the ranked page
+                # there too, so only the page's own tasks are fetched
+                total = select(func.count()).select_from(tasks_fts).where(match)
+                if after is not None:
+                    hits = hits.where(tuple_(tasks_fts.c.rank, tasks_fts.c.rowid) > after)
+                hits = hits.order_by(tasks_fts.c.rank, tasks_fts.c.rowid).limit(limit)
+            hits = hits.subquery("hits")
+        total = total.scalar_subquery().label("total")
         if category_id is not None:
-            query = query.filter(Task.category_id == category_id)
+            category_exists = exists().where(Category.id == category_id).label(
+                "category_exists"
+            )
+        else:
+            category_exists = true().label("category_exists")
+
+        shape = RowShape.for_fields(fields)
+        seek = []
+        if hits is None:
+            query = shape.select(total, category_exists)
+            order_by = (Task.created_at.desc(), Task.id.desc())
+            if after is not None:
+                seek.append(tuple_(Task.created_at, Task.id) < after)
+        else:
+            query = shape.select(
+                total,
+                category_exists,
+                hits.c.rank,
+                source=Task.__table__.join(hits, hits.c.id == Task.id),
+            )
+            order_by = (hits.c.rank, Task.id)
+            if after is not None:
+                seek.append(tuple_(hits.c.rank, Task.id) > after)
+
+        query = (
+            query.where(*criteria, *seek)
+            .order_by(*order_by)
+            .limit(limit)
+        )
+        rows = self.db.execute(query).all()
+
+        if rows:
+            return TaskPage(
+                tasks=[shape.to_dict(row) for row in rows],
+                total=rows[0].total,
+                category_exists=bool(rows[0].category_exists),
+                ranks=[row.rank for row in rows] if hits is not None else None,
+            )
+
+        summary = self.db.execute(select(total, category_exists)).one()
+        return TaskPage(
+            tasks=[], total=summary.total, category_exists=bool(summary.category_exists)
+        )
+
+    def iter_batches(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+        search: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream every matching task as batches of plain mappings.
+
+        Tasks come newest first, in the list query's order, which the
+        created_at indexes deliver without sorting. Rows are fetched
+        batch_size at a time from one open cursor (yield_per), so memory use
+        does not grow with the number of tasks, and the whole read sees one
+        snapshot.
+
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            category_id: Filter by category ID
+            search: FTS5 MATCH expression (see app.core.search)
+            due_before: Only open tasks due strictly before this time
+            due_after: Only open tasks due at or after this time
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of at most batch_size task mappings, shaped like get_page's
+        """
+        criteria = self._filters(status, priority, category_id, due_before, due_after)
+        if search is not None:
+            criteria.append(
+                Task.id.in_(
+                    select(tasks_fts.c.rowid).where(tasks_fts.c.tasks_fts.match(search))
+                )
+            )
+        query = (
+            FULL_ROW.select()
+            .where(*criteria)
+            .order_by(Task.created_at.desc(), Task.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        for rows in self.db.execute(query).partitions():
+            yield [FULL_ROW.to_dict(row) for row in rows]
+
+    def get_changes(
+        self, after: Optional[Tuple[int, int]], limit: int
+    ) -> TaskChanges:
+        """
+        Read the tasks written and deleted after a change feed position.
+
+        Every write stamps its tasks (or their tombstones) with the tasks
+        table version it bumped, and both tables are read through their
+        change_seq index from the cursor on, so the cost depends on the
+        number of changes returned, not on the table size.
+        Each list holds up to limit entries; the caller merges them by
+        (change_seq, id).
+
+        Args:
+            after: (change_seq, id) of the last change already seen; None
+                reads every task and no tombstones
+            limit: Maximum number of entries per list
+
+        Returns:
+            TaskChanges with the written tasks and the deleted task ids
+        """
+        rows = read_changes_after(
+            self.db,
+            FULL_ROW.select(Task.change_seq),
+            Task.change_seq,
+            Task.id,
+            after,
+            limit,
+        )
+        tasks = [(row.change_seq, FULL_ROW.to_dict(row)) for row in rows]
+        deleted = self.tombstones.get_after(after, limit) if after is not None else []
+        return TaskChanges(tasks=tasks, deleted=deleted)
+
+    def get_due_calendar(
+        self, start: datetime, end: datetime
+    ) -> List[Tuple[date, int, List[int]]]:
+        """
+        Group open tasks due in a time range by calendar day.
+
+        Counting and grouping happen in SQL over the partial due_date index,
+        which holds only tasks that are not completed, so the query never
+        reads completed history.
+
+        Args:
+            start: Inclusive start of the range
+            end: Exclusive end of the range
+
+        Returns:
+            List of (day, task count, task ids) tuples ordered by day
+        """
+        day = func.date(Task.due_date)
+        if self.db.get_bind().dialect.name == "postgresql":
+            ids = func.array_agg(aggregate_order_by(Task.id, Task.id))
+        else:
+            ids = func.group_concat(Task.id)
+        query = (
+            select(day.label("day"), func.count(Task.id), ids)
+            .where(OPEN_TASKS, Task.due_date >= start, Task.due_date < end)
+            .group_by(day)
+            .order_by(day)
+        )
 
-        return query.count()
+        calendar = []
+        for day_value, count, task_ids in self.db.execute(query):
+            if isinstance(task_ids, str):
+                task_ids = sorted(int(task_id) for task_id in task_ids.split(","))
+            if isinstance(day_value, str):
+                day_value = date.fromisoformat(day_value)
+            calendar.append((day_value, count, list(task_ids)))
+        return calendar
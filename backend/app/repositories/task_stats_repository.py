@@ -0,0 +1,180 @@
+"""Repository for materialized task statistics."""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_counter import TaskCounter, UNCATEGORIZED
+from app.repositories.table_version_repository import TableVersionRepository
+
+# (status, priority, category_id) identifying one counter bucket
+CounterKey = Tuple[TaskStatus, TaskPriority, Optional[int]]
+
+
+class TaskStatsRepository:
+    """
+    Repository class for the task_counters table.
+    Keeps per-bucket task counts in step with task writes.
+
+    Methods that change counters never commit; they run inside the caller's
+    transaction so counters and tasks are always committed together.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    @staticmethod
+    def key_for(task: Task) -> CounterKey:
+        """
+        Return the counter bucket a task belongs to.
+
+        Args:
+            task: Task object
+
+        Returns:
+            (status, priority, category_id) tuple
+        """
+        return (task.status, task.priority, task.category_id)
+
+    def _insert(self):
+        """Return the dialect-specific INSERT construct supporting upserts."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(TaskCounter)
+        return sqlite.insert(TaskCounter)
+
+    def adjust(self, deltas: Dict[CounterKey, int]) -> None:
+        """
+        Add deltas to counter buckets, creating missing buckets.
+
+        Args:
+            deltas: Mapping of counter key to the amount to add
+        """
+        rows = [
+            {
+                "status": status,
+                "priority": priority,
+                "category_id": UNCATEGORIZED if category_id is None else category_id,
+                "count": delta,
+            }
+            for (status, priority, category_id), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        stmt = self._insert()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                TaskCounter.status,
+                TaskCounter.priority,
+                TaskCounter.category_id,
+            ],
+            set_={"count": TaskCounter.count + stmt.excluded.count},
+        )
+        self.db.execute(stmt, rows)
+
+    def record_created(self, keys: Iterable[CounterKey]) -> None:
+        """
+        Count newly created tasks.
+
+        Args:
+            keys: Counter key of each created task
+        """
+        self.adjust(Counter(keys))
+
+    def record_deleted(self, keys: Iterable[CounterKey]) -> None:
+        """
+        Uncount deleted tasks.
+
+        Args:
+            keys: Counter key of each deleted task
+        """
+        self.adjust({key: -n for key, n in Counter(keys).items()})
+
+    def record_moved(self, old_key: CounterKey, new_key: CounterKey) -> None:
+        """
+        Move one task between buckets after an update.
+
+        Args:
+            old_key: Counter key before the update
+            new_key: Counter key after the update
+        """
+        if old_key != new_key:
+            self.adjust({old_key: -1, new_key: 1})
+
+    def count_by_key(self, criteria: list) -> Dict[CounterKey, int]:
+        """
+        Count tasks matching criteria, grouped by counter key.
+
+        Used by set-based writes to learn which buckets they will touch.
+
+        Args:
+            criteria: SQLAlchemy filter expressions on the tasks table
+
+        Returns:
+            Mapping of counter key to number of matching tasks
+        """
+        query = (
+            select(Task.status, Task.priority, Task.category_id, func.count())
+            .where(*criteria)
+            .group_by(Task.status, Task.priority, Task.category_id)
+        )
+        return {
+            (status, priority, category_id): count
+            for status, priority, category_id, count in self.db.execute(query)
+        }
+
+    def get_counts(
+        self, category_id: Optional[int] = None
+    ) -> List[Tuple[TaskStatus, TaskPriority, int]]:
+        """
+        Read counts grouped by status and priority.
+
+        Args:
+            category_id: Restrict to one category (0 for uncategorized)
+
+        Returns:
+            List of (status, priority, count) tuples
+        """
+        query = select(
+            TaskCounter.status, TaskCounter.priority, func.sum(TaskCounter.count)
+        )
+        if category_id is not None:
+            query = query.where(TaskCounter.category_id == category_id)
+        query = query.group_by(TaskCounter.status, TaskCounter.priority)
+        return [tuple(row) for row in self.db.execute(query)]
+
+    def rebuild(self) -> int:
+        """
+        Recompute every counter from the tasks table and commit.
+
+        The tasks table version is bumped as well, so responses built from
+        the old counters (e.g. GET /api/tasks/stats) are no longer 304s.
+
+        Returns:
+            Number of counter buckets written
+        """
+        category = func.coalesce(Task.category_id, UNCATEGORIZED)
+        source = select(Task.status, Task.priority, category, func.count()).group_by(
+            Task.status, Task.priority, category
+        )
+
+        # Bumped first, like every other write: it takes the write lock
+        TableVersionRepository(self.db).bump(Task.__tablename__)
+        self.db.execute(delete(TaskCounter))
+        result = self.db.execute(
+            TaskCounter.__table__.insert().from_select(
+                ["status", "priority", "category_id", "count"], source
+            )
+        )
+        self.db.commit()
+        return result.rowcount
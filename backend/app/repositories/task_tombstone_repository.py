@@ -0,0 +1,125 @@
+"""Repository for tombstones of deleted tasks."""
+
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models.task_tombstone import TaskTombstone
+
+
+def read_changes_after(
+    db: Session,
+    query: Select,
+    change_seq: Any,
+    key: Any,
+    after: Optional[Tuple[int, int]],
+    limit: int,
+) -> List[Any]:
+    """
+    Read rows past a (change_seq, key) position in that order.
+
+    One write stamps all its rows with the same change_seq, so many rows can
+    share a sequence. SQLite seeks a row value only on index columns, and
+    the key is the rowid behind the change_seq index, so the seek is split
+    in two bounded index ranges: the rest of the cursor's sequence, then
+    the later sequences.
+
+    Args:
+        db: SQLAlchemy database session
+        query: SELECT to read from, without ordering or limit
+        change_seq: Change sequence column
+        key: Integer primary key column
+        after: (change_seq, key) to seek past (from the start if None)
+        limit: Maximum number of rows to return
+
+    Returns:
+        Rows ordered by (change_seq, key)
+    """
+    if after is None:
+        return db.execute(query.order_by(change_seq, key).limit(limit)).all()
+    seq, last = after
+    rows = db.execute(
+        query.where(change_seq == seq, key > last).order_by(key).limit(limit)
+    ).all()
+    if len(rows) < limit:
+        rows += db.execute(
+            query.where(change_seq > seq)
+            .order_by(change_seq, key)
+            .limit(limit - len(rows))
+        ).all()
+    return rows
+
+
+class TaskTombstoneRepository:
+    """
+    Repository class for the task_tombstones table.
+
+    record never commits; it runs inside the caller's transaction so a
+    tombstone exists exactly when its task is gone.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def _insert(self):
+        """Return the dialect-specific INSERT construct supporting upserts."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(TaskTombstone)
+        return sqlite.insert(TaskTombstone)
+
+    def record(self, task_ids: Iterable[int], change_seq: int) -> None:
+        """
+        Record the deletion of tasks.
+
+        Args:
+            task_ids: IDs of the deleted tasks
+            change_seq: tasks table version of the delete
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"task_id": task_id, "change_seq": change_seq, "deleted_at": now}
+            for task_id in task_ids
+        ]
+        if not rows:
+            return
+        stmt = self._insert()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TaskTombstone.task_id],
+            set_={
+                "change_seq": stmt.excluded.change_seq,
+                "deleted_at": stmt.excluded.deleted_at,
+            },
+        )
+        self.db.execute(stmt, rows)
+
+    def get_after(
+        self, after: Optional[Tuple[int, int]], limit: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Read the tombstones recorded after a change feed position.
+
+        Args:
+            after: (change_seq, task_id) to seek past (from the start if None)
+            limit: Maximum number of tombstones to return
+
+        Returns:
+            (change_seq, task_id) pairs in that order
+        """
+        rows = read_changes_after(
+            self.db,
+            select(TaskTombstone.change_seq, TaskTombstone.task_id),
+            TaskTombstone.change_seq,
+            TaskTombstone.task_id,
+            after,
+            limit,
+        )
+        return [tuple(row) for row in rows]
@@ -6,12 +6,25 @@ from app.schemas.task import (
     TaskStatusUpdate,
     TaskResponse,
     TaskListResponse,
+    TaskStatsResponse,
+    TaskCalendarDay,
+    TaskCalendarResponse,
+    TaskBulkCreate,
+    TaskBulkCreateResponse,
+    TaskFilter,
+    TaskSelection,
+    TaskBulkUpdate,
+    TaskBulkUpdateResponse,
+    TaskBulkDeleteResponse,
 )
 from app.schemas.category import (
     CategoryCreate,
     CategoryResponse,
     CategoryListResponse,
+    CategoryWithCountsResponse,
+    CategoryWithCountsListResponse,
 )
+from app.schemas.admin import CacheStats, CacheStatsResponse, PoolStats, PoolStatsResponse
 from app.schemas.common import ErrorResponse
 
 __all__ = [
@@ -20,8 +33,24 @@ __all__ = [
     "TaskStatusUpdate",
     "TaskResponse",
     "TaskListResponse",
+    "TaskStatsResponse",
+    "TaskCalendarDay",
+    "TaskCalendarResponse",
+    "TaskBulkCreate",
+    "TaskBulkCreateResponse",
+    "TaskFilter",
+    "TaskSelection",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateResponse",
+    "TaskBulkDeleteResponse",
     "CategoryCreate",
     "CategoryResponse",
     "CategoryListResponse",
+    "CategoryWithCountsResponse",
+    "CategoryWithCountsListResponse",
+    "PoolStats",
+    "PoolStatsResponse",
+    "CacheStats",
+    "CacheStatsResponse",
     "ErrorResponse",
 ]
@@ -0,0 +1,147 @@
+"""Admin and diagnostics Pydantic schemas."""
+
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class PoolStats(BaseModel):
+    """Live statistics for one connection pool."""
+
+    pool_class: str = Field(..., description="Pool implementation in use")
+    size: Optional[int] = Field(None, description="Configured number of pooled connections")
+    checked_out: Optional[int] = Field(None, description="Connections currently in use")
+    idle: Optional[int] = Field(None, description="Connections idle in the pool")
+    overflow: Optional[int] = Field(None, description="Overflow connections currently open")
+    max_overflow: Optional[int] = Field(None, description="Maximum overflow connections")
+    timeout: Optional[float] = Field(None, description="Seconds to wait for a connection")
+    checkouts: Optional[int] = Field(None, description="Connections handed out so far")
+    timeouts: Optional[int] = Field(None, description="Checkouts that timed out")
+    wait_ms_avg: Optional[float] = Field(None, description="Average checkout wait (ms)")
+    wait_ms_p50: Optional[float] = Field(None, description="Median recent checkout wait (ms)")
+    wait_ms_p99: Optional[float] = Field(None, description="99th percentile recent wait (ms)")
+    wait_ms_max: Optional[float] = Field(None, description="Longest checkout wait (ms)")
+
+
+class PoolStatsResponse(BaseModel):
+    """Schema for connection pool statistics of every engine."""
+
+    engines: Dict[str, PoolStats] = Field(..., description="Pool statistics by engine")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "engines": {
+                        "primary": {
+                            "pool_class": "MonitoredQueuePool",
+                            "size": 5,
+                            "checked_out": 1,
+                            "idle": 2,
+                            "overflow": 0,
+                            "max_overflow": 10,
+                            "timeout": 30.0,
+                            "checkouts": 1200,
+                            "timeouts": 0,
+                            "wait_ms_avg": 0.02,
+                            "wait_ms_p50": 0.01,
+                            "wait_ms_p99": 0.3,
+                            "wait_ms_max": 4.1,
+                        }
+                    }
+                }
+            ]
+        }
+    }
+
+
+class CacheStats(BaseModel):
+    """Size, configuration and hit/miss counters of one in-process cache."""
+
+    enabled: Optional[bool] = Field(None, description="Whether the cache is switched on")
+    size: int = Field(..., description="Entries currently cached")
+    max_size: Optional[int] = Field(
+        None, description="Maximum number of entries (0 = disabled)"
+    )
+    bytes: Optional[int] = Field(None, description="Total size of the cached bodies")
+    max_bytes: Optional[int] = Field(None, description="Maximum total size in bytes")
+    ttl: Optional[float] = Field(None, description="Seconds an entry stays valid")
+    complete: Optional[bool] = Field(
+        None, description="Whether the whole table fitted within max_size"
+    )
+    hits: int = Field(..., description="Lookups answered from the cache")
+    misses: int = Field(..., description="Lookups that had to read the database")
+    hit_ratio: Optional[float] = Field(None, description="hits / (hits + misses)")
+    compressions: Optional[int] = Field(
+        None, description="Compressed variants produced for cached bodies"
+    )
+    loads: Optional[int] = Field(None, description="Full reloads of the cache")
+    evictions: Optional[int] = Field(
+        None, description="Entries dropped for space or age"
+    )
+    invalidations: int = Field(..., description="Invalidations caused by writes")
+
+
+class CacheStatsResponse(BaseModel):
+    """Schema for statistics of every in-process cache."""
+
+    caches: Dict[str, CacheStats] = Field(..., description="Cache statistics by name")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "caches": {
+                        "categories": {
+                            "size": 12,
+                            "max_size": 1024,
+                            "ttl": 60.0,
+                            "complete": True,
+                            "hits": 5230,
+                            "misses": 14,
+                            "hit_ratio": 0.9973,
+                            "loads": 9,
+                            "invalidations": 3,
+                        },
+                        "task_lists": {
+                            "enabled": True,
+                            "size": 40,
+                            "bytes": 1250000,
+                            "max_bytes": 33554432,
+                            "ttl": 30.0,
+                            "hits": 820,
+                            "misses": 95,
+                            "hit_ratio": 0.8962,
+                            "evictions": 0,
+                            "invalidations": 31,
+                        },
+                    }
+                }
+            ]
+        }
+    }
+
+
+class EventStatsResponse(BaseModel):
+    """Schema for Server-Sent Events statistics of this worker."""
+
+    subscribers: int = Field(..., description="Open GET /api/events streams")
+    queue_size: int = Field(..., description="Events queued per subscriber at most")
+    heartbeat: float = Field(..., description="Seconds between heartbeats")
+    published: int = Field(..., description="Events published to subscribers")
+    resyncs: int = Field(
+        ..., description="Times a slow subscriber's events were dropped for a resync"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "subscribers": 1200,
+                    "queue_size": 256,
+                    "heartbeat": 15.0,
+                    "published": 5230,
+                    "resyncs": 2,
+                }
+            ]
+        }
+    }
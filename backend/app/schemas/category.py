@@ -1,9 +1,11 @@
 """Category-related Pydantic schemas."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 import re
 
+from app.models.task import TaskStatus
+
 
 class CategoryBase(BaseModel):
     """Base category schema with shared fields."""
@@ -71,3 +73,62 @@ class CategoryListResponse(BaseModel):
             ]
         }
     }
+
+
+class CategoryWithCountsResponse(CategoryResponse):
+    """Schema for a category together with its task counts."""
+
+    task_count: int = Field(..., description="Number of tasks in the category")
+    by_status: Dict[TaskStatus, int] = Field(
+        ..., description="Number of tasks in the category per status"
+    )
+
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "id": 1,
+                    "name": "Work",
+                    "color": "#3B82F6",
+                    "task_count": 7,
+                    "by_status": {"todo": 3, "in_progress": 2, "completed": 2},
+                },
+            ]
+        },
+    }
+
+
+class CategoryWithCountsListResponse(BaseModel):
+    """Schema for list of categories with task counts response."""
+
+    categories: List[CategoryWithCountsResponse] = Field(
+        ..., description="List of categories with task counts"
+    )
+    total: int = Field(..., description="Total number of categories")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "categories": [
+                        {
+                            "id": 1,
+                            "name": "Work",
+                            "color": "#3B82F6",
+                            "task_count": 7,
+                            "by_status": {"todo": 3, "in_progress": 2, "completed": 2},
+                        },
+                        {
+                            "id": 2,
+                            "name": "Personal",
+                            "color": "#10B981",
+                            "task_count": 0,
+                            "by_status": {"todo": 0, "in_progress": 0, "completed": 0},
+                        },
+                    ],
+                    "total": 2,
+                }
+            ]
+        }
+    }
@@ -1,12 +1,21 @@
 """Task-related Pydantic schemas."""
 
-from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.task import TaskStatus, TaskPriority
 from app.schemas.category import CategoryResponse
 
+# Maximum number of items accepted by one bulk request
+BULK_MAX_ITEMS = 10_000
+
+# Maximum number of per-line errors an import reports
+IMPORT_MAX_ERRORS = 100
+
+# Maximum number of days one calendar request may span
+CALENDAR_MAX_DAYS = 366
+
 
 class TaskBase(BaseModel):
     """Base task schema with shared fields."""
@@ -125,11 +134,18 @@ class TaskResponse(TaskBase):
     }
 
 
+# Fields a client may select with ?fields=
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+
+
 class TaskListResponse(BaseModel):
     """Schema for list of tasks response."""
 
     tasks: List[TaskResponse] = Field(..., description="List of tasks")
     total: int = Field(..., description="Total number of tasks matching the query")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -150,7 +166,264 @@ class TaskListResponse(BaseModel):
                         }
                     ],
                     "total": 1,
+                    "next_cursor": None,
+                }
+            ]
+        }
+    }
+
+
+class TaskChangesResponse(BaseModel):
+    """Schema for the task change feed."""
+
+    tasks: List[TaskResponse] = Field(
+        ...,
+        description="Tasks created or updated since the cursor, oldest change first",
+    )
+    deleted: List[int] = Field(
+        ...,
+        description=(
+            "IDs of tasks deleted since the cursor; apply before tasks, since a "
+            "deleted ID may have been reused by a task in the same response"
+        ),
+    )
+    next_cursor: str = Field(..., description="Cursor to pass as since on the next call")
+    has_more: bool = Field(
+        ..., description="Whether more changes are waiting past next_cursor"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "tasks": [
+                        {
+                            "id": 1,
+                            "title": "Complete project proposal",
+                            "description": "Write and submit the Q1 project proposal",
+                            "status": "completed",
+                            "priority": "high",
+                            "category_id": 1,
+                            "category": {"id": 1, "name": "Work", "color": "#3B82F6"},
+                            "due_date": "2025-10-30T17:00:00",
+                            "created_at": "2025-10-22T10:00:00",
+                            "updated_at": "2025-10-23T09:15:00",
+                        }
+                    ],
+                    "deleted": [7],
+                    "next_cursor": "WzQyLDFd",
+                    "has_more": False,
+                }
+            ]
+        }
+    }
+
+
+class TaskStatsResponse(BaseModel):
+    """Schema for aggregated task statistics."""
+
+    total: int = Field(..., description="Total number of tasks")
+    by_status: Dict[TaskStatus, int] = Field(
+        ..., description="Number of tasks per status"
+    )
+    by_priority: Dict[TaskPriority, int] = Field(
+        ..., description="Number of tasks per priority"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "total": 12,
+                    "by_status": {"todo": 5, "in_progress": 4, "completed": 3},
+                    "by_priority": {"low": 2, "medium": 6, "high": 4},
+                }
+            ]
+        }
+    }
+
+
+class TaskCalendarDay(BaseModel):
+    """Open tasks due on one calendar day."""
+
+    day: date = Field(..., description="Calendar day (UTC)")
+    count: int = Field(..., description="Number of open tasks due that day")
+    task_ids: List[int] = Field(..., description="IDs of the tasks due that day")
+
+
+class TaskCalendarResponse(BaseModel):
+    """Schema for per-day due-date buckets of open tasks."""
+
+    days: List[TaskCalendarDay] = Field(
+        ..., description="Days with at least one open task due, in order"
+    )
+    total: int = Field(..., description="Number of open tasks due in the range")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "days": [
+                        {"day": "2025-10-30", "count": 2, "task_ids": [1, 7]},
+                        {"day": "2025-10-31", "count": 1, "task_ids": [4]},
+                    ],
+                    "total": 3,
+                }
+            ]
+        }
+    }
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks in one request."""
+
+    tasks: List[TaskCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_MAX_ITEMS,
+        description="Tasks to create",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "tasks": [
+                        {
+                            "title": "Import task 1",
+                            "priority": "high",
+                            "category_id": 1,
+                        },
+                        {"title": "Import task 2"},
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for the result of a bulk task creation."""
+
+    tasks: List[TaskResponse] = Field(..., description="Created tasks, in input order")
+    created: int = Field(..., description="Number of tasks created")
+
+
+class TaskImportError(BaseModel):
+    """Schema for one record an import skipped."""
+
+    line: int = Field(..., description="Line number in the uploaded file (from 1)")
+    message: str = Field(..., description="Why the record was skipped")
+
+
+class TaskImportResponse(BaseModel):
+    """Schema for the result of a task import."""
+
+    processed: int = Field(..., description="Records read from the file")
+    created: int = Field(..., description="Tasks created")
+    failed: int = Field(..., description="Records skipped because of errors")
+    batches: int = Field(..., description="Transactions committed")
+    errors: List[TaskImportError] = Field(
+        ...,
+        description=f"The first {IMPORT_MAX_ERRORS} errors, in file order",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "processed": 3,
+                    "created": 2,
+                    "failed": 1,
+                    "batches": 1,
+                    "errors": [
+                        {"line": 2, "message": "title: Field required"},
+                    ],
                 }
             ]
         }
     }
+
+
+class TaskFilter(BaseModel):
+    """Schema for selecting tasks by the same filters as the task list."""
+
+    status: Optional[TaskStatus] = Field(
+        None, description="Match tasks with this status"
+    )
+    priority: Optional[TaskPriority] = Field(
+        None, description="Match tasks with this priority"
+    )
+    category_id: Optional[int] = Field(
+        None, description="Match tasks in this category"
+    )
+
+
+class TaskSelection(BaseModel):
+    """Schema for selecting the tasks a bulk operation applies to."""
+
+    ids: Optional[List[int]] = Field(
+        None,
+        min_length=1,
+        max_length=BULK_MAX_ITEMS,
+        description="IDs of the tasks to select",
+    )
+    filter: Optional[TaskFilter] = Field(
+        None, description="Select every task matching these filters"
+    )
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "TaskSelection":
+        """Validate that exactly one non-empty selector is given."""
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("'filter' must set at least one field")
+        return self
+
+
+class TaskBulkUpdate(TaskSelection):
+    """Schema for applying the same changes to many tasks."""
+
+    changes: TaskUpdate = Field(..., description="Fields to set on every selected task")
+    return_tasks: bool = Field(
+        False, description="Include the updated tasks in the response"
+    )
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> "TaskBulkUpdate":
+        """Validate that at least one field is changed."""
+        if not self.changes.model_fields_set:
+            raise ValueError("'changes' must set at least one field")
+        return self
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "filter": {"status": "in_progress"},
+                    "changes": {"status": "completed"},
+                },
+                {
+                    "ids": [1, 2, 3],
+                    "changes": {"priority": "high"},
+                    "return_tasks": True,
+                },
+            ]
+        }
+    }
+
+
+class TaskBulkUpdateResponse(BaseModel):
+    """Schema for the result of a bulk task update."""
+
+    updated: int = Field(..., description="Number of tasks updated")
+    tasks: Optional[List[TaskResponse]] = Field(
+        None, description="Updated tasks, when requested with return_tasks"
+    )
+
+
+class TaskBulkDeleteResponse(BaseModel):
+    """Schema for the result of a bulk task deletion."""
+
+    deleted: int = Field(..., description="Number of tasks deleted")
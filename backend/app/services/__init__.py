@@ -1,6 +1,11 @@
 """Service layer for business logic."""
 
-from app.services.task_service import TaskService
-from app.services.category_service import CategoryService
+from app.services.task_service import TaskService, AsyncTaskService
+from app.services.category_service import CategoryService, AsyncCategoryService
 
-__all__ = ["TaskService", "CategoryService"]
+__all__ = [
+    "TaskService",
+    "CategoryService",
+    "AsyncTaskService",
+    "AsyncCategoryService",
+]
@@ -1,12 +1,22 @@
 """Service layer for category business logic."""
 
-from typing import List
+from typing import Any, Callable, List, TypeVar, Union
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionRunner
+from app.core.events import event_broker
 from app.repositories.category_repository import CategoryRepository
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryListResponse
+from app.schemas.category import (
+    CategoryCreate,
+    CategoryResponse,
+    CategoryListResponse,
+    CategoryWithCountsResponse,
+    CategoryWithCountsListResponse,
+)
 from app.core.exceptions import NotFoundException, DuplicateException
 
+T = TypeVar("T")
+
 
 class CategoryService:
     """
@@ -23,19 +33,44 @@ class CategoryService:
         """
         self.repository = CategoryRepository(db)
 
-    def get_all_categories(self) -> CategoryListResponse:
+    def get_all_categories(
+        self, with_counts: bool = False
+    ) -> Union[CategoryListResponse, CategoryWithCountsListResponse]:
         """
         Retrieve all categories.
 
+        Args:
+            with_counts: Include each category's task count, total and per status
+
         Returns:
-            CategoryListResponse with list of categories and total count
+            CategoryListResponse with list of categories and total count, or
+            CategoryWithCountsListResponse when with_counts is set
         """
-        categories = self.repository.get_all()
+        if with_counts:
+            return self._get_all_categories_with_counts()
+
+        categories = self.repository.get_all_rows()
         return CategoryListResponse(
             categories=[CategoryResponse.model_validate(cat) for cat in categories],
             total=len(categories),
         )
 
+    def _get_all_categories_with_counts(self) -> CategoryWithCountsListResponse:
+        """Build the category list with task counts from one aggregate query."""
+        categories = [
+            CategoryWithCountsResponse(
+                id=category.id,
+                name=category.name,
+                color=category.color,
+                task_count=sum(by_status.values()),
+                by_status=by_status,
+            )
+            for category, by_status in self.repository.get_all_with_counts()
+        ]
+        return CategoryWithCountsListResponse(
+            categories=categories, total=len(categories)
+        )
+
     def create_category(self, category_data: CategoryCreate) -> CategoryResponse:
         """
         Create a new category.
@@ -50,14 +85,16 @@ class CategoryService:
             DuplicateException: If category with the same name already exists
         """
         # Check for duplicate name
-        existing_category = self.repository.get_by_name(category_data.name)
+        existing_category = self.repository.lookup_by_name(category_data.name)
         if existing_category:
             raise DuplicateException(
                 resource="Category", field="name", value=category_data.name
             )
 
         category = self.repository.create(category_data)
-        return CategoryResponse.model_validate(category)
+        response = CategoryResponse.model_validate(category)
+        event_broker.publish("category.created", response)
+        return response
 
     def get_category_by_id(self, category_id: int) -> CategoryResponse:
         """
@@ -72,8 +109,44 @@ class CategoryService:
         Raises:
             NotFoundException: If category is not found
         """
-        category = self.repository.get_by_id(category_id)
+        category = self.repository.lookup(category_id)
         if not category:
             raise NotFoundException(resource="Category", resource_id=category_id)
 
         return CategoryResponse.model_validate(category)
+
+
+class AsyncCategoryService:
+    """
+    Async facade over CategoryService for async endpoints.
+    Runs the synchronous service through the request's SessionRunner.
+    """
+
+    def __init__(self, db: SessionRunner):
+        """
+        Initialize service with a session runner.
+
+        Args:
+            db: AsyncSession or ThreadedSession
+        """
+        self.db = db
+
+    async def _run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a CategoryService method against the runner's session."""
+        return await self.db.run_sync(
+            lambda session: method(CategoryService(session), *args, **kwargs)
+        )
+
+    async def get_all_categories(
+        self, with_counts: bool = False
+    ) -> Union[CategoryListResponse, CategoryWithCountsListResponse]:
+        """Async counterpart of CategoryService.get_all_categories."""
+        return await self._run(CategoryService.get_all_categories, with_counts=with_counts)
+
+    async def create_category(self, category_data: CategoryCreate) -> CategoryResponse:
+        """Async counterpart of CategoryService.create_category."""
+        return await self._run(CategoryService.create_category, category_data)
+
+    async def get_category_by_id(self, category_id: int) -> CategoryResponse:
+        """Async counterpart of CategoryService.get_category_by_id."""
+        return await self._run(CategoryService.get_category_by_id, category_id)
@@ -1,19 +1,107 @@
 """Service layer for task business logic."""
 
-from typing import Optional
+import heapq
+import itertools
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionRunner
+from app.core.events import event_broker
+from app.core.export import ExportFormat, render_csv, render_ndjson
+from app.core.importing import describe_validation_error, read_csv, read_ndjson
+
 from app.repositories.task_repository import TaskRepository
 from app.repositories.category_repository import CategoryRepository
+from app.schemas.category import CategoryResponse
 from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskStatusUpdate,
     TaskResponse,
     TaskListResponse,
+    TaskChangesResponse,
+    TaskStatsResponse,
+    TaskCalendarDay,
+    TaskCalendarResponse,
+    TaskBulkCreate,
+    TaskBulkCreateResponse,
+    TaskBulkUpdate,
+    TaskBulkUpdateResponse,
+    TaskBulkDeleteResponse,
+    TaskImportError,
+    TaskImportResponse,
+    TaskSelection,
+    CALENDAR_MAX_DAYS,
+    IMPORT_MAX_ERRORS,
 )
 from app.models.task import TaskStatus, TaskPriority
 from app.core.exceptions import NotFoundException, ValidationException
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_change_cursor,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_change_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from app.core.search import build_search_query
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Valid tasks inserted per transaction by imports
+IMPORT_BATCH_SIZE = 5000
+
+
+def _sparse_response(row: Dict[str, Any]) -> TaskResponse:
+    """
+    Wrap a task mapping holding only some columns in a TaskResponse.
+
+    The values come straight from typed database columns, so the model is
+    constructed without validation, which would reject the missing required
+    fields. Only the selected fields may be serialized (see
+    app.core.fieldsets.include_fields).
+
+    Args:
+        row: Task mapping from a narrowed repository read
+
+    Returns:
+        Partially populated TaskResponse
+    """
+    category = row.get("category")
+    if category is not None:
+        row["category"] = CategoryResponse.model_construct(**category)
+    return TaskResponse.model_construct(**row)
+
+
+def _publish_bulk(action: str, count: int) -> None:
+    """
+    Announce a set-based write without listing every task.
+
+    Subscribers catch up through the change feed instead of receiving one
+    event per task.
+
+    Args:
+        action: "created", "updated", "deleted" or "imported"
+        count: Number of affected tasks
+    """
+    event_broker.publish("tasks.changed", {"action": action, "count": count})
 
 
 class TaskService:
@@ -37,37 +125,244 @@ class TaskService:
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
         category_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        q: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        fields: Optional[FrozenSet[str]] = None,
     ) -> TaskListResponse:
         """
-        Retrieve all tasks with optional filtering.
+        Retrieve one page of tasks with optional filtering and search.
+
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            category_id: Filter by category ID
+            limit: Maximum number of tasks on the page
+            cursor: Opaque cursor returned as next_cursor by the previous page
+            q: Full-text search over title and description; results are
+                ordered by relevance instead of creation time
+            due_before: Only open tasks due strictly before this time
+            due_after: Only open tasks due at or after this time
+            fields: TaskResponse fields to load (all if None); the tasks then
+                only hold those fields and must be serialized with them
+
+        Returns:
+            TaskListResponse with the page of tasks, total count and next cursor
+
+        Raises:
+            NotFoundException: If specified category_id doesn't exist
+            ValidationException: If the cursor or search text is invalid
+        """
+        search = build_search_query(q) if q is not None else None
+        after = None
+        if cursor is not None:
+            after = decode_rank_cursor(cursor) if search else decode_cursor(cursor)
+
+        # One statement returns the page, the filtered total and whether the
+        # category filter names an existing category. One extra row is fetched
+        # to learn whether another page follows.
+        page = self.task_repository.get_page(
+            status=status,
+            priority=priority,
+            category_id=category_id,
+            limit=limit + 1,
+            after=after,
+            search=search,
+            due_before=due_before,
+            due_after=due_after,
+            fields=fields,
+        )
+        if not page.category_exists:
+            raise NotFoundException(resource="Category", resource_id=category_id)
+
+        tasks, total = page.tasks, page.total
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            if page.ranks is not None:
+                next_cursor = encode_rank_cursor(page.ranks[limit - 1], tasks[-1]["id"])
+            else:
+                next_cursor = encode_cursor(tasks[-1]["created_at"], tasks[-1]["id"])
+
+        build = TaskResponse.model_validate if fields is None else _sparse_response
+        return TaskListResponse(
+            tasks=[build(task) for task in tasks],
+            total=total,
+            next_cursor=next_cursor,
+        )
+
+    def get_changes(
+        self, since: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> TaskChangesResponse:
+        """
+        Retrieve the tasks created, updated or deleted since a cursor.
+
+        Changes are ordered by (change sequence, task id). A task changed
+        several times since the cursor appears once, in its current state.
+        Without a cursor every task is returned, so a client can build its
+        copy and then follow the feed.
+
+        Args:
+            since: Cursor returned as next_cursor by the previous call
+            limit: Maximum number of changes (tasks plus deletions) returned
+
+        Returns:
+            TaskChangesResponse with the changed tasks, deleted task ids and
+            the cursor to continue from
+
+        Raises:
+            ValidationException: If the cursor is invalid
+        """
+        after = decode_change_cursor(since) if since is not None else None
+
+        # One extra entry is read from each table to learn whether more follow
+        changes = self.task_repository.get_changes(after, limit + 1)
+        merged = heapq.merge(
+            ((change_seq, task["id"], task) for change_seq, task in changes.tasks),
+            ((change_seq, task_id, None) for change_seq, task_id in changes.deleted),
+            key=lambda change: change[:2],
+        )
+        page = list(itertools.islice(merged, limit + 1))
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        if page:
+            next_cursor = encode_change_cursor(*page[-1][:2])
+        else:
+            next_cursor = since or encode_change_cursor(0, 0)
+        return TaskChangesResponse(
+            tasks=[
+                TaskResponse.model_validate(task)
+                for _, _, task in page
+                if task is not None
+            ],
+            deleted=[task_id for _, task_id, task in page if task is None],
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def export_tasks(
+        self,
+        format: ExportFormat = ExportFormat.NDJSON,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+        q: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """
+        Export every task matching the filters, one rendered batch at a time.
+
+        The filters are checked immediately, so errors are raised before a
+        response starts; tasks are only read as the returned iterator is
+        consumed, and never held in memory beyond one batch.
 
         Args:
+            format: NDJSON (one TaskResponse per line) or CSV
             status: Filter by task status
             priority: Filter by task priority
             category_id: Filter by category ID
+            q: Full-text search over title and description
+            due_before: Only open tasks due strictly before this time
+            due_after: Only open tasks due at or after this time
 
         Returns:
-            TaskListResponse with list of tasks and total count
+            Iterator of body chunks; CSV output starts with a header row
 
         Raises:
             NotFoundException: If specified category_id doesn't exist
+            ValidationException: If the search text is invalid
         """
-        # Validate category exists if filtering by category
         if category_id is not None:
-            category = self.category_repository.get_by_id(category_id)
+            category = self.category_repository.lookup(category_id)
             if not category:
                 raise NotFoundException(resource="Category", resource_id=category_id)
-
-        tasks = self.task_repository.get_all(
-            status=status, priority=priority, category_id=category_id
+        search = build_search_query(q) if q is not None else None
+
+        batches = self.task_repository.iter_batches(
+            status=status,
+            priority=priority,
+            category_id=category_id,
+            search=search,
+            due_before=due_before,
+            due_after=due_after,
         )
-        total = self.task_repository.count(
-            status=status, priority=priority, category_id=category_id
+        if format == ExportFormat.CSV:
+            header = render_csv([], header=True)
+            return itertools.chain([header], map(render_csv, batches))
+        return map(render_ndjson, batches)
+
+    def get_task_calendar(self, start: date, end: date) -> TaskCalendarResponse:
+        """
+        Count open tasks due on each day of a date range.
+
+        Args:
+            start: First day of the range (inclusive)
+            end: Last day of the range (inclusive)
+
+        Returns:
+            TaskCalendarResponse with one entry per day that has tasks due
+
+        Raises:
+            ValidationException: If the range is reversed or too long
+        """
+        if end < start:
+            raise ValidationException(
+                message="'to' must not be before 'from'",
+                details={"from": start.isoformat(), "to": end.isoformat()},
+            )
+        if (end - start).days + 1 > CALENDAR_MAX_DAYS:
+            raise ValidationException(
+                message=f"Calendar range cannot exceed {CALENDAR_MAX_DAYS} days",
+                details={"from": start.isoformat(), "to": end.isoformat()},
+            )
+
+        buckets = self.task_repository.get_due_calendar(
+            start=datetime.combine(start, time.min),
+            end=datetime.combine(end + timedelta(days=1), time.min),
         )
+        days = [
+            TaskCalendarDay(day=day, count=count, task_ids=task_ids)
+            for day, count, task_ids in buckets
+        ]
+        return TaskCalendarResponse(days=days, total=sum(day.count for day in days))
 
-        return TaskListResponse(
-            tasks=[TaskResponse.model_validate(task) for task in tasks],
-            total=total,
+    def get_task_stats(self, category_id: Optional[int] = None) -> TaskStatsResponse:
+        """
+        Retrieve task counts by status and priority.
+
+        Counts come from the materialized task_counters table, so the cost
+        does not depend on the number of tasks.
+
+        Args:
+            category_id: Restrict statistics to one category
+
+        Returns:
+            TaskStatsResponse with total and per-status/priority counts
+
+        Raises:
+            NotFoundException: If specified category_id doesn't exist
+        """
+        if category_id is not None:
+            category = self.category_repository.lookup(category_id)
+            if not category:
+                raise NotFoundException(resource="Category", resource_id=category_id)
+
+        by_status = {status: 0 for status in TaskStatus}
+        by_priority = {priority: 0 for priority in TaskPriority}
+        for status, priority, count in self.task_repository.stats.get_counts(
+            category_id=category_id
+        ):
+            by_status[status] += count
+            by_priority[priority] += count
+
+        return TaskStatsResponse(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_priority=by_priority,
         )
 
     def create_task(self, task_data: TaskCreate) -> TaskResponse:
@@ -86,21 +381,184 @@ class TaskService:
         """
         # Validate category exists if provided
         if task_data.category_id is not None:
-            category = self.category_repository.get_by_id(task_data.category_id)
+            category = self.category_repository.lookup(task_data.category_id)
             if not category:
                 raise NotFoundException(
                     resource="Category", resource_id=task_data.category_id
                 )
 
         task = self.task_repository.create(task_data)
-        return TaskResponse.model_validate(task)
+        response = TaskResponse.model_validate(task)
+        event_broker.publish("task.created", response)
+        return response
+
+    def create_tasks_bulk(self, bulk_data: TaskBulkCreate) -> TaskBulkCreateResponse:
+        """
+        Create many tasks atomically.
 
-    def get_task_by_id(self, task_id: int) -> TaskResponse:
+        All referenced categories are checked with one IN query. If any item
+        references a missing category nothing is created and every failing
+        item is reported.
+
+        Args:
+            bulk_data: Tasks to create
+
+        Returns:
+            TaskBulkCreateResponse with the created tasks
+
+        Raises:
+            ValidationException: If any item references a missing category
+        """
+        categories = self.category_repository.lookup_many(
+            task.category_id
+            for task in bulk_data.tasks
+            if task.category_id is not None
+        )
+
+        errors = [
+            {
+                "index": index,
+                "message": f"Category with id '{task.category_id}' not found",
+            }
+            for index, task in enumerate(bulk_data.tasks)
+            if task.category_id is not None and task.category_id not in categories
+        ]
+        if errors:
+            raise ValidationException(
+                message=f"{len(errors)} task(s) reference missing categories",
+                details={"errors": errors},
+            )
+
+        rows = self.task_repository.create_many(bulk_data.tasks)
+        tasks = [
+            TaskResponse.model_validate(
+                {**row, "category": categories.get(row["category_id"])}
+            )
+            for row in rows
+        ]
+        _publish_bulk("created", len(tasks))
+        return TaskBulkCreateResponse(tasks=tasks, created=len(tasks))
+
+    def import_tasks(
+        self, file: BinaryIO, format: ExportFormat = ExportFormat.NDJSON
+    ) -> TaskImportResponse:
+        """
+        Import tasks from an NDJSON or CSV file, one record at a time.
+
+        Each record is validated against TaskCreate. A category is given by
+        category_id or, failing that, by category_name; every distinct
+        reference is resolved once, through the category cache. Valid tasks
+        are inserted IMPORT_BATCH_SIZE per transaction, so only one batch is
+        held in memory and earlier batches stay committed if a later one
+        fails. Invalid records are skipped and reported by line.
+
+        Args:
+            file: Binary file positioned at the start
+            format: NDJSON (one task object per line) or CSV with a header
+
+        Returns:
+            TaskImportResponse with counts and the first IMPORT_MAX_ERRORS
+            per-line errors
+
+        Raises:
+            ValidationException: If a CSV file has no usable header row
+        """
+        try:
+            read = read_csv if format == ExportFormat.CSV else read_ndjson
+            records = read(file)
+        except ValueError as exc:
+            raise ValidationException(message=str(exc)) from None
+
+        categories: Dict[Union[int, str], Optional[int]] = {}
+        errors: List[TaskImportError] = []
+        batch: List[TaskCreate] = []
+        processed = created = failed = batches = 0
+        for record in records:
+            processed += 1
+            try:
+                if record.error is not None:
+                    raise ValueError(record.error)
+                batch.append(self._import_record(record.data, categories))
+            except ValueError as exc:
+                failed += 1
+                if len(errors) < IMPORT_MAX_ERRORS:
+                    errors.append(TaskImportError(line=record.line, message=str(exc)))
+                continue
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                created += self._import_batch(batch)
+                batches += 1
+                batch = []
+                logger.info(
+                    "Task import: %d records read, %d tasks created", processed, created
+                )
+        if batch:
+            created += self._import_batch(batch)
+            batches += 1
+
+        return TaskImportResponse(
+            processed=processed,
+            created=created,
+            failed=failed,
+            batches=batches,
+            errors=errors,
+        )
+
+    def _import_batch(self, batch: List[TaskCreate]) -> int:
+        """Insert one batch of imported tasks and announce it; return the count."""
+        created = len(self.task_repository.create_many(batch))
+        _publish_bulk("imported", created)
+        return created
+
+    def _import_record(
+        self, data: Dict[str, Any], categories: Dict[Union[int, str], Optional[int]]
+    ) -> TaskCreate:
+        """
+        Validate one import record and resolve its category.
+
+        Args:
+            data: Field values read from the file
+            categories: Category IDs resolved so far by this import, keyed by
+                ID or name (None for references that do not exist)
+
+        Returns:
+            TaskCreate ready to be inserted
+
+        Raises:
+            ValueError: If the record is invalid or its category is unknown
+        """
+        name = data.pop("category_name", None)
+        try:
+            task = TaskCreate.model_validate(data)
+        except ValidationError as exc:
+            raise ValueError(describe_validation_error(exc)) from None
+
+        if task.category_id is not None:
+            if task.category_id not in categories:
+                category = self.category_repository.lookup(task.category_id)
+                categories[task.category_id] = category.id if category else None
+            if categories[task.category_id] is None:
+                raise ValueError(f"Category with id '{task.category_id}' not found")
+        elif name is not None:
+            if not isinstance(name, str):
+                raise ValueError("category_name: Input should be a valid string")
+            if name not in categories:
+                category = self.category_repository.lookup_by_name(name)
+                categories[name] = category.id if category else None
+            if categories[name] is None:
+                raise ValueError(f"Category named '{name}' not found")
+            task.category_id = categories[name]
+        return task
+
+    def get_task_by_id(
+        self, task_id: int, fields: Optional[FrozenSet[str]] = None
+    ) -> TaskResponse:
         """
         Retrieve a task by its ID.
 
         Args:
             task_id: Task ID to retrieve
+            fields: TaskResponse fields to load (all if None); the task then
+                only holds those fields and must be serialized with them
 
         Returns:
             TaskResponse with task data
@@ -108,6 +566,12 @@ class TaskService:
         Raises:
             NotFoundException: If task is not found
         """
+        if fields is not None:
+            row = self.task_repository.get_row(task_id, fields)
+            if row is None:
+                raise NotFoundException(resource="Task", resource_id=task_id)
+            return _sparse_response(row)
+
         task = self.task_repository.get_by_id(task_id)
         if not task:
             raise NotFoundException(resource="Task", resource_id=task_id)
@@ -135,14 +599,72 @@ class TaskService:
 
         # Validate category exists if being updated
         if task_data.category_id is not None:
-            category = self.category_repository.get_by_id(task_data.category_id)
+            category = self.category_repository.lookup(task_data.category_id)
             if not category:
                 raise NotFoundException(
                     resource="Category", resource_id=task_data.category_id
                 )
 
         updated_task = self.task_repository.update(task, task_data)
-        return TaskResponse.model_validate(updated_task)
+        response = TaskResponse.model_validate(updated_task)
+        event_broker.publish("task.updated", response)
+        return response
+
+    def update_tasks_bulk(self, bulk_data: TaskBulkUpdate) -> TaskBulkUpdateResponse:
+        """
+        Apply the same changes to every selected task.
+
+        Args:
+            bulk_data: Task selection and the changes to apply
+
+        Returns:
+            TaskBulkUpdateResponse with the affected count (and tasks if requested)
+
+        Raises:
+            NotFoundException: If the new category_id doesn't exist
+            ValidationException: If a required field is set to null
+        """
+        changes = bulk_data.changes.model_dump(exclude_unset=True)
+        for field in ("title", "status", "priority"):
+            if field in changes and changes[field] is None:
+                raise ValidationException(
+                    message=f"Field '{field}' cannot be null",
+                    details={"field": field},
+                )
+
+        category = None
+        if changes.get("category_id") is not None:
+            category = self.category_repository.lookup(changes["category_id"])
+            if not category:
+                raise NotFoundException(
+                    resource="Category", resource_id=changes["category_id"]
+                )
+
+        selection = bulk_data.filter.model_dump() if bulk_data.filter else {}
+        updated, rows = self.task_repository.update_many(
+            changes,
+            ids=bulk_data.ids,
+            returning=bulk_data.return_tasks,
+            **selection,
+        )
+        if updated:
+            _publish_bulk("updated", updated)
+        if not bulk_data.return_tasks:
+            return TaskBulkUpdateResponse(updated=updated)
+
+        if "category_id" in changes:
+            categories = {category.id: category} if category else {}
+        else:
+            categories = self.category_repository.lookup_many(
+                row["category_id"] for row in rows if row["category_id"] is not None
+            )
+        tasks = [
+            TaskResponse.model_validate(
+                {**row, "category": categories.get(row["category_id"])}
+            )
+            for row in rows
+        ]
+        return TaskBulkUpdateResponse(updated=updated, tasks=tasks)
 
     def update_task_status(
         self, task_id: int, status_data: TaskStatusUpdate
@@ -165,7 +687,9 @@ class TaskService:
             raise NotFoundException(resource="Task", resource_id=task_id)
 
         updated_task = self.task_repository.update_status(task, status_data.status)
-        return TaskResponse.model_validate(updated_task)
+        response = TaskResponse.model_validate(updated_task)
+        event_broker.publish("task.status_changed", response)
+        return response
 
     def delete_task(self, task_id: int) -> None:
         """
@@ -177,8 +701,134 @@ class TaskService:
         Raises:
             NotFoundException: If task is not found
         """
-        task = self.task_repository.get_by_id(task_id)
-        if not task:
+        # A single DELETE ... RETURNING both removes the task and tells us
+        # whether it existed, without loading it first
+        if not self.task_repository.delete_many(ids=[task_id]):
             raise NotFoundException(resource="Task", resource_id=task_id)
+        event_broker.publish("task.deleted", {"id": task_id})
+
+    def delete_tasks_bulk(self, selection: TaskSelection) -> TaskBulkDeleteResponse:
+        """
+        Delete every selected task.
+
+        Args:
+            selection: Task IDs or filters selecting the tasks to delete
+
+        Returns:
+            TaskBulkDeleteResponse with the number of deleted tasks
+        """
+        filters = selection.filter.model_dump() if selection.filter else {}
+        deleted = self.task_repository.delete_many(ids=selection.ids, **filters)
+        if deleted:
+            _publish_bulk("deleted", deleted)
+        return TaskBulkDeleteResponse(deleted=deleted)
+
+
+class AsyncTaskService:
+    """
+    Async facade over TaskService for async endpoints.
+
+    Every call runs the synchronous TaskService through the request's
+    SessionRunner, so queries are defined once in the repositories. With an
+    AsyncSession the work stays on the event loop instead of occupying a
+    threadpool thread.
+    """
 
-        self.task_repository.delete(task)
+    def __init__(self, db: SessionRunner):
+        """
+        Initialize service with a session runner.
+
+        Args:
+            db: AsyncSession or ThreadedSession
+        """
+        self.db = db
+
+    async def _run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a TaskService method against the runner's session."""
+        return await self.db.run_sync(
+            lambda session: method(TaskService(session), *args, **kwargs)
+        )
+
+    async def get_all_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        category_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        q: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> TaskListResponse:
+        """Async counterpart of TaskService.get_all_tasks."""
+        return await self._run(
+            TaskService.get_all_tasks,
+            status=status,
+            priority=priority,
+            category_id=category_id,
+            limit=limit,
+            cursor=cursor,
+            q=q,
+            due_before=due_before,
+            due_after=due_after,
+            fields=fields,
+        )
+
+    async def get_changes(
+        self, since: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> TaskChangesResponse:
+        """Async counterpart of TaskService.get_changes."""
+        return await self._run(TaskService.get_changes, since=since, limit=limit)
+
+    async def get_task_calendar(self, start: date, end: date) -> TaskCalendarResponse:
+        """Async counterpart of TaskService.get_task_calendar."""
+        return await self._run(TaskService.get_task_calendar, start, end)
+
+    async def get_task_stats(
+        self, category_id: Optional[int] = None
+    ) -> TaskStatsResponse:
+        """Async counterpart of TaskService.get_task_stats."""
+        return await self._run(TaskService.get_task_stats, category_id=category_id)
+
+    async def create_task(self, task_data: TaskCreate) -> TaskResponse:
+        """Async counterpart of TaskService.create_task."""
+        return await self._run(TaskService.create_task, task_data)
+
+    async def create_tasks_bulk(
+        self, bulk_data: TaskBulkCreate
+    ) -> TaskBulkCreateResponse:
+        """Async counterpart of TaskService.create_tasks_bulk."""
+        return await self._run(TaskService.create_tasks_bulk, bulk_data)
+
+    async def get_task_by_id(
+        self, task_id: int, fields: Optional[FrozenSet[str]] = None
+    ) -> TaskResponse:
+        """Async counterpart of TaskService.get_task_by_id."""
+        return await self._run(TaskService.get_task_by_id, task_id, fields=fields)
+
+    async def update_task(self, task_id: int, task_data: TaskUpdate) -> TaskResponse:
+        """Async counterpart of TaskService.update_task."""
+        return await self._run(TaskService.update_task, task_id, task_data)
+
+    async def update_tasks_bulk(
+        self, bulk_data: TaskBulkUpdate
+    ) -> TaskBulkUpdateResponse:
+        """Async counterpart of TaskService.update_tasks_bulk."""
+        return await self._run(TaskService.update_tasks_bulk, bulk_data)
+
+    async def update_task_status(
+        self, task_id: int, status_data: TaskStatusUpdate
+    ) -> TaskResponse:
+        """Async counterpart of TaskService.update_task_status."""
+        return await self._run(TaskService.update_task_status, task_id, status_data)
+
+    async def delete_task(self, task_id: int) -> None:
+        """Async counterpart of TaskService.delete_task."""
+        await self._run(TaskService.delete_task, task_id)
+
+    async def delete_tasks_bulk(
+        self, selection: TaskSelection
+    ) -> TaskBulkDeleteResponse:
+        """Async counterpart of TaskService.delete_tasks_bulk."""
+        return await self._run(TaskService.delete_tasks_bulk, selection)
@@ -0,0 +1,5 @@
+"""Performance benchmarks for the TaskFlow API.
+
+Run a benchmark as a module from the backend directory, e.g.:
+    python -m benchmarks.bench_bulk_create
+"""
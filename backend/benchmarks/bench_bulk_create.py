@@ -0,0 +1,58 @@
+"""Benchmark: POST /api/tasks one by one versus POST /api/tasks/bulk.
+
+Usage:
+    python -m benchmarks.bench_bulk_create [--tasks 10000]
+"""
+
+import argparse
+
+from benchmarks.common import benchmark_client, temporary_database, timed
+from app.schemas.task import BULK_MAX_ITEMS
+
+
+def main() -> None:
+    """Create the same tasks through both endpoints and compare throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument(
+        "--single-sample",
+        type=int,
+        default=1_000,
+        help="Tasks to create one by one (throughput is extrapolated)",
+    )
+    args = parser.parse_args()
+
+    payload = [
+        {"title": f"Task {i}", "priority": ["low", "medium", "high"][i % 3]}
+        for i in range(args.tasks)
+    ]
+
+    with temporary_database() as (_, session_factory):
+        with benchmark_client(session_factory) as client:
+            sample = payload[: args.single_sample]
+            single = timed(
+                lambda: [client.post("/api/tasks", json=task) for task in sample]
+            )
+
+    with temporary_database() as (_, session_factory):
+        with benchmark_client(session_factory) as client:
+            chunks = [
+                payload[i : i + BULK_MAX_ITEMS]
+                for i in range(0, len(payload), BULK_MAX_ITEMS)
+            ]
+            bulk = timed(
+                lambda: [
+                    client.post("/api/tasks/bulk", json={"tasks": chunk})
+                    for chunk in chunks
+                ]
+            )
+
+    single_rate = len(sample) / single
+    bulk_rate = args.tasks / bulk
+    print(f"single: {single_rate:10.0f} tasks/s ({len(sample)} tasks)")
+    print(f"bulk:   {bulk_rate:10.0f} tasks/s ({args.tasks} tasks)")
+    print(f"speedup: {bulk_rate / single_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
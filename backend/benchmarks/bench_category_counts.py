@@ -0,0 +1,104 @@
+"""Benchmark: per-category task counts, N+1 lazy loads versus one GROUP BY.
+
+Seeds a database with a fixed number of tasks spread over a growing number
+of categories, then times building the category list with counts once by
+touching Category.tasks for every category (one SELECT per category) and
+once through CategoryService.get_all_categories(with_counts=True), which
+GET /api/categories?with_counts=true serves from a single aggregate over
+task_counters joined to categories.
+
+Usage:
+    python -m benchmarks.bench_category_counts [--tasks 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from benchmarks.common import temporary_database
+from app.models.category import Category
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.repositories.task_stats_repository import TaskStatsRepository
+from app.services.category_service import CategoryService
+
+CATEGORY_COUNTS = [10, 100, 1000, 5000]
+
+
+def seed(session_factory, categories: int, tasks: int) -> None:
+    """Insert categories and tasks, then build the counters from the tasks."""
+    rng = random.Random(1)
+    with session_factory() as db:
+        db.execute(
+            insert(Category), [{"name": f"Category {i}"} for i in range(categories)]
+        )
+        for start in range(0, tasks, 10_000):
+            rows = [
+                {
+                    "title": f"Task {start + i}",
+                    "status": rng.choice(list(TaskStatus)),
+                    "priority": rng.choice(list(TaskPriority)),
+                    "category_id": rng.randint(1, categories),
+                }
+                for i in range(min(10_000, tasks - start))
+            ]
+            db.execute(insert(Task), rows)
+        db.commit()
+        TaskStatsRepository(db).rebuild()
+
+
+def counts_lazy(db: Session) -> int:
+    """Count tasks per status by loading Category.tasks for every category."""
+    total = 0
+    for category in db.query(Category).order_by(Category.name):
+        by_status: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        for task in category.tasks:
+            by_status[task.status] += 1
+        total += sum(by_status.values())
+    db.expire_all()
+    return total
+
+
+def counts_grouped(db: Session) -> int:
+    """Count tasks per status through the service behind the endpoint."""
+    response = CategoryService(db).get_all_categories(with_counts=True)
+    return sum(category.task_count for category in response.categories)
+
+
+def time_ms(run: Callable[[], int], repeat: int) -> Dict[str, float]:
+    """Return median time in ms and the result of the last run."""
+    samples: List[float] = []
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(samples), "tasks": result}
+
+
+def main() -> None:
+    """Seed one database per category count and compare strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for categories in CATEGORY_COUNTS:
+        with temporary_database(pragmas=True) as (_, session_factory):
+            seed(session_factory, categories, args.tasks)
+            with session_factory() as db:
+                lazy = time_ms(lambda: counts_lazy(db), args.repeat)
+                grouped = time_ms(lambda: counts_grouped(db), args.repeat)
+            assert lazy["tasks"] == grouped["tasks"] == args.tasks
+            print(
+                f"{categories:5} categories   n+1 {lazy['ms']:9.2f} ms   "
+                f"group by {grouped['ms']:8.2f} ms   {lazy['ms'] / grouped['ms']:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark: polling the change feed versus re-reading every task.
+
+Seeds databases of increasing size, takes a change feed cursor, applies a
+few updates and deletes, and times TaskService.get_changes from that cursor
+against a full read through TaskService.get_all_tasks (what re-fetching the
+whole list after each mutation costs). The feed's time should follow the
+number of changes, not the table size.
+
+Usage:
+    python -m benchmarks.bench_changes [--sizes 10000,100000] [--changes 10]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from benchmarks.bench_list_read_path import seed
+from benchmarks.common import temporary_database
+from app.core.pagination import MAX_PAGE_SIZE
+from app.schemas.task import TaskSelection, TaskUpdate
+from app.services.task_service import TaskService
+
+
+def time_ms(run: Callable[[], object], repeat: int) -> float:
+    """Return the median time of a callable in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Compare a change feed poll with a full read for several table sizes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'changes':>8} {'feed ms':>9} {'full ms':>9}")
+    for tasks in (int(size) for size in args.sizes.split(",")):
+        with temporary_database(pragmas=True) as (_, session_factory):
+            seed(session_factory, tasks)
+            with session_factory() as db:
+                service = TaskService(db)
+                cursor = service.get_changes(limit=MAX_PAGE_SIZE).next_cursor
+                while True:
+                    page = service.get_changes(since=cursor, limit=MAX_PAGE_SIZE)
+                    cursor = page.next_cursor
+                    if not page.has_more:
+                        break
+                half = args.changes // 2
+                for task_id in range(1, half + 1):
+                    service.update_task(task_id, TaskUpdate(title=f"Edited {task_id}"))
+                service.delete_tasks_bulk(
+                    TaskSelection(ids=list(range(half + 1, args.changes + 1)))
+                )
+
+                feed = time_ms(lambda: service.get_changes(since=cursor), args.repeat)
+                full = time_ms(lambda: service.get_all_tasks(limit=tasks), args.repeat)
+            print(f"{tasks:>8} {args.changes:>8} {feed:>9.2f} {full:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
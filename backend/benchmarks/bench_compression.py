@@ -0,0 +1,74 @@
+"""Benchmark: CPU cost versus bytes saved by response compression.
+
+Renders task lists of several sizes (as GET /api/tasks would send them) and
+compresses each with gzip and brotli at several levels, reporting the time
+per body and the share of bytes saved. The last column is the time a cache
+hit for the same page costs instead: nothing, since the task list cache
+keeps the compressed variant next to the plain body.
+
+Usage:
+    python -m benchmarks.bench_compression [--sizes 20,100,1000,10000] [--repeat 10]
+"""
+
+import argparse
+import gzip
+import statistics
+import time
+from typing import Callable, List
+
+import brotli
+
+from app.core.response_cache import ResponseCache
+from app.core.serialization import render_json
+from benchmarks.bench_serialization import build_page
+
+# (label, compress) pairs; the defaults in app.core.config are gzip 6 / br 4
+CODECS = [
+    ("gzip 1", lambda body: gzip.compress(body, compresslevel=1, mtime=0)),
+    ("gzip 6", lambda body: gzip.compress(body, compresslevel=6, mtime=0)),
+    ("gzip 9", lambda body: gzip.compress(body, compresslevel=9, mtime=0)),
+    ("br 1", lambda body: brotli.compress(body, quality=1)),
+    ("br 4", lambda body: brotli.compress(body, quality=4)),
+    ("br 6", lambda body: brotli.compress(body, quality=6)),
+]
+
+
+def time_ms(run: Callable[[], object], repeat: int) -> float:
+    """Return the median time of a callable in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Report compression time and savings per payload size and level."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="20,100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>6} {'KiB':>8} {'codec':>7} {'KiB out':>8} {'saved':>6} "
+        f"{'ms':>8} {'hit ms':>7}"
+    )
+    for tasks in (int(size) for size in args.sizes.split(",")):
+        body = render_json(build_page(tasks))
+        cache = ResponseCache(max_bytes=len(body) * 2, ttl=60)
+        cache.get("g", "page")
+        cache.put("g", "page", body, "gzip")
+        hit = time_ms(lambda: cache.get("g", "page", "gzip"), args.repeat)
+        for label, compress in CODECS:
+            out = compress(body)
+            elapsed = time_ms(lambda: compress(body), args.repeat)
+            print(
+                f"{tasks:>6} {len(body) / 1024:>8.1f} {label:>7} "
+                f"{len(out) / 1024:>8.1f} {1 - len(out) / len(body):>6.1%} "
+                f"{elapsed:>8.2f} {hit:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: sync (threadpool) versus async (AsyncEngine) database mode.
+
+Starts the API once per DATABASE_MODE against the same seeded SQLite file
+and drives GET /api/tasks and GET /api/tasks/{id} with many concurrent
+clients.
+
+Usage:
+    python -m benchmarks.bench_database_mode [--concurrency 50] [--requests 4000]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import httpx
+
+from benchmarks.common import load_test, running_server
+
+
+def main() -> None:
+    """Run the same load against both database modes and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=4_000)
+    parser.add_argument("--tasks", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{Path(directory) / 'benchmark.db'}"
+
+        with running_server({"DATABASE_URL": database_url}) as base_url:
+            tasks = [{"title": f"Task {i}"} for i in range(args.tasks)]
+            httpx.post(f"{base_url}/api/tasks/bulk", json={"tasks": tasks}, timeout=60)
+
+        async def make_request(client: httpx.AsyncClient, i: int) -> httpx.Response:
+            if i % 2:
+                return await client.get("/api/tasks", params={"limit": 20})
+            return await client.get(f"/api/tasks/{i % args.tasks + 1}")
+
+        for mode in ("sync", "async"):
+            env = {"DATABASE_URL": database_url, "DATABASE_MODE": mode}
+            with running_server(env) as base_url:
+                result = load_test(
+                    base_url, make_request, args.concurrency, args.requests
+                )
+            print(
+                f"{mode:>5}: {result['rps']:8.0f} req/s  "
+                f"p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms  "
+                f"errors {result['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
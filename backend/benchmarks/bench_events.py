@@ -0,0 +1,96 @@
+"""Benchmark: idle SSE subscribers and event fan-out on one event loop.
+
+Opens increasing numbers of event streams on a single asyncio loop (as one
+worker would serve them), then publishes events from another thread, as a
+service running in the threadpool does, and waits until every subscriber
+has read each one. Reports memory per idle subscriber (tracemalloc), the
+fan-out time per event and the number of threads, which stays constant.
+
+Usage:
+    python -m benchmarks.bench_events [--sizes 1000,5000,10000] [--events 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+from typing import List
+
+from app.core.events import EventBroker
+
+
+class Tally:
+    """Count frames received by all subscribers; wake up at a target."""
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.target = 0
+        self.reached = asyncio.Event()
+
+    def add(self) -> None:
+        self.received += 1
+        if self.received == self.target:
+            self.reached.set()
+
+
+async def consume(stream, ready: asyncio.Event, tally: Tally) -> None:
+    """Read a stream, counting events, until cancelled."""
+    await stream.__anext__()
+    ready.set()
+    async for frame in stream:
+        if frame.startswith(b"id:"):
+            tally.add()
+
+
+async def run(subscribers: int, events: int) -> None:
+    """Measure one subscriber count."""
+    broker = EventBroker(queue_size=256, heartbeat=15.0, retry_ms=3000)
+    tally = Tally()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    readers = []
+    for _ in range(subscribers):
+        ready = asyncio.Event()
+        readers.append(
+            asyncio.create_task(consume(broker.stream(), ready, tally))
+        )
+        await ready.wait()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    loop = asyncio.get_running_loop()
+    samples: List[float] = []
+    for sent in range(1, events + 1):
+        tally.target = subscribers * sent
+        tally.reached.clear()
+        start = time.perf_counter()
+        await loop.run_in_executor(None, broker.publish, "task.deleted", {"id": sent})
+        await tally.reached.wait()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{subscribers:>11} {(after - before) / subscribers / 1024:>13.1f} "
+        f"{statistics.median(samples):>13.2f} {threading.active_count():>8}"
+    )
+    for reader in readers:
+        reader.cancel()
+    await asyncio.gather(*readers, return_exceptions=True)
+
+
+def main() -> None:
+    """Report memory and fan-out time for several subscriber counts."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,5000,10000")
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'subscribers':>11} {'KiB/subscr.':>13} {'fan-out ms':>13} {'threads':>8}")
+    for subscribers in (int(size) for size in args.sizes.split(",")):
+        asyncio.run(run(subscribers, args.events))
+
+
+if __name__ == "__main__":
+    main()
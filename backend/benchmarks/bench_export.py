@@ -0,0 +1,74 @@
+"""Benchmark: peak memory of a full-table pull versus the streaming export.
+
+Seeds databases of increasing size and reads every task twice, server side:
+once as one TaskListResponse rendered to JSON (what a client pulling the
+table through GET /api/tasks forces the API to build) and once through the
+NDJSON and CSV exports, consuming the body chunk by chunk as Starlette does.
+Reports time and peak Python memory (tracemalloc) per path; the export's
+peak should stay flat as the table grows.
+
+Usage:
+    python -m benchmarks.bench_export [--sizes 10000,100000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from benchmarks.bench_list_read_path import seed
+from benchmarks.common import temporary_database
+from app.core.export import ExportFormat
+from app.core.serialization import render_json
+from app.services.task_service import TaskService
+
+
+def measure(run: Callable[[], int]) -> Tuple[float, float, int]:
+    """Return (seconds, peak MiB, bytes produced) of a callable."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, size
+
+
+def main() -> None:
+    """Compare memory use of both read paths for several table sizes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'path':>14} {'MiB out':>8} {'seconds':>8} {'peak MiB':>9}")
+    for tasks in (int(size) for size in args.sizes.split(",")):
+        with temporary_database(pragmas=True) as (_, session_factory):
+            seed(session_factory, tasks)
+
+            def full_list() -> int:
+                with session_factory() as db:
+                    page = TaskService(db).get_all_tasks(limit=tasks)
+                    return len(render_json(page))
+
+            def export(format: ExportFormat) -> Callable[[], int]:
+                def run() -> int:
+                    with session_factory() as db:
+                        chunks = TaskService(db).export_tasks(format=format)
+                        return sum(len(chunk) for chunk in chunks)
+
+                return run
+
+            for label, run in (
+                ("full list", full_list),
+                ("export ndjson", export(ExportFormat.NDJSON)),
+                ("export csv", export(ExportFormat.CSV)),
+            ):
+                elapsed, peak, size = measure(run)
+                print(
+                    f"{tasks:>8} {label:>14} {size / 2**20:>8.1f} "
+                    f"{elapsed:>8.2f} {peak:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark: file import versus one create call per task.
+
+Writes NDJSON and CSV files of generated tasks (categories referenced by
+name) and imports them through TaskService.import_tasks, reporting tasks
+per second and peak Python memory (tracemalloc), which should not grow with
+the file size. For comparison, a sample of tasks is created one by one with
+TaskService.create_task, as a client looping over POST /api/tasks would.
+
+Usage:
+    python -m benchmarks.bench_import [--sizes 10000,100000] [--single 1000]
+"""
+
+import argparse
+import csv
+import json
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from sqlalchemy import insert
+
+from benchmarks.common import temporary_database
+from app.core.export import ExportFormat
+from app.models.category import Category
+from app.schemas.task import TaskCreate
+from app.services.task_service import TaskService
+
+CATEGORIES = 50
+
+
+def task_fields(i: int) -> dict:
+    """Return the fields of generated task i."""
+    return {
+        "title": f"Legacy task {i}",
+        "description": "Imported from the old tracker " * 3,
+        "status": ("todo", "in_progress", "completed")[i % 3],
+        "priority": ("low", "medium", "high")[i % 3],
+        "category_name": f"Category {i % CATEGORIES}",
+        "due_date": "2026-01-01T09:00:00",
+    }
+
+
+def write_file(tasks: int, format: ExportFormat, path: str) -> None:
+    """Write an import file of generated tasks."""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        if format == ExportFormat.CSV:
+            writer = csv.DictWriter(file, fieldnames=list(task_fields(0)))
+            writer.writeheader()
+            writer.writerows(task_fields(i) for i in range(tasks))
+        else:
+            file.writelines(json.dumps(task_fields(i)) + "\n" for i in range(tasks))
+
+
+def measure(run: Callable[[], object]) -> Tuple[float, float]:
+    """Return (seconds, peak MiB) of a callable."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Compare import throughput and memory with single creates."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--single", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'path':>14} {'seconds':>8} {'tasks/s':>9} {'peak MiB':>9}")
+    for tasks in (int(size) for size in args.sizes.split(",")):
+        for format in ExportFormat:
+            with temporary_database(pragmas=True) as (_, session_factory):
+                with session_factory() as db:
+                    db.execute(
+                        insert(Category),
+                        [{"name": f"Category {i}"} for i in range(CATEGORIES)],
+                    )
+                    db.commit()
+                with tempfile.NamedTemporaryFile(suffix=f".{format.value}") as upload:
+                    write_file(tasks, format, upload.name)
+
+                    def run() -> None:
+                        with session_factory() as db, open(upload.name, "rb") as file:
+                            result = TaskService(db).import_tasks(file, format)
+                        assert result.created == tasks, result.errors[:3]
+
+                    elapsed, peak = measure(run)
+                print(
+                    f"{tasks:>8} {'import ' + format.value:>14} {elapsed:>8.2f} "
+                    f"{tasks / elapsed:>9.0f} {peak:>9.1f}"
+                )
+
+    with temporary_database(pragmas=True) as (_, session_factory):
+        with session_factory() as db:
+            service = TaskService(db)
+            start = time.perf_counter()
+            for i in range(args.single):
+                fields = task_fields(i)
+                del fields["category_name"]
+                service.create_task(TaskCreate(**fields))
+            elapsed = time.perf_counter() - start
+    print(
+        f"{args.single:>8} {'create_task':>14} {elapsed:>8.2f} "
+        f"{args.single / elapsed:>9.0f} {'':>9}"
+    )
+
+
+if __name__ == "__main__":
+    main()
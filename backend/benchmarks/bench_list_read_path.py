@@ -0,0 +1,137 @@
+"""Benchmark: list responses built from ORM objects versus plain column rows.
+
+Seeds a database with tasks spread over categories, then builds the task
+and category list responses twice: once from hydrated ORM objects
+(a count plus a Task query with the joined category, a Category query) and
+once through the column-based read path used by the list endpoints
+(TaskRepository.get_page, CategoryService.get_all_categories). Reports rows
+per second including response model construction.
+
+Usage:
+    python -m benchmarks.bench_list_read_path [--tasks 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+from benchmarks.common import temporary_database
+from app.models.category import Category
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.repositories.task_repository import TaskRepository
+from app.schemas.category import CategoryResponse
+from app.schemas.task import TaskResponse
+from app.services.category_service import CategoryService
+
+PAGE_SIZES = [20, 100, 1000, 10_000]
+CATEGORIES = 1000
+
+
+def seed(session_factory, tasks: int) -> None:
+    """Insert categories and tasks in large batches."""
+    rng = random.Random(3)
+    with session_factory() as db:
+        db.execute(
+            insert(Category),
+            [{"name": f"Category {i}", "color": "#3B82F6"} for i in range(CATEGORIES)],
+        )
+        for start in range(0, tasks, 10_000):
+            rows = [
+                {
+                    "title": f"Task {start + i}",
+                    "description": "Benchmark task description " * 3,
+                    "status": rng.choice(list(TaskStatus)),
+                    "priority": rng.choice(list(TaskPriority)),
+                    "category_id": rng.choice([None, rng.randint(1, CATEGORIES)]),
+                }
+                for i in range(min(10_000, tasks - start))
+            ]
+            db.execute(insert(Task), rows)
+        db.commit()
+
+
+def tasks_orm(db: Session, limit: int) -> int:
+    """Build task responses from ORM objects with the joined category."""
+    # get_page reads the total too; count it here as well
+    db.execute(select(func.count(Task.id))).scalar()
+    tasks = (
+        db.query(Task)
+        .options(joinedload(Task.category))
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(limit)
+        .all()
+    )
+    responses = [TaskResponse.model_validate(task) for task in tasks]
+    db.expunge_all()
+    return len(responses)
+
+
+def tasks_rows(db: Session, limit: int) -> int:
+    """Build task responses from the column-based page query."""
+    page = TaskRepository(db).get_page(limit=limit)
+    responses = [TaskResponse.model_validate(task) for task in page.tasks]
+    return len(responses)
+
+
+def categories_orm(db: Session) -> int:
+    """Build category responses from ORM objects."""
+    categories = db.query(Category).order_by(Category.name).all()
+    responses = [CategoryResponse.model_validate(category) for category in categories]
+    db.expunge_all()
+    return len(responses)
+
+
+def categories_rows(db: Session) -> int:
+    """Build the category list response as GET /api/categories does."""
+    return CategoryService(db).get_all_categories().total
+
+
+def rows_per_second(run: Callable[[], int], repeat: int) -> float:
+    """Return rows per second of the median run."""
+    samples: List[float] = []
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run()
+        samples.append(time.perf_counter() - start)
+    return rows / statistics.median(samples)
+
+
+def report(label: str, rates: Dict[str, float]) -> None:
+    """Print one comparison line."""
+    print(
+        f"{label:24} orm {rates['orm']:10.0f} rows/s   "
+        f"rows {rates['rows']:10.0f} rows/s   {rates['rows'] / rates['orm']:5.1f}x"
+    )
+
+
+def main() -> None:
+    """Seed one database and compare both read paths per page size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with temporary_database(pragmas=True) as (_, session_factory):
+        seed(session_factory, args.tasks)
+        with session_factory() as db:
+            for limit in PAGE_SIZES:
+                rates = {
+                    "orm": rows_per_second(lambda: tasks_orm(db, limit), args.repeat),
+                    "rows": rows_per_second(lambda: tasks_rows(db, limit), args.repeat),
+                }
+                report(f"tasks, page of {limit}", rates)
+            rates = {
+                "orm": rows_per_second(lambda: categories_orm(db), args.repeat),
+                "rows": rows_per_second(lambda: categories_rows(db), args.repeat),
+            }
+            report(f"{CATEGORIES} categories", rates)
+
+
+if __name__ == "__main__":
+    main()
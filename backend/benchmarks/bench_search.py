@@ -0,0 +1,115 @@
+"""Benchmark: full-text search (FTS5, bm25) versus a LIKE '%term%' scan.
+
+Seeds a database with generated tasks, then times the first page of results
+plus the total count for words of different frequencies, once through
+TaskRepository.get_page(search=...) and once with an equivalent LIKE query.
+
+Usage:
+    python -m benchmarks.bench_search [--tasks 1000000] [--repeat 20]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import temporary_database
+from app.core.search import build_search_query
+from app.models.task import Task
+from app.repositories.task_repository import TaskRepository
+
+# Common words shared by many tasks, plus a long tail of rarer ones
+COMMON_WORDS = ["review", "update", "fix", "plan", "call", "write", "check", "send"]
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa", "do", "gu"]
+PAGE_SIZE = 20
+
+
+def vocabulary(size: int) -> List[str]:
+    """Build a list of distinct pseudo-words."""
+    rng = random.Random(1)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def seed(session_factory, tasks: int, words: List[str]) -> None:
+    """Insert generated tasks in large batches; triggers index them."""
+    rng = random.Random(2)
+    table = Task.__table__
+    with session_factory() as db:
+        for start in range(0, tasks, 10_000):
+            rows = [
+                {
+                    "title": f"{rng.choice(COMMON_WORDS)} {' '.join(rng.choices(words, k=2))}",
+                    "description": " ".join(rng.choices(words, k=8)),
+                }
+                for _ in range(min(10_000, tasks - start))
+            ]
+            db.execute(insert(table), rows)
+            db.commit()
+
+
+def search_fts(db: Session, word: str) -> int:
+    """First page and total through the full-text index."""
+    page = TaskRepository(db).get_page(limit=PAGE_SIZE, search=build_search_query(word))
+    return page.total
+
+
+def search_like(db: Session, word: str) -> int:
+    """First page and total with a LIKE scan over title and description."""
+    pattern = f"%{word}%"
+    criterion = or_(Task.title.like(pattern), Task.description.like(pattern))
+    db.execute(
+        select(Task)
+        .where(criterion)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(PAGE_SIZE)
+    ).all()
+    return db.execute(select(func.count(Task.id)).where(criterion)).scalar()
+
+
+def time_ms(run: Callable[[], int], repeat: int) -> Dict[str, float]:
+    """Return median time in ms and the result of the last run."""
+    samples = []
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(samples), "matches": result}
+
+
+def main() -> None:
+    """Seed the database and compare search strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    words = vocabulary(args.vocabulary)
+    with temporary_database(pragmas=True) as (_, session_factory):
+        start = time.perf_counter()
+        seed(session_factory, args.tasks, words)
+        print(f"seeded {args.tasks} tasks in {time.perf_counter() - start:.1f}s")
+
+        # A frequent title word, a typical vocabulary word and a missing one
+        terms = {"common": COMMON_WORDS[0], "typical": words[len(words) // 2], "absent": "zzzz"}
+        with session_factory() as db:
+            for label, word in terms.items():
+                fts = time_ms(lambda: search_fts(db, word), args.repeat)
+                like = time_ms(lambda: search_like(db, word), max(1, args.repeat // 10))
+                print(
+                    f"{label:8} {word!r:12} fts {fts['ms']:9.2f} ms "
+                    f"({fts['matches']} matches)   like {like['ms']:9.2f} ms "
+                    f"({like['matches']} matches)   {like['ms'] / fts['ms']:7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
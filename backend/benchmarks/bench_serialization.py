@@ -0,0 +1,105 @@
+"""Benchmark: response_model serialization versus pre-serialized responses.
+
+Builds a TaskListResponse with a large number of tasks and serves it from
+two minimal apps: one returning the model and letting FastAPI validate and
+encode it through response_model (the former path of every endpoint), and
+one returning ModelJSONResponse, which renders the model in a single pass.
+Checks both bodies are identical and reports the time per response.
+
+Usage:
+    python -m benchmarks.bench_serialization [--tasks 10000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.serialization import ModelJSONResponse, render_json
+from app.models.task import TaskPriority, TaskStatus
+from app.schemas.category import CategoryResponse
+from app.schemas.task import TaskListResponse, TaskResponse
+
+
+def build_page(tasks: int) -> TaskListResponse:
+    """Build a validated task list with realistic field values."""
+    now = datetime(2025, 10, 22, 10, 0, 0, 123456)
+    categories = [
+        CategoryResponse(id=i, name=f"Category {i}", color="#3B82F6") for i in range(10)
+    ]
+    return TaskListResponse(
+        tasks=[
+            TaskResponse(
+                id=i,
+                title=f"Task {i} – prepare the quarterly report",
+                description="Collect the numbers, write the summary and send it. " * 2,
+                status=list(TaskStatus)[i % 3],
+                priority=list(TaskPriority)[i % 3],
+                category_id=i % 10 if i % 4 else None,
+                category=categories[i % 10] if i % 4 else None,
+                due_date=now + timedelta(days=i % 30) if i % 2 else None,
+                created_at=now - timedelta(minutes=i),
+                updated_at=now,
+            )
+            for i in range(tasks)
+        ],
+        total=tasks,
+        next_cursor=None,
+    )
+
+
+def make_apps(page: TaskListResponse):
+    """Create the response_model app and the pre-serialized app."""
+    validated = FastAPI()
+
+    @validated.get("/", response_model=TaskListResponse)
+    def via_response_model():
+        return page
+
+    direct = FastAPI()
+
+    @direct.get("/", response_model=TaskListResponse)
+    def via_model_response():
+        return ModelJSONResponse(page)
+
+    return TestClient(validated), TestClient(direct)
+
+
+def time_ms(run: Callable[[], object], repeat: int) -> float:
+    """Return the median time of a callable in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Compare both serialization paths for one large page."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page(args.tasks)
+    validated, direct = make_apps(page)
+    body = direct.get("/").content
+    assert validated.get("/").content == body
+
+    render = time_ms(lambda: render_json(page), args.repeat)
+    before = time_ms(lambda: validated.get("/"), args.repeat)
+    after = time_ms(lambda: direct.get("/"), args.repeat)
+    print(f"payload:          {len(body) / 1024:10.1f} KiB ({args.tasks} tasks)")
+    print(f"response_model:   {before:10.2f} ms per request")
+    print(f"pre-serialized:   {after:10.2f} ms per request")
+    print(f"render_json only: {render:10.2f} ms")
+    print(f"speedup:          {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
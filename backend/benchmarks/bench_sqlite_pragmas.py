@@ -0,0 +1,119 @@
+"""Benchmark: mixed read/write throughput with SQLite defaults versus tuned PRAGMAs.
+
+Runs the same workload twice, each on a fresh database: worker threads
+repeatedly list tasks or read stats (reads) and create tasks or change their
+status (writes). The first run uses SQLite's defaults (rollback journal,
+synchronous=FULL), the second the PRAGMAs configured in settings (WAL,
+synchronous=NORMAL, larger cache, mmap, ...).
+
+Usage:
+    python -m benchmarks.bench_sqlite_pragmas [--threads 8] [--seconds 10] [--write-ratio 0.2]
+"""
+
+import argparse
+import random
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import temporary_database
+from app.models.task import TaskStatus
+from app.schemas.task import TaskBulkCreate, TaskCreate, TaskStatusUpdate
+from app.services.task_service import TaskService
+
+
+def seed(session_factory: sessionmaker, tasks: int) -> None:
+    """Insert the initial tasks."""
+    with session_factory() as db:
+        TaskService(db).create_tasks_bulk(
+            TaskBulkCreate(tasks=[TaskCreate(title=f"Task {i}") for i in range(tasks)])
+        )
+
+
+def run_workload(
+    session_factory: sessionmaker, threads: int, seconds: float, write_ratio: float, tasks: int
+) -> Dict[str, float]:
+    """
+    Run the mixed workload and count completed operations.
+
+    Returns:
+        Dict with reads/s, writes/s and failed operations
+    """
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def worker(seed_value: int) -> None:
+        rng = random.Random(seed_value)
+        statuses = list(TaskStatus)
+        while time.perf_counter() < deadline:
+            is_write = rng.random() < write_ratio
+            with session_factory() as db:
+                service = TaskService(db)
+                try:
+                    if is_write and rng.random() < 0.5:
+                        service.create_task(TaskCreate(title="New task"))
+                    elif is_write:
+                        service.update_task_status(
+                            rng.randint(1, tasks),
+                            TaskStatusUpdate(status=rng.choice(statuses)),
+                        )
+                    elif rng.random() < 0.5:
+                        service.get_all_tasks(limit=20)
+                    else:
+                        service.get_task_stats()
+                except exc.OperationalError:
+                    db.rollback()
+                    key = "errors"
+                else:
+                    key = "writes" if is_write else "reads"
+            with lock:
+                counts[key] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return {
+        "reads_per_s": counts["reads"] / seconds,
+        "writes_per_s": counts["writes"] / seconds,
+        "errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    """Run the workload with and without the PRAGMAs and compare throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--tasks", type=int, default=5_000)
+    args = parser.parse_args()
+
+    results = {}
+    for label, pragmas in (("defaults", False), ("pragmas", True)):
+        with temporary_database(pragmas=pragmas) as (_, session_factory):
+            seed(session_factory, args.tasks)
+            results[label] = run_workload(
+                session_factory, args.threads, args.seconds, args.write_ratio, args.tasks
+            )
+
+    for label, result in results.items():
+        total = result["reads_per_s"] + result["writes_per_s"]
+        print(
+            f"{label:9} {total:8.0f} ops/s  "
+            f"(reads {result['reads_per_s']:7.0f}/s, "
+            f"writes {result['writes_per_s']:6.0f}/s, "
+            f"errors {result['errors']:.0f})"
+        )
+    before = results["defaults"]["reads_per_s"] + results["defaults"]["writes_per_s"]
+    after = results["pragmas"]["reads_per_s"] + results["pragmas"]["writes_per_s"]
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
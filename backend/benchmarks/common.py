@@ -0,0 +1,184 @@
+"""Shared helpers for benchmarks."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Generator, Iterator, List, Tuple
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.database import Base, configure_sqlite, get_db, get_session_factory
+from app.main import app
+
+
+@contextmanager
+def temporary_database(pragmas: bool = False) -> Iterator[Tuple[Engine, sessionmaker]]:
+    """
+    Create a throwaway file-based SQLite database with the full schema.
+
+    Args:
+        pragmas: Apply the configured SQLite PRAGMAs (WAL, mmap, ...) like
+            the application engine does; otherwise use SQLite's defaults
+
+    Yields:
+        Tuple of (engine, session factory)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{Path(directory) / 'benchmark.db'}"
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        if pragmas:
+            configure_sqlite(engine)
+        Base.metadata.create_all(bind=engine)
+        try:
+            yield engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        finally:
+            engine.dispose()
+
+
+@contextmanager
+def benchmark_client(session_factory: sessionmaker) -> Iterator[TestClient]:
+    """
+    Create a test client whose requests use the given session factory.
+
+    Args:
+        session_factory: Session factory bound to the benchmark database
+
+    Yields:
+        TestClient: FastAPI test client
+    """
+
+    def override_get_db() -> Generator[Session, None, None]:
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+def timed(func: Callable[[], object]) -> float:
+    """
+    Run a callable once and return the elapsed wall time in seconds.
+
+    Args:
+        func: Callable to time
+
+    Returns:
+        Elapsed seconds
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+@contextmanager
+def running_server(env: Dict[str, str], port: int = 8765) -> Iterator[str]:
+    """
+    Run the API in a uvicorn subprocess until the context exits.
+
+    Args:
+        env: Extra environment variables (settings) for the server
+        port: Port to listen on
+
+    Yields:
+        Base URL of the running server
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, "DEBUG": "false", **env},
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def load_test(
+    base_url: str,
+    make_request: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    concurrency: int,
+    requests: int,
+) -> Dict[str, float]:
+    """
+    Fire requests with a fixed number of concurrent clients.
+
+    Args:
+        base_url: Server base URL
+        make_request: Coroutine function issuing request number i
+        concurrency: Number of requests in flight at once
+        requests: Total number of requests
+
+    Returns:
+        Dict with requests per second, p50/p99 latency in ms and error count
+    """
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker(client: httpx.AsyncClient, queue: "asyncio.Queue[int]") -> None:
+        nonlocal errors
+        while not queue.empty():
+            i = queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                response = await make_request(client, i)
+            except httpx.TransportError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    async def run() -> float:
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for i in range(requests):
+            queue.put_nowait(i)
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(
+            base_url=base_url, limits=limits, timeout=60
+        ) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(worker(client, queue) for _ in range(concurrency)))
+            return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
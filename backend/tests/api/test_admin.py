@@ -0,0 +1,60 @@
+"""Tests for admin and diagnostics endpoints."""
+
+from fastapi.testclient import TestClient
+
+
+class TestPoolStatsEndpoint:
+    """Test suite for GET /api/admin/pool."""
+
+    def test_get_pool_stats(self, client: TestClient):
+        """Test pool statistics are reported for the primary engine."""
+        response = client.get("/api/admin/pool")
+        assert response.status_code == 200
+
+        primary = response.json()["engines"]["primary"]
+        assert primary["pool_class"] == "MonitoredQueuePool"
+        for field in ("size", "checked_out", "idle", "overflow", "checkouts"):
+            assert primary[field] >= 0
+        assert "wait_ms_p99" in primary
+
+
+class TestCacheStatsEndpoint:
+    """Test suite for GET /api/admin/cache."""
+
+    def test_category_cache_counters(self, client: TestClient, sample_category):
+        """Test category lookups show up as cache misses, then hits."""
+        for _ in range(3):
+            client.get(f"/api/categories/{sample_category['id']}")
+
+        response = client.get("/api/admin/cache")
+        assert response.status_code == 200
+
+        categories = response.json()["caches"]["categories"]
+        assert categories["size"] == 1
+        assert categories["loads"] == 1
+        assert categories["misses"] == 1
+        assert categories["hits"] == 2
+
+    def test_category_write_invalidates(self, client: TestClient, sample_category):
+        """Test creating a category invalidates the cache."""
+        client.get(f"/api/categories/{sample_category['id']}")
+        client.post("/api/categories", json={"name": "Personal"})
+
+        categories = client.get("/api/admin/cache").json()["caches"]["categories"]
+        assert categories["invalidations"] == 1
+        assert categories["size"] == 0
+
+
+class TestEventStatsEndpoint:
+    """Test suite for GET /api/admin/events."""
+
+    def test_get_event_stats(self, client: TestClient):
+        """Test the broker's configuration and counters are reported."""
+        response = client.get("/api/admin/events")
+        assert response.status_code == 200
+
+        stats = response.json()
+        assert stats["subscribers"] == 0
+        assert stats["queue_size"] == 256
+        assert stats["heartbeat"] == 15.0
+        assert stats["published"] >= 0 and stats["resyncs"] >= 0
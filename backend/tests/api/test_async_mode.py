@@ -0,0 +1,67 @@
+"""Tests for the API running in async database mode."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import async_database_url
+
+
+class TestAsyncDatabaseMode:
+    """Test suite for endpoints served through AsyncSession."""
+
+    def test_task_workflow(self, async_client: TestClient, sample_category):
+        """Test create, read, update, list and delete through the async path."""
+        response = async_client.post(
+            "/api/tasks",
+            json={"title": "Async task", "category_id": sample_category["id"]},
+        )
+        assert response.status_code == 201
+        task = response.json()
+        assert task["category"]["name"] == sample_category["name"]
+
+        response = async_client.patch(
+            f"/api/tasks/{task['id']}/status", json={"status": "completed"}
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+
+        response = async_client.get("/api/tasks")
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+        response = async_client.get("/api/tasks/stats")
+        assert response.json()["by_status"]["completed"] == 1
+
+        response = async_client.delete(f"/api/tasks/{task['id']}")
+        assert response.status_code == 204
+
+        response = async_client.get(f"/api/tasks/{task['id']}")
+        assert response.status_code == 404
+
+    def test_category_workflow(self, async_client: TestClient):
+        """Test category endpoints through the async path."""
+        response = async_client.post("/api/categories", json={"name": "Async"})
+        assert response.status_code == 201
+
+        response = async_client.post("/api/categories", json={"name": "Async"})
+        assert response.status_code == 409
+
+        response = async_client.get("/api/categories")
+        assert response.json()["total"] == 1
+
+
+class TestAsyncDatabaseUrl:
+    """Test suite for deriving async driver URLs."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("sqlite:///./taskflow.db", "sqlite+aiosqlite:///./taskflow.db"),
+            ("sqlite+pysqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+            ("postgresql://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+            ("sqlite+aiosqlite:///x.db", "sqlite+aiosqlite:///x.db"),
+        ],
+    )
+    def test_async_database_url(self, url: str, expected: str):
+        """Test that sync URLs map to their async drivers."""
+        assert async_database_url(url) == expected
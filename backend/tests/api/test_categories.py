@@ -2,6 +2,9 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.services.category_service import CategoryService
 
 
 class TestCategoryEndpoints:
@@ -76,6 +79,14 @@ class TestCategoryEndpoints:
 
         assert response.status_code == 422
 
+    def test_list_builds_no_orm_objects(self, db, sample_category):
+        """Test the category list is read as plain rows."""
+        db.expunge_all()
+        categories = CategoryService(db).get_all_categories()
+
+        assert categories.categories[0].name == sample_category["name"]
+        assert len(db.identity_map) == 0
+
     def test_get_category_by_id_success(self, client: TestClient, sample_category):
         """Test getting a category by ID successfully."""
         response = client.get(f"/api/categories/{sample_category['id']}")
@@ -93,3 +104,92 @@ class TestCategoryEndpoints:
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["message"]
+
+
+class TestCategoryCounts:
+    """Test suite for category listing with task counts."""
+
+    def test_without_counts_keeps_plain_shape(self, client: TestClient, sample_task):
+        """Test that counts are only included when requested."""
+        response = client.get("/api/categories")
+
+        assert response.status_code == 200
+        category = response.json()["categories"][0]
+        assert set(category) == {"id", "name", "color"}
+
+    def test_counts_per_category(self, client: TestClient, sample_category):
+        """Test total and per-status counts for each category."""
+        other = client.post("/api/categories", json={"name": "Personal"}).json()
+        for status in ["todo", "todo", "completed"]:
+            client.post(
+                "/api/tasks",
+                json={
+                    "title": f"{status} task",
+                    "status": status,
+                    "category_id": sample_category["id"],
+                },
+            )
+        client.post("/api/tasks", json={"title": "Uncategorized"})
+
+        response = client.get("/api/categories", params={"with_counts": True})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        by_id = {category["id"]: category for category in data["categories"]}
+        assert by_id[sample_category["id"]]["task_count"] == 3
+        assert by_id[sample_category["id"]]["by_status"] == {
+            "todo": 2,
+            "in_progress": 0,
+            "completed": 1,
+        }
+        assert by_id[other["id"]]["task_count"] == 0
+        assert by_id[other["id"]]["by_status"] == {
+            "todo": 0,
+            "in_progress": 0,
+            "completed": 0,
+        }
+
+    def test_counts_follow_updates_and_deletes(
+        self, client: TestClient, sample_category
+    ):
+        """Test that counts reflect status changes and deletions."""
+        task = client.post(
+            "/api/tasks",
+            json={"title": "Counted", "category_id": sample_category["id"]},
+        ).json()
+        client.patch(f"/api/tasks/{task['id']}/status", json={"status": "completed"})
+        data = client.get("/api/categories?with_counts=true").json()
+        assert data["categories"][0]["by_status"]["completed"] == 1
+
+        client.delete(f"/api/tasks/{task['id']}")
+        data = client.get("/api/categories?with_counts=true").json()
+        assert data["categories"][0]["task_count"] == 0
+
+    def test_counts_use_single_query(self, client: TestClient, db):
+        """Test that counts are read without a query per category."""
+        for i in range(5):
+            category = client.post("/api/categories", json={"name": f"C{i}"}).json()
+            client.post(
+                "/api/tasks", json={"title": f"Task {i}", "category_id": category["id"]}
+            )
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+            # The conditional GET validator lookup is not a category query
+            if statement.lstrip().upper().startswith("SELECT") and (
+                "table_versions" not in statement
+            ):
+                statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = client.get("/api/categories?with_counts=true")
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 200
+        assert [c["task_count"] for c in response.json()["categories"]] == [1] * 5
+        assert len(statements) == 1
@@ -0,0 +1,235 @@
+"""Tests for conditional GETs (ETag / Last-Modified and 304 responses)."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app.core.conditional import etag_matches
+from app.models.table_version import TableVersion
+
+
+def _set_write_time(db: Session, when: datetime) -> datetime:
+    """Set every recorded write time, e.g. to a past second."""
+    db.execute(update(TableVersion).values(updated_at=when))
+    db.commit()
+    return when
+
+
+def _an_hour_ago() -> datetime:
+    """Return a whole-second time an hour in the past."""
+    return datetime.utcnow().replace(microsecond=0) - timedelta(hours=1)
+
+
+class TestConditionalGet:
+    """Test suite for ETag and Last-Modified validators."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/tasks",
+            "/api/tasks?status=todo",
+            "/api/tasks/stats",
+            "/api/tasks/calendar?from=2025-10-01&to=2025-10-31",
+            "/api/categories",
+            "/api/categories?with_counts=true",
+        ],
+    )
+    def test_revalidation_returns_304(self, client: TestClient, path):
+        """Test a request carrying the current ETag gets an empty 304."""
+        client.post("/api/tasks", json={"title": "Task"})
+
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.parametrize("path", ["/api/tasks", "/api/tasks/stats"])
+    def test_304_keeps_vary(self, client: TestClient, path):
+        """Test a 304 names Accept-Encoding in Vary once, like the 200."""
+        client.post("/api/tasks", json={"title": "Task"})
+        headers = {"Accept-Encoding": "gzip, br"}
+        response = client.get(path, headers=headers)
+        assert response.headers.get_list("vary") == ["Accept-Encoding"]
+
+        headers["If-None-Match"] = response.headers["etag"]
+        response = client.get(path, headers=headers)
+        assert response.status_code == 304
+        assert response.headers.get_list("vary") == ["Accept-Encoding"]
+
+    def test_item_endpoints(self, client: TestClient, sample_category):
+        """Test single task and category responses are revalidated too."""
+        task = client.post(
+            "/api/tasks", json={"title": "Task", "category_id": sample_category["id"]}
+        ).json()
+
+        for path in (f"/api/tasks/{task['id']}", f"/api/categories/{sample_category['id']}"):
+            etag = client.get(path).headers["etag"]
+            response = client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    def test_task_write_changes_etag(self, client: TestClient):
+        """Test every kind of task write produces a new ETag."""
+        task = client.post("/api/tasks", json={"title": "Task"}).json()
+        seen = {client.get("/api/tasks").headers["etag"]}
+
+        writes = [
+            lambda: client.put(f"/api/tasks/{task['id']}", json={"title": "Renamed"}),
+            lambda: client.patch(
+                f"/api/tasks/{task['id']}/status", json={"status": "completed"}
+            ),
+            lambda: client.patch(
+                "/api/tasks", json={"ids": [task["id"]], "changes": {"priority": "high"}}
+            ),
+            lambda: client.post("/api/tasks/bulk", json={"tasks": [{"title": "B"}]}),
+            lambda: client.delete(f"/api/tasks/{task['id']}"),
+        ]
+        for write in writes:
+            assert write().status_code < 300
+            etag = client.get("/api/tasks").headers["etag"]
+            assert etag not in seen
+            seen.add(etag)
+
+    def test_stats_rebuild_changes_etag(self, client: TestClient, db: Session):
+        """Test rebuilt counters are not revalidated against the old ETag."""
+        from app.repositories.task_stats_repository import TaskStatsRepository
+
+        client.post("/api/tasks", json={"title": "Task"})
+        etag = client.get("/api/tasks/stats").headers["etag"]
+
+        TaskStatsRepository(db).rebuild()
+
+        response = client.get("/api/tasks/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    def test_stale_etag_gets_fresh_response(self, client: TestClient):
+        """Test a client holding an old ETag receives the new list."""
+        etag = client.get("/api/tasks").headers["etag"]
+        client.post("/api/tasks", json={"title": "New"})
+
+        response = client.get("/api/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    def test_category_write_changes_task_etag(self, client: TestClient):
+        """Test task responses, which embed categories, follow category writes."""
+        etag = client.get("/api/tasks").headers["etag"]
+        client.post("/api/categories", json={"name": "Work"})
+
+        response = client.get("/api/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    def test_noop_bulk_update_keeps_etag(self, client: TestClient):
+        """Test a bulk update matching no task leaves the ETag unchanged."""
+        client.post("/api/tasks", json={"title": "Task"})
+        etag = client.get("/api/tasks").headers["etag"]
+
+        client.patch(
+            "/api/tasks",
+            json={"filter": {"status": "completed"}, "changes": {"priority": "high"}},
+        )
+        response = client.get("/api/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_304_skips_list_query(self, client: TestClient, db: Session):
+        """Test a 304 only reads the table versions."""
+        client.post("/api/tasks", json={"title": "Task"})
+        etag = client.get("/api/tasks").headers["etag"]
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = client.get("/api/tasks", headers={"If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "table_versions" in statements[0]
+
+    def test_if_modified_since(self, client: TestClient, db: Session):
+        """Test If-Modified-Since once the last write is in a past second."""
+        client.post("/api/tasks", json={"title": "Task"})
+        written = _set_write_time(db, _an_hour_ago())
+
+        response = client.get("/api/tasks")
+        last_modified = response.headers["last-modified"]
+        assert last_modified == format_datetime(
+            written.replace(tzinfo=timezone.utc), usegmt=True
+        )
+
+        response = client.get("/api/tasks", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        earlier = format_datetime(
+            (written - timedelta(seconds=1)).replace(tzinfo=timezone.utc), usegmt=True
+        )
+        response = client.get("/api/tasks", headers={"If-Modified-Since": earlier})
+        assert response.status_code == 200
+
+    def test_recent_write_has_no_last_modified(self, client: TestClient, db: Session):
+        """Test no one-second-resolution date is used while its second is open."""
+        client.post("/api/tasks", json={"title": "Task"})
+        written = _set_write_time(db, datetime.utcnow() + timedelta(minutes=1))
+        now = format_datetime(written.replace(tzinfo=timezone.utc), usegmt=True)
+
+        response = client.get("/api/tasks", headers={"If-Modified-Since": now})
+        assert response.status_code == 200
+        assert "last-modified" not in response.headers
+
+    def test_if_none_match_takes_precedence(self, client: TestClient, db: Session):
+        """Test a stale ETag wins over a matching If-Modified-Since."""
+        client.post("/api/tasks", json={"title": "Task"})
+        _set_write_time(db, _an_hour_ago())
+        response = client.get("/api/tasks")
+
+        response = client.get(
+            "/api/tasks",
+            headers={
+                "If-None-Match": 'W/"stale"',
+                "If-Modified-Since": response.headers["last-modified"],
+            },
+        )
+        assert response.status_code == 200
+
+    def test_async_mode(self, async_client: TestClient):
+        """Test validators work with the async session runner."""
+        async_client.post("/api/tasks", json={"title": "Task"})
+        etag = async_client.get("/api/tasks").headers["etag"]
+
+        response = async_client.get("/api/tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestEtagMatching:
+    """Test suite for If-None-Match parsing."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ('W/"1-2"', True),
+            ('"1-2"', True),
+            ('W/"0-0", W/"1-2"', True),
+            ("*", True),
+            ('W/"1-3"', False),
+            ("", False),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        """Test weak comparison against a list of tags."""
+        assert etag_matches(header, 'W/"1-2"') is expected
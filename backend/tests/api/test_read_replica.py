@@ -0,0 +1,87 @@
+"""Tests for read/write session routing with a read replica."""
+
+from typing import Dict, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import database
+from app.core.database import create_db_engine
+from app.main import app
+from tests.conftest import TestingSessionLocal, engine as primary_engine
+
+# The test database opened read-only, standing in for a replica
+REPLICA_DATABASE_URL = "sqlite:///file:./test_taskflow.db?mode=ro&uri=true"
+
+
+@pytest.fixture
+def statements(db: Session, monkeypatch) -> Generator[Dict[str, int], None, None]:
+    """
+    Route sessions to the test primary and a read-only replica.
+
+    Yields:
+        Number of statements executed on each engine
+    """
+    replica_engine = create_db_engine(REPLICA_DATABASE_URL)
+    counts = {"primary": 0, "replica": 0}
+
+    def counter(name: str):
+        def count(*args) -> None:
+            counts[name] += 1
+
+        return count
+
+    primary_listener = counter("primary")
+    event.listen(primary_engine, "before_cursor_execute", primary_listener)
+    event.listen(replica_engine, "before_cursor_execute", counter("replica"))
+    monkeypatch.setattr(database, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(
+        database,
+        "ReadSessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, bind=replica_engine),
+    )
+    try:
+        yield counts
+    finally:
+        event.remove(primary_engine, "before_cursor_execute", primary_listener)
+        replica_engine.dispose()
+
+
+@pytest.fixture
+def routed_client(statements: Dict[str, int]) -> TestClient:
+    """Test client using the real get_db routing."""
+    return TestClient(app)
+
+
+class TestReadReplicaRouting:
+    """Test suite for routing GET requests to the read engine."""
+
+    def test_writes_use_primary(self, routed_client: TestClient, statements):
+        """Test mutations and their follow-up reads stay on the primary."""
+        response = routed_client.post("/api/tasks", json={"title": "Routed"})
+        assert response.status_code == 201
+        task_id = response.json()["id"]
+
+        response = routed_client.patch(
+            f"/api/tasks/{task_id}/status", json={"status": "completed"}
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        assert statements["primary"] > 0
+        assert statements["replica"] == 0
+
+    def test_reads_use_replica(self, routed_client: TestClient, statements):
+        """Test GET endpoints are served from the replica and see committed writes."""
+        routed_client.post("/api/tasks", json={"title": "Replicated"})
+        primary_before = statements["primary"]
+
+        response = routed_client.get("/api/tasks")
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()["tasks"]] == ["Replicated"]
+
+        response = routed_client.get("/api/categories")
+        assert response.status_code == 200
+        assert statements["replica"] > 0
+        assert statements["primary"] == primary_before
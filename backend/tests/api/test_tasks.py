@@ -1,8 +1,18 @@
 """Tests for task API endpoints."""
 
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
+from sqlalchemy import event
+
+from app.core.export import CSV_COLUMNS
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskCreate
+from app.services.task_service import TaskService
 
 
 class TestTaskEndpoints:
@@ -69,6 +79,17 @@ class TestTaskEndpoints:
 
         assert response.status_code == 404
 
+    def test_get_tasks_filter_by_empty_category(
+        self, client: TestClient, sample_category
+    ):
+        """Test filtering by an existing category without tasks."""
+        response = client.get(f"/api/tasks?category_id={sample_category['id']}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tasks"] == []
+        assert data["total"] == 0
+
     def test_create_task_success(self, client: TestClient, sample_category):
         """Test creating a new task successfully."""
         task_data = {
@@ -272,3 +293,1091 @@ class TestTaskIntegration:
 
         response = client.get("/api/tasks")
         assert response.json()["total"] == 3
+
+    def test_list_entries_match_single_task(
+        self, client: TestClient, sample_category
+    ):
+        """Test the column-based list path renders tasks like GET /{id}."""
+        client.post(
+            "/api/tasks",
+            json={
+                "title": "Categorized",
+                "description": "With a deadline",
+                "priority": "high",
+                "category_id": sample_category["id"],
+                "due_date": "2025-11-01T09:30:00",
+            },
+        )
+        client.post("/api/tasks", json={"title": "Plain"})
+
+        tasks = client.get("/api/tasks").json()["tasks"]
+        assert len(tasks) == 2
+        for task in tasks:
+            assert task == client.get(f"/api/tasks/{task['id']}").json()
+
+    def test_list_builds_no_orm_objects(self, client: TestClient, db, sample_task):
+        """Test the list query leaves the session's identity map empty."""
+        db.expunge_all()
+        page = TaskService(db).get_all_tasks()
+
+        assert page.tasks[0].category.id == sample_task["category_id"]
+        assert len(db.identity_map) == 0
+
+
+class TestTaskPagination:
+    """Tests for keyset pagination of the task list."""
+
+    def test_paginate_through_all_tasks(self, client: TestClient):
+        """Test that following next_cursor visits every task exactly once."""
+        for i in range(5):
+            response = client.post("/api/tasks", json={"title": f"Task {i}"})
+            assert response.status_code == 201
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/tasks", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 5
+            assert len(data["tasks"]) <= 2
+            seen.extend(task["id"] for task in data["tasks"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert seen == sorted(seen, reverse=True)
+
+    def test_last_page_has_no_cursor(self, client: TestClient, sample_task):
+        """Test that a page holding every result has no next_cursor."""
+        response = client.get("/api/tasks?limit=10")
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+
+    def test_invalid_cursor(self, client: TestClient):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/tasks?cursor=not-a-cursor")
+
+        assert response.status_code == 422
+
+    def test_limit_out_of_range(self, client: TestClient):
+        """Test that limit must be within the allowed range."""
+        response = client.get("/api/tasks?limit=0")
+
+        assert response.status_code == 422
+
+
+class TestTaskSearch:
+    """Tests for full-text search of the task list."""
+
+    def _create(self, client: TestClient, title: str, **fields) -> dict:
+        response = client.post("/api/tasks", json={"title": title, **fields})
+        assert response.status_code == 201
+        return response.json()
+
+    def test_search_title_and_description(self, client: TestClient):
+        """Test that words are matched in titles and descriptions, stemmed."""
+        in_title = self._create(client, "Deploy the API")
+        in_description = self._create(client, "Release", description="deploying to prod")
+        self._create(client, "Write docs")
+
+        response = client.get("/api/tasks", params={"q": "deploy"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert {task["id"] for task in data["tasks"]} == {
+            in_title["id"],
+            in_description["id"],
+        }
+
+    def test_search_requires_every_word(self, client: TestClient):
+        """Test that all words must match and more relevant tasks come first."""
+        best = self._create(client, "Fix login bug", description="login bug on login page")
+        self._create(client, "Fix login bug")
+        self._create(client, "Fix signup bug")
+
+        response = client.get("/api/tasks", params={"q": "login bug"})
+
+        data = response.json()
+        assert data["total"] == 2
+        assert data["tasks"][0]["id"] == best["id"]
+
+    def test_search_with_filters(self, client: TestClient):
+        """Test that search combines with the other filters."""
+        done = self._create(client, "Review budget", status="completed")
+        self._create(client, "Review budget")
+
+        response = client.get(
+            "/api/tasks", params={"q": "budget", "status": "completed"}
+        )
+
+        data = response.json()
+        assert data["total"] == 1
+        assert data["tasks"][0]["id"] == done["id"]
+
+    def test_search_follows_updates_and_deletes(self, client: TestClient):
+        """Test that the index tracks edited, bulk-updated and deleted tasks."""
+        task = self._create(client, "Plan offsite")
+        other = self._create(client, "Plan offsite agenda")
+
+        client.put(f"/api/tasks/{task['id']}", json={"title": "Book venue"})
+        assert client.get("/api/tasks", params={"q": "offsite"}).json()["total"] == 1
+        assert client.get("/api/tasks", params={"q": "venue"}).json()["total"] == 1
+
+        client.patch(
+            "/api/tasks",
+            json={"ids": [other["id"]], "changes": {"description": "catering"}},
+        )
+        assert client.get("/api/tasks", params={"q": "catering"}).json()["total"] == 1
+
+        client.delete(f"/api/tasks/{other['id']}")
+        assert client.get("/api/tasks", params={"q": "offsite"}).json()["total"] == 0
+
+    def test_search_pagination(self, client: TestClient):
+        """Test that following next_cursor visits every match exactly once."""
+        for i in range(5):
+            self._create(client, f"Invoice {i}", description="invoice " * i)
+        self._create(client, "Unrelated")
+
+        seen = []
+        params = {"q": "invoice", "limit": 2}
+        while True:
+            data = client.get("/api/tasks", params=params).json()
+            assert data["total"] == 5
+            seen.extend(task["id"] for task in data["tasks"])
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_search_syntax_is_literal(self, client: TestClient):
+        """Test that FTS5 operators and punctuation in q do not cause errors."""
+        self._create(client, "Call NOT-urgent vendor")
+
+        response = client.get("/api/tasks", params={"q": 'NOT "urgent* OR'})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+    def test_search_without_words(self, client: TestClient):
+        """Test that a query with no searchable words is rejected."""
+        response = client.get("/api/tasks", params={"q": "***"})
+
+        assert response.status_code == 422
+
+    def test_search_rejects_list_cursor(self, client: TestClient):
+        """Test that a cursor from the unranked list is invalid for a search."""
+        for i in range(2):
+            self._create(client, f"Task {i}")
+        cursor = client.get("/api/tasks", params={"limit": 1}).json()["next_cursor"]
+
+        response = client.get("/api/tasks", params={"q": "task", "cursor": cursor})
+
+        assert response.status_code == 422
+
+
+class TestTaskFields:
+    """Tests for sparse fieldsets (?fields=)."""
+
+    def _capture(self, db, request):
+        """Run a request and return the SQL statements reading tasks."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = request()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return response, [s for s in statements if "FROM tasks" in s]
+
+    def test_list_returns_only_requested_fields(
+        self, client: TestClient, db, sample_category
+    ):
+        """Test tasks carry the listed fields plus id, and totals are kept."""
+        client.post(
+            "/api/tasks",
+            json={
+                "title": "Card",
+                "description": "Long text",
+                "category_id": sample_category["id"],
+            },
+        )
+
+        fields = {"title", "status", "priority", "category_id"}
+        response, statements = self._capture(
+            db, lambda: client.get("/api/tasks", params={"fields": ",".join(fields)})
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["next_cursor"] is None
+        assert set(data["tasks"][0]) == fields | {"id"}
+        assert "description" not in statements[0]
+        assert "categories" not in statements[0]
+
+    def test_category_requested(self, client: TestClient, sample_category):
+        """Test the category is joined and nested when requested."""
+        client.post(
+            "/api/tasks", json={"title": "Card", "category_id": sample_category["id"]}
+        )
+        client.post("/api/tasks", json={"title": "Loose"})
+
+        tasks = client.get("/api/tasks?fields=category").json()["tasks"]
+        assert tasks[0] == {"id": tasks[0]["id"], "category": None}
+        assert tasks[1]["category"] == {
+            "id": sample_category["id"],
+            "name": sample_category["name"],
+            "color": sample_category["color"],
+        }
+
+    def test_single_task(self, client: TestClient, db, sample_task):
+        """Test GET /{id} narrows the query and the body."""
+        response, statements = self._capture(
+            db, lambda: client.get(f"/api/tasks/{sample_task['id']}?fields=title")
+        )
+        assert response.json() == {"id": sample_task["id"], "title": "Test Task"}
+        assert "description" not in statements[0]
+
+        response = client.get("/api/tasks/9999?fields=title")
+        assert response.status_code == 404
+
+    def test_pagination_with_fields(self, client: TestClient):
+        """Test cursors work when the sort columns are not requested."""
+        for i in range(3):
+            client.post("/api/tasks", json={"title": f"Task {i}"})
+
+        first = client.get("/api/tasks?limit=2&fields=title").json()
+        second = client.get(
+            f"/api/tasks?limit=2&fields=title&cursor={first['next_cursor']}"
+        ).json()
+        titles = [task["title"] for task in first["tasks"] + second["tasks"]]
+        assert titles == ["Task 2", "Task 1", "Task 0"]
+
+    def test_fields_are_part_of_cache_key(self, client: TestClient, sample_task):
+        """Test a sparse page is never served for a full request."""
+        client.get("/api/tasks?fields=title")
+        tasks = client.get("/api/tasks").json()["tasks"]
+        assert tasks[0]["description"] == "Test Description"
+
+    @pytest.mark.parametrize("fields", ["bogus", "title,secret", ",", ""])
+    def test_invalid_fields(self, client: TestClient, sample_task, fields):
+        """Test unknown or empty field lists are rejected."""
+        for path in ("/api/tasks", f"/api/tasks/{sample_task['id']}"):
+            response = client.get(path, params={"fields": fields})
+            assert response.status_code == 422
+
+
+class TestTaskExport:
+    """Tests for streaming exports (GET /api/tasks/export)."""
+
+    def _populate(self, client: TestClient, category_id: int) -> None:
+        """Create categorized, plain and completed tasks."""
+        client.post(
+            "/api/tasks",
+            json={
+                "title": 'Quote "this", please',
+                "description": "Line one\nline two ☕",
+                "priority": "high",
+                "category_id": category_id,
+                "due_date": "2026-01-01T09:00:00",
+            },
+        )
+        client.post("/api/tasks", json={"title": "Plain"})
+        done = client.post("/api/tasks", json={"title": "Done deploy"}).json()
+        client.patch(f"/api/tasks/{done['id']}/status", json={"status": "completed"})
+
+    def test_ndjson_matches_list(self, client: TestClient, sample_category):
+        """Test each NDJSON line is the task as the list endpoint returns it."""
+        self._populate(client, sample_category["id"])
+
+        response = client.get("/api/tasks/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == (
+            'attachment; filename="tasks.ndjson"'
+        )
+        assert "etag" in response.headers
+        lines = response.content.splitlines()
+        listed = client.get("/api/tasks").json()["tasks"]
+        assert [json.loads(line) for line in lines] == listed
+
+    def test_csv(self, client: TestClient, sample_category):
+        """Test CSV rows flatten the category and leave missing values empty."""
+        self._populate(client, sample_category["id"])
+
+        response = client.get("/api/tasks/export?format=csv")
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        listed = client.get("/api/tasks").json()["tasks"]
+        assert [int(row["id"]) for row in rows] == [task["id"] for task in listed]
+
+        categorized = rows[-1]
+        assert categorized["title"] == 'Quote "this", please'
+        assert categorized["description"] == "Line one\nline two ☕"
+        assert categorized["priority"] == "high"
+        assert categorized["category_name"] == sample_category["name"]
+        assert categorized["category_color"] == sample_category["color"]
+        assert categorized["due_date"] == "2026-01-01T09:00:00"
+        assert categorized["created_at"] == listed[-1]["created_at"]
+        plain = rows[1]
+        assert plain["description"] == plain["category_id"] == plain["due_date"] == ""
+
+    def test_csv_empty_has_header(self, client: TestClient):
+        """Test an empty export is still a valid CSV document."""
+        response = client.get("/api/tasks/export?format=csv")
+        assert response.text.splitlines() == [",".join(CSV_COLUMNS)]
+        assert client.get("/api/tasks/export").content == b""
+
+    def test_filters(self, client: TestClient, sample_category):
+        """Test the list filters and search apply to exports."""
+        self._populate(client, sample_category["id"])
+
+        def titles(query: str) -> list:
+            response = client.get(f"/api/tasks/export?{query}")
+            return [json.loads(line)["title"] for line in response.content.splitlines()]
+
+        assert titles("status=completed") == ["Done deploy"]
+        assert titles(f"category_id={sample_category['id']}") == [
+            'Quote "this", please'
+        ]
+        assert titles("q=deploying") == ["Done deploy"]
+        assert titles("due_before=2026-06-01T00:00:00") == ['Quote "this", please']
+
+    def test_invalid_requests(self, client: TestClient):
+        """Test errors are reported before the stream starts."""
+        assert client.get("/api/tasks/export?category_id=9999").status_code == 404
+        assert client.get("/api/tasks/export?q=%22%22").status_code == 422
+        assert client.get("/api/tasks/export?format=xml").status_code == 422
+
+    def test_reads_in_batches(self, db, sample_category):
+        """Test the repository streams mappings in bounded batches."""
+        repository = TaskRepository(db)
+        repository.create_many([TaskCreate(title=f"Task {i}") for i in range(5)])
+
+        batches = list(repository.iter_batches(batch_size=2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [task["title"] for batch in batches for task in batch] == [
+            f"Task {i}" for i in reversed(range(5))
+        ]
+
+    def test_async_database_mode(self, async_client: TestClient, sample_task):
+        """Test exports also work when the API runs on async sessions."""
+        lines = async_client.get("/api/tasks/export").content.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [sample_task["id"]]
+
+
+class TestTaskImport:
+    """Tests for file imports (POST /api/tasks/import)."""
+
+    def _import(self, client: TestClient, content: bytes, filename: str, **params):
+        """Upload a file and return the response."""
+        return client.post(
+            "/api/tasks/import", files={"file": (filename, content)}, params=params
+        )
+
+    def test_ndjson(self, client: TestClient, sample_category):
+        """Test valid records are created and invalid ones reported by line."""
+        lines = [
+            json.dumps({"title": "By id", "category_id": sample_category["id"]}),
+            "",
+            json.dumps({"title": "By name", "category_name": sample_category["name"]}),
+            "{not json",
+            json.dumps({"description": "No title"}),
+            json.dumps({"title": "Missing", "category_id": 9999}),
+            json.dumps({"title": "Unknown", "category_name": "Nope"}),
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"title": "Done", "status": "completed", "priority": "low"}),
+        ]
+        response = self._import(client, "\n".join(lines).encode(), "tasks.ndjson")
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["processed"] == 8
+        assert (result["created"], result["failed"], result["batches"]) == (3, 5, 1)
+        assert [error["line"] for error in result["errors"]] == [4, 5, 6, 7, 8]
+        assert result["errors"][1]["message"] == "title: Field required"
+        assert result["errors"][2]["message"] == "Category with id '9999' not found"
+        assert result["errors"][3]["message"] == "Category named 'Nope' not found"
+
+        tasks = {task["title"]: task for task in client.get("/api/tasks").json()["tasks"]}
+        assert tasks["By name"]["category"]["id"] == sample_category["id"]
+        assert tasks["Done"]["status"] == "completed"
+        assert client.get("/api/tasks/stats").json()["total"] == 3
+
+    def test_csv(self, client: TestClient, sample_category):
+        """Test CSV uploads, inferred from the file name, with a byte order mark."""
+        content = (
+            "\ufefftitle,description,priority,category_name,due_date,id\r\n"
+            f'"Multi, line","first\nsecond",high,{sample_category["name"]},'
+            "2026-01-01T09:00:00,77\r\n"
+            "Plain,,,,,\r\n"
+            ",No title,,,,\r\n"
+            "Short row\r\n"
+        ).encode()
+        result = self._import(client, content, "backlog.CSV").json()
+
+        assert (result["created"], result["failed"]) == (2, 2)
+        assert [error["line"] for error in result["errors"]] == [5, 6]
+        tasks = client.get("/api/tasks").json()["tasks"]
+        imported = next(task for task in tasks if task["title"] == "Multi, line")
+        assert imported["description"] == "first\nsecond"
+        assert imported["priority"] == "high"
+        assert imported["category_id"] == sample_category["id"]
+        assert imported["due_date"] == "2026-01-01T09:00:00"
+        assert imported["id"] != 77
+
+    @pytest.mark.parametrize("format", ["ndjson", "csv"])
+    def test_export_round_trip(self, client: TestClient, sample_task, format):
+        """Test an export imports back as the same tasks."""
+        exported = client.get(f"/api/tasks/export?format={format}").content
+        result = self._import(client, exported, "upload", format=format).json()
+        assert (result["created"], result["failed"]) == (1, 0)
+
+        first, second = client.get("/api/tasks").json()["tasks"]
+        for field in ("title", "description", "status", "priority", "category_id"):
+            assert first[field] == second[field]
+        assert first["due_date"] == second["due_date"] == sample_task["due_date"]
+
+    def test_batches(self, client: TestClient, monkeypatch):
+        """Test valid tasks are committed in batches."""
+        monkeypatch.setattr("app.services.task_service.IMPORT_BATCH_SIZE", 2)
+        content = "\n".join(json.dumps({"title": f"T{i}"}) for i in range(5)).encode()
+
+        result = self._import(client, content, "tasks.ndjson").json()
+        assert (result["created"], result["batches"]) == (5, 3)
+
+    def test_errors_capped(self, client: TestClient, monkeypatch):
+        """Test only the first errors are listed, but all are counted."""
+        monkeypatch.setattr("app.services.task_service.IMPORT_MAX_ERRORS", 2)
+        result = self._import(client, b"x\n" * 5, "tasks.ndjson").json()
+        assert result["failed"] == 5
+        assert [error["line"] for error in result["errors"]] == [1, 2]
+
+    def test_invalid_utf8_line(self, client: TestClient):
+        """Test undecodable NDJSON lines are reported and skipped."""
+        content = b'{"title": "caf\xe9"}\n{"title": "ok"}\n'
+        result = self._import(client, content, "tasks.ndjson").json()
+        assert result["created"] == 1
+        assert result["errors"] == [{"line": 1, "message": "Line is not valid UTF-8"}]
+
+    @pytest.mark.parametrize("content", [b"", b"name,priority\r\nA,high\r\n"])
+    def test_csv_without_title_column(self, client: TestClient, content):
+        """Test a CSV file without a title column is rejected up front."""
+        response = self._import(client, content, "tasks.csv")
+        assert response.status_code == 422
+        assert "title" in response.json()["message"]
+
+    def test_file_required(self, client: TestClient):
+        """Test the upload is mandatory."""
+        assert client.post("/api/tasks/import").status_code == 422
+
+
+class TestTaskChanges:
+    """Tests for the change feed (GET /api/tasks/changes)."""
+
+    def _sync(self, client: TestClient, state: dict, limit: int = 100) -> int:
+        """Apply every change past the state's cursor; return the calls made."""
+        calls = 0
+        while True:
+            params = {"limit": limit}
+            if "cursor" in state:
+                params["since"] = state["cursor"]
+            response = client.get("/api/tasks/changes", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            calls += 1
+            for task_id in data["deleted"]:
+                state["tasks"].pop(task_id, None)
+            for task in data["tasks"]:
+                state["tasks"][task["id"]] = task
+            state["cursor"] = data["next_cursor"]
+            if not data["has_more"]:
+                return calls
+
+    def _listed(self, client: TestClient) -> dict:
+        """Return every task as the list endpoint reports it, by id."""
+        tasks = client.get("/api/tasks").json()["tasks"]
+        return {task["id"]: task for task in tasks}
+
+    def test_initial_sync(self, client: TestClient, sample_task):
+        """Test the first call returns every task, oldest change first."""
+        ids = [
+            client.post("/api/tasks", json={"title": title}).json()["id"]
+            for title in ("A", "B")
+        ]
+
+        data = client.get("/api/tasks/changes").json()
+
+        assert [task["id"] for task in data["tasks"]] == [sample_task["id"], *ids]
+        assert data["tasks"] == sorted(
+            self._listed(client).values(), key=lambda task: task["id"]
+        )
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+
+        again = client.get(f"/api/tasks/changes?since={data['next_cursor']}").json()
+        assert again == {**data, "tasks": []}
+
+    def test_empty(self, client: TestClient):
+        """Test an empty table still yields a cursor to follow."""
+        data = client.get("/api/tasks/changes").json()
+        assert data["tasks"] == data["deleted"] == []
+        assert client.get(
+            f"/api/tasks/changes?since={data['next_cursor']}"
+        ).status_code == 200
+
+    def test_follows_writes(self, client: TestClient, sample_category):
+        """Test updates, status changes, deletes and creates after a cursor."""
+        ids = [
+            client.post("/api/tasks", json={"title": title}).json()["id"]
+            for title in ("A", "B", "C")
+        ]
+        state = {"tasks": {}}
+        self._sync(client, state)
+        cursor = state["cursor"]
+
+        client.put(f"/api/tasks/{ids[0]}", json={"title": "A2"})
+        client.patch(f"/api/tasks/{ids[0]}/status", json={"status": "completed"})
+        client.delete(f"/api/tasks/{ids[1]}")
+        created = client.post(
+            "/api/tasks", json={"title": "D", "category_id": sample_category["id"]}
+        ).json()
+
+        data = client.get(f"/api/tasks/changes?since={cursor}").json()
+        assert [task["id"] for task in data["tasks"]] == [ids[0], created["id"]]
+        assert data["tasks"][0]["title"] == "A2"
+        assert data["tasks"][0]["status"] == "completed"
+        assert data["tasks"][1]["category"]["name"] == sample_category["name"]
+        assert data["deleted"] == [ids[1]]
+
+        self._sync(client, state)
+        assert state["tasks"] == self._listed(client)
+
+    def test_bulk_writes(self, client: TestClient):
+        """Test set-based creates, updates and deletes reach the feed."""
+        response = client.post(
+            "/api/tasks/bulk",
+            json={"tasks": [{"title": f"T{i}", "priority": "low"} for i in range(6)]},
+        )
+        ids = [task["id"] for task in response.json()["tasks"]]
+        state = {"tasks": {}}
+        self._sync(client, state)
+        cursor = state["cursor"]
+
+        client.patch(
+            "/api/tasks", json={"ids": ids[:2], "changes": {"status": "completed"}}
+        )
+        client.request("DELETE", "/api/tasks", json={"ids": ids[4:]})
+        client.delete(f"/api/tasks/{ids[3]}")
+
+        data = client.get(f"/api/tasks/changes?since={cursor}").json()
+        assert [task["id"] for task in data["tasks"]] == ids[:2]
+        assert sorted(data["deleted"]) == ids[3:]
+
+        self._sync(client, state)
+        assert state["tasks"] == self._listed(client)
+
+    def test_pagination(self, client: TestClient):
+        """Test small pages interleave tasks and deletions without gaps."""
+        ids = [
+            client.post("/api/tasks", json={"title": f"T{i}"}).json()["id"]
+            for i in range(5)
+        ]
+        state = {"tasks": {}}
+        assert self._sync(client, state, limit=2) == 3
+
+        for task_id in ids[1:4:2]:
+            client.delete(f"/api/tasks/{task_id}")
+        client.put(f"/api/tasks/{ids[0]}", json={"title": "T0 again"})
+        created = client.post("/api/tasks", json={"title": "T5"}).json()
+
+        # Two deletions, one update and one create
+        assert self._sync(client, state, limit=1) == 4
+        assert sorted(state["tasks"]) == [ids[0], ids[2], ids[4], created["id"]]
+        assert state["tasks"] == self._listed(client)
+
+    def test_reused_id(self, client: TestClient):
+        """Test a deleted id reused by a new task ends up present."""
+        first = client.post("/api/tasks", json={"title": "A"}).json()
+        last = client.post("/api/tasks", json={"title": "B"}).json()
+        state = {"tasks": {}}
+        self._sync(client, state)
+
+        client.delete(f"/api/tasks/{last['id']}")
+        reused = client.post("/api/tasks", json={"title": "C"}).json()
+        assert reused["id"] == last["id"]
+
+        data = client.get(f"/api/tasks/changes?since={state['cursor']}").json()
+        assert data["deleted"] == [reused["id"]]
+        assert [task["title"] for task in data["tasks"]] == ["C"]
+        self._sync(client, state)
+        assert sorted(state["tasks"]) == [first["id"], reused["id"]]
+
+    def test_not_modified(self, client: TestClient, sample_task):
+        """Test polls are answered with 304 until a task changes."""
+        first = client.get("/api/tasks/changes")
+        cursor = first.json()["next_cursor"]
+        url = f"/api/tasks/changes?since={cursor}"
+        etag = client.get(url).headers["etag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        client.patch(
+            "/api/tasks", json={"ids": [9999], "changes": {"status": "completed"}}
+        )
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        client.put(f"/api/tasks/{sample_task['id']}", json={"title": "Renamed"})
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()["tasks"]] == ["Renamed"]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "since=garbage",
+            # A list cursor holds a timestamp, not a change sequence
+            "since=WyIyMDI2LTAxLTAxVDAwOjAwOjAwIiwxXQ",
+            "limit=0",
+            "limit=501",
+        ],
+    )
+    def test_invalid_requests(self, client: TestClient, query):
+        """Test malformed cursors and limits are rejected."""
+        assert client.get(f"/api/tasks/changes?{query}").status_code == 422
+
+    def test_async_database_mode(self, async_client: TestClient, sample_task):
+        """Test the feed also works when the API runs on async sessions."""
+        data = async_client.get("/api/tasks/changes").json()
+        assert [task["id"] for task in data["tasks"]] == [sample_task["id"]]
+
+
+class TestTaskDueDates:
+    """Tests for due-date filters and the calendar endpoint."""
+
+    def _create(self, client: TestClient, title: str, **fields) -> dict:
+        response = client.post("/api/tasks", json={"title": title, **fields})
+        assert response.status_code == 201
+        return response.json()
+
+    def test_due_range_filters(self, client: TestClient):
+        """Test due_before is exclusive, due_after inclusive, undated excluded."""
+        early = self._create(client, "Early", due_date="2026-03-01T09:00:00")
+        late = self._create(client, "Late", due_date="2026-03-05T09:00:00")
+        self._create(client, "Undated")
+
+        response = client.get("/api/tasks", params={"due_before": "2026-03-05T09:00:00"})
+        assert [task["id"] for task in response.json()["tasks"]] == [early["id"]]
+
+        response = client.get("/api/tasks", params={"due_after": "2026-03-05T09:00:00"})
+        assert [task["id"] for task in response.json()["tasks"]] == [late["id"]]
+
+        response = client.get(
+            "/api/tasks",
+            params={"due_after": "2026-02-01T00:00:00", "due_before": "2026-04-01T00:00:00"},
+        )
+        assert response.json()["total"] == 2
+
+    def test_overdue_excludes_completed(self, client: TestClient):
+        """Test due filters match open tasks only and combine with status."""
+        todo = self._create(client, "Overdue", due_date="2026-01-01T00:00:00")
+        started = self._create(
+            client, "Started", due_date="2026-01-01T00:00:00", status="in_progress"
+        )
+        self._create(
+            client, "Done", due_date="2026-01-01T00:00:00", status="completed"
+        )
+
+        response = client.get("/api/tasks", params={"due_before": "2026-02-01T00:00:00"})
+        assert {task["id"] for task in response.json()["tasks"]} == {
+            todo["id"],
+            started["id"],
+        }
+
+        response = client.get(
+            "/api/tasks", params={"due_before": "2026-02-01T00:00:00", "status": "todo"}
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["tasks"][0]["id"] == todo["id"]
+
+    def test_due_bounds_with_offset(self, client: TestClient):
+        """Test bounds with a UTC offset are compared in UTC."""
+        task = self._create(client, "Morning", due_date="2025-01-02T10:00:00")
+        # 12:00 at +05:00 is 07:00 UTC, before the task is due
+        bound = "2025-01-02T12:00:00+05:00"
+
+        response = client.get("/api/tasks", params={"due_before": bound})
+        assert response.json()["total"] == 0
+
+        response = client.get("/api/tasks", params={"due_after": bound})
+        assert [t["id"] for t in response.json()["tasks"]] == [task["id"]]
+
+        response = client.get("/api/tasks/export", params={"due_before": bound})
+        assert response.text == ""
+
+    @pytest.mark.parametrize("path", ["/api/tasks", "/api/tasks/export"])
+    @pytest.mark.parametrize("bound", ["due_before", "due_after"])
+    def test_due_filters_reject_completed(self, client: TestClient, path, bound):
+        """Test due filters combined with status=completed are a 422."""
+        response = client.get(
+            path, params={bound: "2026-02-01T00:00:00", "status": "completed"}
+        )
+
+        assert response.status_code == 422
+        assert "status=completed" in response.json()["message"]
+
+    def test_calendar_groups_open_tasks_by_day(self, client: TestClient):
+        """Test per-day buckets include only open tasks inside the range."""
+        a = self._create(client, "A", due_date="2026-05-01T08:00:00")
+        b = self._create(
+            client, "B", due_date="2026-05-01T23:30:00", status="in_progress"
+        )
+        c = self._create(client, "C", due_date="2026-05-03T12:00:00")
+        self._create(client, "Done", due_date="2026-05-01T10:00:00", status="completed")
+        self._create(client, "Outside", due_date="2026-05-04T00:00:00")
+        self._create(client, "Undated")
+
+        response = client.get(
+            "/api/tasks/calendar", params={"from": "2026-05-01", "to": "2026-05-03"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "days": [
+                {"day": "2026-05-01", "count": 2, "task_ids": [a["id"], b["id"]]},
+                {"day": "2026-05-03", "count": 1, "task_ids": [c["id"]]},
+            ],
+            "total": 3,
+        }
+
+    def test_calendar_empty(self, client: TestClient):
+        """Test a range without due tasks."""
+        response = client.get(
+            "/api/tasks/calendar", params={"from": "2026-05-01", "to": "2026-05-01"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"days": [], "total": 0}
+
+    def test_calendar_invalid_range(self, client: TestClient):
+        """Test reversed, oversized and missing ranges are rejected."""
+        for params in (
+            {"from": "2026-05-03", "to": "2026-05-01"},
+            {"from": "2026-01-01", "to": "2027-06-01"},
+            {"from": "2026-01-01"},
+        ):
+            response = client.get("/api/tasks/calendar", params=params)
+            assert response.status_code == 422
+
+
+class TestTaskStats:
+    """Tests for the task statistics endpoint."""
+
+    def test_stats_empty(self, client: TestClient):
+        """Test statistics when there are no tasks."""
+        response = client.get("/api/tasks/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 0
+        assert data["by_status"] == {"todo": 0, "in_progress": 0, "completed": 0}
+        assert data["by_priority"] == {"low": 0, "medium": 0, "high": 0}
+
+    def test_stats_follow_task_writes(self, client: TestClient, sample_category):
+        """Test that create, update, status update and delete keep stats exact."""
+        ids = []
+        for task_data in [
+            {"title": "A", "priority": "high", "category_id": sample_category["id"]},
+            {"title": "B", "priority": "low"},
+            {"title": "C", "status": "in_progress"},
+        ]:
+            ids.append(client.post("/api/tasks", json=task_data).json()["id"])
+
+        client.patch(f"/api/tasks/{ids[0]}/status", json={"status": "completed"})
+        client.put(f"/api/tasks/{ids[1]}", json={"priority": "medium"})
+        client.delete(f"/api/tasks/{ids[2]}")
+
+        data = client.get("/api/tasks/stats").json()
+        assert data["total"] == 2
+        assert data["by_status"] == {"todo": 1, "in_progress": 0, "completed": 1}
+        assert data["by_priority"] == {"low": 0, "medium": 1, "high": 1}
+
+        data = client.get(
+            f"/api/tasks/stats?category_id={sample_category['id']}"
+        ).json()
+        assert data["total"] == 1
+        assert data["by_status"]["completed"] == 1
+
+    def test_stats_nonexistent_category(self, client: TestClient):
+        """Test that stats for a missing category return 404."""
+        response = client.get("/api/tasks/stats?category_id=9999")
+
+        assert response.status_code == 404
+
+    def test_rebuild_matches_tasks(self, client: TestClient, db, sample_task):
+        """Test that rebuilding counters picks up tasks written directly."""
+        from app.repositories.task_stats_repository import TaskStatsRepository
+
+        assert client.get("/api/tasks/stats").json()["total"] == 0
+
+        TaskStatsRepository(db).rebuild()
+
+        data = client.get("/api/tasks/stats").json()
+        assert data["total"] == 1
+        assert data["by_status"]["todo"] == 1
+
+
+    def test_concurrent_updates_keep_counters_exact(self, db):
+        """Test that writers holding stale copies of a task move its bucket once."""
+        from sqlalchemy import func, select
+        from sqlalchemy.orm import Session
+
+        from app.models.task import Task, TaskPriority, TaskStatus
+        from app.repositories.task_stats_repository import TaskStatsRepository
+
+        task_id = TaskRepository(db).create(TaskCreate(title="Shared")).id
+
+        # Both sessions load the task before either writes
+        with Session(db.get_bind()) as other:
+            first = TaskRepository(db).get_by_id(task_id)
+            second = TaskRepository(other).get_by_id(task_id)
+            TaskRepository(other).update_status(second, TaskStatus.COMPLETED)
+        TaskRepository(db).update_status(first, TaskStatus.IN_PROGRESS)
+
+        counters = {
+            (status, priority): count
+            for status, priority, count in TaskStatsRepository(db).get_counts()
+            if count
+        }
+        tasks = dict(
+            ((status, priority), count)
+            for status, priority, count in db.execute(
+                select(Task.status, Task.priority, func.count()).group_by(
+                    Task.status, Task.priority
+                )
+            )
+        )
+        assert counters == tasks == {(TaskStatus.IN_PROGRESS, TaskPriority.MEDIUM): 1}
+
+
+class TestTaskBulkCreate:
+    """Tests for bulk task creation."""
+
+    def test_bulk_create(self, client: TestClient, sample_category):
+        """Test creating many tasks in one request."""
+        payload = {
+            "tasks": [
+                {"title": f"Bulk {i}", "category_id": sample_category["id"]}
+                for i in range(3)
+            ]
+            + [{"title": "Uncategorized", "priority": "high"}]
+        }
+
+        response = client.post("/api/tasks/bulk", json=payload)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 4
+        assert [task["title"] for task in data["tasks"]] == [
+            "Bulk 0",
+            "Bulk 1",
+            "Bulk 2",
+            "Uncategorized",
+        ]
+        assert data["tasks"][0]["category"]["name"] == sample_category["name"]
+        assert data["tasks"][3]["category"] is None
+        assert client.get("/api/tasks").json()["total"] == 4
+        assert client.get("/api/tasks/stats").json()["by_priority"]["high"] == 1
+
+    def test_bulk_create_missing_category_is_atomic(
+        self, client: TestClient, sample_category
+    ):
+        """Test that a missing category rejects the whole batch."""
+        payload = {
+            "tasks": [
+                {"title": "Valid", "category_id": sample_category["id"]},
+                {"title": "Invalid", "category_id": 9999},
+            ]
+        }
+
+        response = client.post("/api/tasks/bulk", json=payload)
+
+        assert response.status_code == 422
+        assert response.json()["details"]["errors"] == [
+            {"index": 1, "message": "Category with id '9999' not found"}
+        ]
+        assert client.get("/api/tasks").json()["total"] == 0
+
+    def test_bulk_create_empty(self, client: TestClient):
+        """Test that an empty batch is rejected."""
+        response = client.post("/api/tasks/bulk", json={"tasks": []})
+
+        assert response.status_code == 422
+
+
+class TestTaskBulkUpdate:
+    """Tests for set-based bulk task updates."""
+
+    def _create(self, client: TestClient, *tasks: dict) -> list:
+        """Create tasks through the bulk endpoint and return their IDs."""
+        response = client.post("/api/tasks/bulk", json={"tasks": list(tasks)})
+        return [task["id"] for task in response.json()["tasks"]]
+
+    def test_bulk_update_by_filter(self, client: TestClient):
+        """Test moving every task with one status to another status."""
+        self._create(
+            client,
+            {"title": "A", "status": "in_progress"},
+            {"title": "B", "status": "in_progress"},
+            {"title": "C", "status": "todo"},
+        )
+
+        response = client.patch(
+            "/api/tasks",
+            json={
+                "filter": {"status": "in_progress"},
+                "changes": {"status": "completed"},
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 2
+        assert data["tasks"] is None
+        stats = client.get("/api/tasks/stats").json()
+        assert stats["by_status"] == {"todo": 1, "in_progress": 0, "completed": 2}
+
+    def test_bulk_update_by_ids_returning(
+        self, client: TestClient, sample_category
+    ):
+        """Test updating selected tasks and returning them."""
+        ids = self._create(client, {"title": "A"}, {"title": "B"}, {"title": "C"})
+
+        response = client.patch(
+            "/api/tasks",
+            json={
+                "ids": ids[:2],
+                "changes": {"priority": "high", "category_id": sample_category["id"]},
+                "return_tasks": True,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 2
+        assert [task["id"] for task in data["tasks"]] == ids[:2]
+        assert all(task["priority"] == "high" for task in data["tasks"])
+        assert all(
+            task["category"]["name"] == sample_category["name"]
+            for task in data["tasks"]
+        )
+        assert all(
+            task["updated_at"] > task["created_at"] for task in data["tasks"]
+        )
+        stats = client.get("/api/tasks/stats").json()
+        assert stats["by_priority"] == {"low": 0, "medium": 1, "high": 2}
+
+    def test_bulk_update_requires_one_selector(self, client: TestClient):
+        """Test that ids and filter are mutually exclusive and required."""
+        changes = {"status": "completed"}
+
+        response = client.patch("/api/tasks", json={"changes": changes})
+        assert response.status_code == 422
+
+        response = client.patch(
+            "/api/tasks",
+            json={"ids": [1], "filter": {"status": "todo"}, "changes": changes},
+        )
+        assert response.status_code == 422
+
+        response = client.patch("/api/tasks", json={"filter": {}, "changes": changes})
+        assert response.status_code == 422
+
+    def test_bulk_update_requires_changes(self, client: TestClient):
+        """Test that an empty change set is rejected."""
+        response = client.patch("/api/tasks", json={"ids": [1], "changes": {}})
+
+        assert response.status_code == 422
+
+    def test_bulk_update_invalid_category(self, client: TestClient):
+        """Test that moving tasks to a missing category returns 404."""
+        ids = self._create(client, {"title": "A"})
+
+        response = client.patch(
+            "/api/tasks", json={"ids": ids, "changes": {"category_id": 9999}}
+        )
+
+        assert response.status_code == 404
+
+
+class TestTaskBulkDelete:
+    """Tests for set-based bulk task deletion."""
+
+    def _create(self, client: TestClient, *tasks: dict) -> list:
+        """Create tasks through the bulk endpoint and return their IDs."""
+        response = client.post("/api/tasks/bulk", json={"tasks": list(tasks)})
+        return [task["id"] for task in response.json()["tasks"]]
+
+    def test_bulk_delete_by_filter(self, client: TestClient):
+        """Test clearing completed tasks."""
+        self._create(
+            client,
+            {"title": "A", "status": "completed"},
+            {"title": "B", "status": "completed"},
+            {"title": "C"},
+        )
+
+        response = client.request(
+            "DELETE", "/api/tasks", json={"filter": {"status": "completed"}}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["deleted"] == 2
+        assert client.get("/api/tasks").json()["total"] == 1
+        stats = client.get("/api/tasks/stats").json()
+        assert stats["total"] == 1
+        assert stats["by_status"]["completed"] == 0
+
+    def test_bulk_delete_by_ids(self, client: TestClient):
+        """Test deleting selected tasks, ignoring unknown IDs."""
+        ids = self._create(client, {"title": "A"}, {"title": "B"}, {"title": "C"})
+
+        response = client.request(
+            "DELETE", "/api/tasks", json={"ids": [ids[0], ids[2], 9999]}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["deleted"] == 2
+        remaining = client.get("/api/tasks").json()["tasks"]
+        assert [task["id"] for task in remaining] == [ids[1]]
+
+    def test_bulk_delete_in_chunks(self, client: TestClient, db):
+        """Test that filtered deletes larger than one chunk remove every row."""
+        from app.models.task import TaskPriority
+        from app.repositories.task_repository import TaskRepository
+
+        self._create(client, *({"title": f"T{i}", "priority": "low"} for i in range(7)))
+
+        deleted = TaskRepository(db).delete_many(
+            priority=TaskPriority.LOW, chunk_size=3
+        )
+
+        assert deleted == 7
+        assert client.get("/api/tasks/stats").json()["total"] == 0
+
+    def test_bulk_delete_requires_selector(self, client: TestClient):
+        """Test that a selection is required."""
+        response = client.request("DELETE", "/api/tasks", json={})
+
+        assert response.status_code == 422
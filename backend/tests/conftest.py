@@ -1,21 +1,38 @@
 """Pytest configuration and fixtures."""
 
 import pytest
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.category_cache import category_cache
+from app.core.database import (
+    Base,
+    configure_sqlite,
+    get_db,
+    get_session_factory,
+    get_session_runner,
+)
+from app.core.response_cache import task_list_cache
 
 # Create test database engine (in-memory SQLite)
 TEST_DATABASE_URL = "sqlite:///./test_taskflow.db"
 engine = create_engine(
     TEST_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+configure_sqlite(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same test database, for async database mode
+ASYNC_TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_taskflow.db"
+async_engine = create_async_engine(ASYNC_TEST_DATABASE_URL, poolclass=NullPool)
+configure_sqlite(async_engine.sync_engine)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
@@ -25,8 +42,10 @@ def db() -> Generator[Session, None, None]:
     Yields:
         Session: Test database session
     """
-    # Create all tables
+    # Create all tables; cached data belongs to the previous database
     Base.metadata.create_all(bind=engine)
+    category_cache.clear()
+    task_list_cache.clear()
 
     db = TestingSessionLocal()
     try:
@@ -56,6 +75,32 @@ def client(db: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def async_client(db: Session) -> Generator[TestClient, None, None]:
+    """
+    Create a test client whose endpoints use async database sessions.
+
+    Args:
+        db: Test database session (creates and drops the tables)
+
+    Yields:
+        TestClient: FastAPI test client running in async database mode
+    """
+
+    async def override_get_session_runner() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_session_runner] = override_get_session_runner
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
     with TestClient(app) as test_client:
         yield test_client
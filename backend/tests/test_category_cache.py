@@ -0,0 +1,176 @@
+"""Tests for the in-process category cache."""
+
+from typing import List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.category_cache import CachedCategory, CategoryCache
+from app.models.category import Category
+
+
+class FakeCategories:
+    """In-memory category table that records how often it is read."""
+
+    def __init__(self, *names: str):
+        self.rows = [CachedCategory(i, name, None) for i, name in enumerate(names, 1)]
+        self.table_loads = 0
+        self.row_loads = 0
+
+    def load_table(self, limit: int) -> List[CachedCategory]:
+        """Return up to limit rows."""
+        self.table_loads += 1
+        return self.rows[:limit]
+
+    def load_id(self, category_id: int):
+        """Return a loader for one row."""
+
+        def load() -> Optional[CachedCategory]:
+            self.row_loads += 1
+            return next((r for r in self.rows if r.id == category_id), None)
+
+        return load
+
+    def load_ids(self, category_ids: List[int]) -> List[CachedCategory]:
+        """Return the rows with the given IDs."""
+        self.row_loads += 1
+        return [r for r in self.rows if r.id in category_ids]
+
+
+class Clock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Provide a clock starting at zero."""
+    return Clock()
+
+
+class TestCategoryCache:
+    """Test suite for CategoryCache."""
+
+    def test_lookups_served_from_one_load(self, clock):
+        """Test one table load answers lookups by id and by name."""
+        source = FakeCategories("Work", "Home")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+
+        assert cache.get_by_id(1, source.load_table, source.load_id(1)).name == "Work"
+        assert cache.get_by_name("Home", source.load_table, source.load_id(2)).id == 2
+        assert cache.get_by_id(1, source.load_table, source.load_id(1)).name == "Work"
+
+        assert source.table_loads == 1
+        assert source.row_loads == 0
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_missing_key_reads_database(self, clock):
+        """Test an unknown key is never answered from memory."""
+        source = FakeCategories("Work")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+        cache.get_by_id(1, source.load_table, source.load_id(1))
+
+        assert cache.get_by_id(9, source.load_table, source.load_id(9)) is None
+        assert source.row_loads == 1
+
+    def test_category_created_elsewhere_drops_snapshot(self, clock):
+        """Test a category the snapshot lacks is found and forces a reload."""
+        source = FakeCategories("Work")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+        cache.get_by_id(1, source.load_table, source.load_id(1))
+
+        source.rows.append(CachedCategory(2, "Home", None))
+        assert cache.get_by_id(2, source.load_table, source.load_id(2)).name == "Home"
+        assert cache.get_by_id(2, source.load_table, source.load_id(2)).name == "Home"
+        assert source.table_loads == 2
+
+    def test_ttl_expiry_reloads(self, clock):
+        """Test changes made elsewhere are seen after the TTL."""
+        source = FakeCategories("Work")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+        cache.get_by_id(1, source.load_table, source.load_id(1))
+
+        source.rows[0] = CachedCategory(1, "Office", None)
+        clock.now = 59
+        assert cache.get_by_id(1, source.load_table, source.load_id(1)).name == "Work"
+        clock.now = 61
+        assert cache.get_by_id(1, source.load_table, source.load_id(1)).name == "Office"
+
+    def test_bounded_size(self, clock):
+        """Test only max_size categories are kept and the rest read through."""
+        source = FakeCategories("A", "B", "C")
+        cache = CategoryCache(max_size=2, ttl=60, clock=clock)
+
+        assert cache.get_by_id(3, source.load_table, source.load_id(3)).name == "C"
+        assert cache.get_by_id(3, source.load_table, source.load_id(3)).name == "C"
+        stats = cache.statistics()
+        assert stats["size"] == 2
+        assert stats["complete"] is False
+        # An incomplete snapshot is not dropped when a row is found outside it
+        assert source.table_loads == 1
+        assert source.row_loads == 2
+
+    def test_disabled(self, clock):
+        """Test max_size 0 always reads the database."""
+        source = FakeCategories("Work")
+        cache = CategoryCache(max_size=0, ttl=60, clock=clock)
+
+        assert cache.get_by_id(1, source.load_table, source.load_id(1)).name == "Work"
+        assert source.table_loads == 0
+        assert cache.misses == 1
+
+    def test_invalidate_discards_racing_load(self, clock):
+        """Test a load that overlaps an invalidation is not stored."""
+        source = FakeCategories("Work")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+
+        def load_then_write(limit: int) -> List[CachedCategory]:
+            rows = source.load_table(limit)
+            cache.invalidate()
+            return rows
+
+        cache.get_by_id(1, load_then_write, source.load_id(1))
+        assert cache.statistics()["size"] == 0
+
+    def test_get_many_reads_misses_together(self, clock):
+        """Test several IDs are answered with at most one extra query."""
+        source = FakeCategories("A", "B")
+        cache = CategoryCache(max_size=10, ttl=60, clock=clock)
+
+        found = cache.get_many_by_id([1, 2, 2], source.load_table, source.load_ids)
+        assert sorted(found) == [1, 2]
+        assert source.row_loads == 0
+
+        found = cache.get_many_by_id([1, 7, 8], source.load_table, source.load_ids)
+        assert sorted(found) == [1]
+        assert source.row_loads == 1
+
+
+class TestCategoryCacheIntegration:
+    """Category cache as used by the API."""
+
+    def test_category_created_by_other_worker(
+        self, client: TestClient, db: Session, sample_category
+    ):
+        """Test a category inserted behind the cache's back is usable at once."""
+        client.get(f"/api/categories/{sample_category['id']}")
+
+        other = Category(name="Elsewhere")
+        db.add(other)
+        db.commit()
+
+        response = client.post(
+            "/api/tasks", json={"title": "Task", "category_id": other.id}
+        )
+        assert response.status_code == 201
+
+    def test_duplicate_check_after_create(self, client: TestClient):
+        """Test a newly created category name is rejected as duplicate."""
+        assert client.post("/api/categories", json={"name": "Work"}).status_code == 201
+        assert client.post("/api/categories", json={"name": "Work"}).status_code == 409
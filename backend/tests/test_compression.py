@@ -0,0 +1,211 @@
+"""Tests for negotiated response compression."""
+
+import gzip
+import json
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, encode, negotiate
+from app.core.config import settings
+
+# Roughly 1 KiB of JSON per task, so a handful of tasks clears the threshold
+DESCRIPTION = "Collect the numbers, write the summary and send it. " * 18
+
+
+def raw_get(client: TestClient, path: str, accept_encoding: str):
+    """Return a response and its body exactly as sent, without decoding it."""
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.fixture
+def tasks(client: TestClient) -> list:
+    """Create enough tasks for GET /api/tasks to be worth compressing."""
+    response = client.post(
+        "/api/tasks/bulk",
+        json={
+            "tasks": [
+                {"title": f"Task {i}", "description": DESCRIPTION} for i in range(5)
+            ]
+        },
+    )
+    return response.json()["tasks"]
+
+
+class TestNegotiate:
+    """Test suite for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        "accept_encoding,expected",
+        [
+            (None, None),
+            ("", None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("gzip, deflate", "gzip"),
+            ("gzip, br", "br"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("GZIP;Q=0.8", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+            ("*", "br"),
+            ("br;q=0, *", "gzip"),
+            ("gzip;q=oops", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding, expected):
+        """Test q-values, wildcards and the brotli preference on ties."""
+        assert negotiate(accept_encoding) == expected
+
+    def test_disabled(self, monkeypatch):
+        """Test nothing is negotiated when compression is switched off."""
+        monkeypatch.setattr(settings, "COMPRESSION_ENABLED", False)
+        assert negotiate("gzip, br") is None
+
+
+class TestEncode:
+    """Test suite for encode."""
+
+    def test_below_threshold_unchanged(self):
+        """Test small bodies are not worth compressing."""
+        body = b"x" * (settings.COMPRESSION_MINIMUM_SIZE - 1)
+        assert encode(body, "gzip") == (body, None)
+
+    @pytest.mark.parametrize(
+        "encoding,decompress", [("gzip", gzip.decompress), ("br", brotli.decompress)]
+    )
+    def test_round_trip(self, encoding, decompress):
+        """Test compressed bodies decompress to the original."""
+        body = b'{"title":"Task"}' * 200
+        encoded = encode(body, encoding)
+        assert encoded.encoding == encoding
+        assert len(encoded.body) < len(body)
+        assert decompress(encoded.body) == body
+
+    def test_gzip_deterministic(self):
+        """Test identical bodies compress to identical bytes (no timestamp)."""
+        body = b"a" * 4096
+        assert encode(body, "gzip") == encode(body, "gzip")
+
+
+class TestEndpoints:
+    """Compression of API responses."""
+
+    @pytest.mark.parametrize(
+        "encoding,decompress", [("gzip", gzip.decompress), ("br", brotli.decompress)]
+    )
+    def test_task_list(self, client: TestClient, tasks, encoding, decompress):
+        """Test the task list is sent in the negotiated coding."""
+        plain, plain_body = raw_get(client, "/api/tasks", "identity")
+        response, body = raw_get(client, "/api/tasks", encoding)
+
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body) < len(plain_body)
+        assert decompress(body) == plain_body
+        assert response.headers["etag"] == plain.headers["etag"]
+        assert "content-encoding" not in plain.headers
+
+    def test_small_task_list_varies_once(self, client: TestClient):
+        """Test a list below the threshold names Accept-Encoding in Vary once."""
+        response, _ = raw_get(client, "/api/tasks", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers.get_list("vary") == ["Accept-Encoding"]
+
+    def test_cache_hit_not_recompressed(self, client: TestClient, tasks):
+        """Test cached pages keep their compressed variant."""
+        first, first_body = raw_get(client, "/api/tasks", "gzip")
+        second, second_body = raw_get(client, "/api/tasks", "gzip")
+
+        assert first_body == second_body
+        stats = client.get("/api/admin/cache").json()["caches"]["task_lists"]
+        assert stats["hits"] >= 1
+        assert stats["compressions"] == 1
+        assert stats["bytes"] == len(gzip.decompress(first_body)) + len(first_body)
+
+    def test_other_endpoints(self, client: TestClient, tasks):
+        """Test other responses are compressed by the middleware."""
+        response, body = raw_get(client, f"/api/tasks/{tasks[0]['id']}", "br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert len(brotli.decompress(body)) > len(body)
+
+    def test_small_response_uncompressed(self, client: TestClient):
+        """Test responses below the threshold are sent as is."""
+        response, body = raw_get(client, "/health", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert json.loads(body) == {
+            "status": "healthy",
+            "service": settings.PROJECT_NAME,
+            "version": settings.PROJECT_VERSION,
+        }
+
+    def test_not_modified_uncompressed(self, client: TestClient, tasks):
+        """Test 304 responses carry no body to compress."""
+        etag = client.get("/api/tasks").headers["etag"]
+        response = client.get(
+            "/api/tasks", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 304
+        assert "content-encoding" not in response.headers
+
+
+class TestMiddleware:
+    """CompressionMiddleware on a minimal application."""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        """Provide a client for an app with streamed and binary responses."""
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+
+        @app.get("/stream")
+        def stream():
+            chunks = (f'{{"line":{i}}}\n'.encode() for i in range(1000))
+            return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+        @app.get("/binary")
+        def binary():
+            return Response(b"\0" * 4096, media_type="image/png")
+
+        @app.get("/encoded")
+        def encoded():
+            body = gzip.compress(b"x" * 4096)
+            return PlainTextResponse(body, headers={"Content-Encoding": "gzip"})
+
+        return TestClient(app)
+
+    @pytest.mark.parametrize(
+        "encoding,decompress", [("gzip", gzip.decompress), ("br", brotli.decompress)]
+    )
+    def test_streamed(self, client: TestClient, encoding, decompress):
+        """Test streamed bodies are compressed chunk by chunk."""
+        response, body = raw_get(client, "/stream", encoding)
+
+        assert response.headers["content-encoding"] == encoding
+        assert "content-length" not in response.headers
+        lines = decompress(body).decode().splitlines()
+        assert lines[0] == '{"line":0}' and lines[-1] == '{"line":999}'
+
+    def test_binary_passes_through(self, client: TestClient):
+        """Test media types that do not compress well are left alone."""
+        response, body = raw_get(client, "/binary", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert body == b"\0" * 4096
+
+    def test_encoded_passes_through(self, client: TestClient):
+        """Test bodies already carrying a Content-Encoding are not compressed again."""
+        response, body = raw_get(client, "/encoded", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body) == b"x" * 4096
@@ -0,0 +1,244 @@
+"""Tests for the Server-Sent Events broker and endpoint."""
+
+import asyncio
+import json
+from typing import AsyncIterator, Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.core.events import (
+    HEARTBEAT_FRAME,
+    RESYNC_FRAME,
+    EventBroker,
+    Subscription,
+    event_broker,
+    format_event,
+)
+from app.main import app
+from app.models.task import TaskStatus
+from app.schemas.category import CategoryCreate
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskCreate,
+    TaskSelection,
+    TaskStatusUpdate,
+    TaskUpdate,
+)
+from app.services.category_service import CategoryService
+from app.services.task_service import TaskService
+
+
+def parse(frame: bytes) -> tuple:
+    """Return the (event, data) of an SSE frame."""
+    lines = [line for line in frame.decode().splitlines() if line]
+    fields = dict(line.split(": ", 1) for line in lines)
+    return fields["event"], json.loads(fields["data"])
+
+
+async def next_frame(stream: AsyncIterator[bytes]) -> bytes:
+    """Read one frame, failing instead of hanging if none arrives."""
+    return await asyncio.wait_for(stream.__anext__(), 2)
+
+
+async def in_thread(run: Callable[[], object]) -> object:
+    """Run a callable in a worker thread, as sync endpoints do."""
+    return await asyncio.get_running_loop().run_in_executor(None, run)
+
+
+class TestSubscription:
+    """Tests for the bounded per-subscriber queue."""
+
+    def test_overflow_replaces_queue_with_resync(self):
+        """Test a full queue is emptied and further events dropped."""
+
+        async def run() -> None:
+            subscription = Subscription(queue_size=2)
+            assert subscription.offer(b"1") and subscription.offer(b"2")
+            assert not subscription.offer(b"3")
+            assert subscription.dropping
+            assert subscription.offer(b"4")
+            assert subscription.queue.qsize() == 1
+
+        asyncio.run(run())
+
+
+class TestEventBroker:
+    """Tests for publishing and streaming events."""
+
+    def test_format_event(self):
+        """Test frames carry the id, event name and one-line JSON data."""
+        frame = format_event(7, "task.deleted", b'{"id":3}')
+        assert frame == b'id: 7\nevent: task.deleted\ndata: {"id":3}\n\n'
+
+    def test_stream(self):
+        """Test events published from other threads reach the stream in order."""
+        broker = EventBroker(queue_size=8, heartbeat=60, retry_ms=2500)
+
+        async def run() -> None:
+            stream = broker.stream()
+            assert await next_frame(stream) == b"retry: 2500\n\n"
+            assert broker.subscribers == 1
+
+            await in_thread(lambda: broker.publish("task.deleted", {"id": 1}))
+            home = CategoryCreate(name="Home", color="#10B981")
+            broker.publish("category.created", home)
+            first, second = await next_frame(stream), await next_frame(stream)
+            assert first.startswith(b"id: 1\n")
+            assert parse(first) == ("task.deleted", {"id": 1})
+            assert parse(second) == (
+                "category.created",
+                {"name": "Home", "color": "#10B981"},
+            )
+
+            await stream.aclose()
+            assert broker.subscribers == 0
+
+        asyncio.run(run())
+        assert broker.statistics()["published"] == 2
+
+    def test_publish_without_subscribers(self):
+        """Test publishing to nobody is a no-op."""
+        broker = EventBroker(queue_size=8, heartbeat=60, retry_ms=2500)
+        broker.publish("task.deleted", {"id": 1})
+        assert broker.statistics()["published"] == 0
+
+    def test_heartbeat(self):
+        """Test idle streams send a heartbeat comment."""
+        broker = EventBroker(queue_size=8, heartbeat=0.01, retry_ms=2500)
+
+        async def run() -> None:
+            stream = broker.stream()
+            await next_frame(stream)
+            assert await next_frame(stream) == HEARTBEAT_FRAME
+            await stream.aclose()
+
+        asyncio.run(run())
+
+    def test_slow_subscriber_resyncs(self):
+        """Test a subscriber that falls behind gets a resync, others are unaffected."""
+        broker = EventBroker(queue_size=3, heartbeat=60, retry_ms=2500)
+
+        async def run() -> None:
+            slow, fast = broker.stream(), broker.stream()
+            await next_frame(slow)
+            await next_frame(fast)
+
+            received: List[int] = []
+            for task_id in range(6):
+                broker.publish("task.deleted", {"id": task_id})
+                received.append(parse(await next_frame(fast))[1]["id"])
+            assert received == list(range(6))
+
+            # Events 0-2 filled the queue; 3 overflowed it and 4-5 were dropped
+            assert await next_frame(slow) == RESYNC_FRAME
+            broker.publish("task.deleted", {"id": 6})
+            assert parse(await next_frame(slow)) == ("task.deleted", {"id": 6})
+
+            await slow.aclose()
+            await fast.aclose()
+
+        asyncio.run(run())
+        assert broker.statistics()["resyncs"] == 1
+
+
+class TestServiceEvents:
+    """Tests for the events published by the services after each write."""
+
+    def test_task_and_category_writes(self, db: Session):
+        """Test every kind of write publishes one event, after it committed."""
+
+        async def run() -> List[tuple]:
+            stream = event_broker.stream()
+            await next_frame(stream)
+
+            def write() -> None:
+                tasks = TaskService(db)
+                category = CategoryService(db).create_category(
+                    CategoryCreate(name="Work")
+                )
+                task = tasks.create_task(
+                    TaskCreate(title="Draft", category_id=category.id)
+                )
+                tasks.update_task(task.id, TaskUpdate(title="Final"))
+                tasks.update_task_status(
+                    task.id, TaskStatusUpdate(status=TaskStatus.COMPLETED)
+                )
+                tasks.create_tasks_bulk(
+                    TaskBulkCreate(tasks=[TaskCreate(title="A"), TaskCreate(title="B")])
+                )
+                tasks.delete_tasks_bulk(TaskSelection(filter={"status": "todo"}))
+                tasks.delete_task(task.id)
+
+            await in_thread(write)
+            events = [parse(await next_frame(stream)) for _ in range(7)]
+            await stream.aclose()
+            return events
+
+        events = asyncio.run(run())
+        assert [name for name, _ in events] == [
+            "category.created",
+            "task.created",
+            "task.updated",
+            "task.status_changed",
+            "tasks.changed",
+            "tasks.changed",
+            "task.deleted",
+        ]
+        task = events[1][1]
+        assert task["category"]["name"] == "Work"
+        assert events[2][1]["title"] == "Final"
+        assert events[3][1]["status"] == "completed"
+        assert events[4][1] == {"action": "created", "count": 2}
+        assert events[5][1] == {"action": "deleted", "count": 2}
+        assert events[6][1] == {"id": task["id"]}
+
+
+class TestEventsEndpoint:
+    """Tests for GET /api/events through the full ASGI application."""
+
+    def test_stream_until_disconnect(self, db: Session):
+        """Test the endpoint streams uncompressed events and cleans up on disconnect."""
+
+        async def run() -> None:
+            disconnected = asyncio.Event()
+            sent: "asyncio.Queue[dict]" = asyncio.Queue()
+
+            async def receive() -> dict:
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/api/events",
+                "raw_path": b"/api/events",
+                "query_string": b"",
+                "root_path": "",
+                "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip, br")],
+                "client": ("127.0.0.1", 1234),
+                "server": ("test", 80),
+            }
+            request = asyncio.create_task(app(scope, receive, sent.put))
+
+            start = await asyncio.wait_for(sent.get(), 2)
+            headers = dict(start["headers"])
+            assert start["status"] == 200
+            assert headers[b"content-type"].startswith(b"text/event-stream")
+            assert b"content-encoding" not in headers
+            assert (await asyncio.wait_for(sent.get(), 2))["body"].startswith(b"retry:")
+
+            await in_thread(
+                lambda: TaskService(db).create_task(TaskCreate(title="Pushed"))
+            )
+            body = (await asyncio.wait_for(sent.get(), 2))["body"]
+            name, task = parse(body)
+            assert (name, task["title"]) == ("task.created", "Pushed")
+
+            disconnected.set()
+            await asyncio.wait_for(request, 2)
+            assert event_broker.subscribers == 0
+
+        asyncio.run(run())
@@ -0,0 +1,58 @@
+"""Tests for Alembic database migrations."""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+
+from app.core.database import Base
+from app.models.task_search import is_search_index_table
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _alembic_config(database_url: str) -> Config:
+    """Build an Alembic config pointing at the given database."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.set_main_option("sqlalchemy.url", database_url)
+    return config
+
+
+class TestMigrations:
+    """Test suite for the migration history."""
+
+    def test_upgrade_matches_models(self, tmp_path: Path):
+        """Test that migrating to head yields exactly the model schema."""
+        database_url = f"sqlite:///{tmp_path / 'migrations.db'}"
+        command.upgrade(_alembic_config(database_url), "head")
+
+        engine = create_engine(database_url)
+        with engine.connect() as conn:
+            context = MigrationContext.configure(
+                conn,
+                opts={
+                    "include_name": lambda name, type_, parents: not (
+                        type_ == "table" and is_search_index_table(name)
+                    )
+                },
+            )
+            diff = compare_metadata(context, Base.metadata)
+            search_tables = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE name LIKE 'tasks_fts%'"
+            ).scalars().all()
+        engine.dispose()
+
+        assert diff == []
+        assert "tasks_fts" in search_tables
+        assert "tasks_fts_insert" in search_tables
+
+    def test_downgrade_to_base(self, tmp_path: Path):
+        """Test that every migration can be reverted."""
+        config = _alembic_config(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+        command.upgrade(config, "head")
+        command.downgrade(config, "base")
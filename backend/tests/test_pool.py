@@ -0,0 +1,101 @@
+"""Tests for connection pool configuration and monitoring."""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import NullPool, SingletonThreadPool, StaticPool
+
+from app.core.config import settings
+from app.core.pool import (
+    MonitoredAsyncAdaptedQueuePool,
+    MonitoredQueuePool,
+    pool_options,
+    pool_statistics,
+)
+
+
+class TestPoolOptions:
+    """Test suite for per-dialect pool defaults and overrides."""
+
+    def test_file_sqlite_defaults(self):
+        """Test file-based SQLite uses a monitored QueuePool without pre-ping."""
+        options = pool_options("sqlite:///./taskflow.db")
+        assert options["poolclass"] is MonitoredQueuePool
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 10
+        assert options["pool_pre_ping"] is False
+
+    def test_memory_sqlite_defaults(self):
+        """Test in-memory SQLite shares one connection through a StaticPool."""
+        options = pool_options("sqlite://")
+        assert options["poolclass"] is StaticPool
+        assert "pool_size" not in options
+
+    def test_server_defaults(self):
+        """Test server databases pre-ping and recycle their connections."""
+        options = pool_options("postgresql://user:pw@localhost/taskflow")
+        assert options["poolclass"] is MonitoredQueuePool
+        assert options["pool_size"] == 10
+        assert options["pool_pre_ping"] is True
+        assert options["pool_recycle"] == 1800
+
+    def test_async_queue_pool(self):
+        """Test async engines get the asyncio-compatible queue pool."""
+        options = pool_options("sqlite+aiosqlite:///./taskflow.db", is_async=True)
+        assert options["poolclass"] is MonitoredAsyncAdaptedQueuePool
+
+    def test_settings_override_defaults(self, monkeypatch):
+        """Test DB_POOL_* settings take precedence over dialect defaults."""
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+        monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 1.5)
+        monkeypatch.setattr(settings, "DB_POOL_PRE_PING", True)
+        options = pool_options("sqlite:///./taskflow.db")
+        assert options["pool_size"] == 2
+        assert options["max_overflow"] == 0
+        assert options["pool_timeout"] == 1.5
+        assert options["pool_pre_ping"] is True
+
+    @pytest.mark.parametrize(
+        "kind, poolclass", [("null", NullPool), ("singleton", SingletonThreadPool)]
+    )
+    def test_pool_class_setting(self, monkeypatch, kind, poolclass):
+        """Test DB_POOL_CLASS selects the pool implementation."""
+        monkeypatch.setattr(settings, "DB_POOL_CLASS", kind)
+        options = pool_options("sqlite:///./taskflow.db")
+        assert options["poolclass"] is poolclass
+        assert "max_overflow" not in options
+
+
+class TestPoolStatistics:
+    """Test suite for live pool statistics."""
+
+    def test_checkout_occupancy_and_waits(self, monkeypatch, tmp_path):
+        """Test statistics follow checkouts and record timeouts."""
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+        monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 0.05)
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        engine = create_engine(url, **pool_options(url))
+
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                stats = pool_statistics(engine)
+                assert stats["checked_out"] == 1
+                assert stats["idle"] == 0
+
+                with pytest.raises(exc.TimeoutError):
+                    engine.connect()
+
+            stats = pool_statistics(engine)
+        finally:
+            engine.dispose()
+
+        assert stats["pool_class"] == "MonitoredQueuePool"
+        assert stats["size"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["idle"] == 1
+        assert stats["overflow"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_ms_max"] >= 0
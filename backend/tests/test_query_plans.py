@@ -0,0 +1,338 @@
+"""Query plan checks for task repository queries."""
+
+import itertools
+import re
+from datetime import datetime, timedelta
+from typing import Generator, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.category import Category
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.task_repository import TaskRepository
+
+# A plain "SCAN <table>" is a full table scan; scans that walk an index in
+# order (and stop at LIMIT) are reported as "SCAN <table> USING ... INDEX".
+# "hits" is the already-limited page of search results, not a table.
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW|hits$)\S+$")
+
+FILTER_COMBINATIONS = list(
+    itertools.product(
+        [None, TaskStatus.TODO],
+        [None, TaskPriority.HIGH],
+        [None, 1],
+    )
+)
+
+
+@pytest.fixture
+def plan_engine() -> Generator[Engine, None, None]:
+    """
+    Create an in-memory database seeded with a spread of tasks.
+
+    Yields:
+        Engine: SQLite engine with the full schema and indexes
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add(Category(name="Work"))
+        for i in range(300):
+            session.add(
+                Task(
+                    title=f"Task {i}",
+                    status=list(TaskStatus)[i % 3],
+                    priority=list(TaskPriority)[i % 3],
+                    category_id=1 if i % 2 else None,
+                    due_date=datetime(2026, 1, 1) + timedelta(hours=7 * i),
+                )
+            )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _capture(engine: Engine, run) -> List[Tuple[str, tuple]]:
+    """Run a callable and return every statement it executed."""
+    statements: List[Tuple[str, tuple]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def _assert_indexed(
+    engine: Engine, statements: List[Tuple[str, tuple]], allow_sort: bool = False
+) -> None:
+    """Assert that no statement plans a full table scan or (unless allowed) a temp sort."""
+    assert statements
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = [
+                row[3]
+                for row in conn.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                )
+            ]
+            for step in plan:
+                assert not FULL_SCAN.match(step), (statement, plan)
+                if not allow_sort:
+                    assert "TEMP B-TREE" not in step, (statement, plan)
+
+
+class TestTaskQueryPlans:
+    """Every TaskRepository query shape must be served by an index."""
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS)
+    def test_get_page(self, plan_engine: Engine, status, priority, category_id):
+        """Test the combined page + total query for each filter shape."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            for after in (None, (datetime.utcnow(), 150)):
+                statements = _capture(
+                    plan_engine,
+                    lambda: repository.get_page(
+                        status=status,
+                        priority=priority,
+                        category_id=category_id,
+                        limit=20,
+                        after=after,
+                    ),
+                )
+                _assert_indexed(plan_engine, statements)
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS)
+    def test_get_page_sparse(self, plan_engine: Engine, status, priority, category_id):
+        """Test narrowed column lists keep the same index use."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.get_page(
+                    status=status,
+                    priority=priority,
+                    category_id=category_id,
+                    limit=20,
+                    after=(datetime.utcnow(), 150),
+                    fields=frozenset({"id", "title", "status"}),
+                ),
+            )
+            _assert_indexed(plan_engine, statements)
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS)
+    def test_iter_batches(self, plan_engine: Engine, status, priority, category_id):
+        """Test exports stream in index order, without a full scan or sort."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: list(
+                    repository.iter_batches(
+                        status=status, priority=priority, category_id=category_id
+                    )
+                ),
+            )
+            _assert_indexed(plan_engine, statements)
+
+    @pytest.mark.parametrize("after", [None, (5, 10)])
+    def test_get_changes(self, plan_engine: Engine, after):
+        """Test the change feed seeks the change_seq indexes of both tables."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine, lambda: repository.get_changes(after, limit=101)
+            )
+            # Without a cursor, tasks only; with one, both tables are read
+            # in two ranges: the rest of the cursor's sequence, then later ones
+            assert len(statements) == (1 if after is None else 4)
+            _assert_indexed(plan_engine, statements)
+            with plan_engine.connect() as conn:
+                for statement, parameters in statements:
+                    plan = " ".join(
+                        row[3]
+                        for row in conn.exec_driver_sql(
+                            "EXPLAIN QUERY PLAN " + statement, parameters
+                        )
+                    )
+                    assert re.search(r"ix_task(s|_tombstones)_change_seq", plan), plan
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS[1:])
+    def test_update_many(self, plan_engine: Engine, status, priority, category_id):
+        """Test the bucket count and the UPDATE of a bulk update by filter."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.update_many(
+                    {"priority": TaskPriority.LOW},
+                    status=status,
+                    priority=priority,
+                    category_id=category_id,
+                    returning=True,
+                ),
+            )
+            executed = [statement for statement, _ in statements]
+            assert any("GROUP BY" in sql for sql in executed)
+            assert any(sql.startswith("UPDATE tasks") for sql in executed)
+            # Counting per counter bucket groups in a temporary b-tree
+            _assert_indexed(plan_engine, statements, allow_sort=True)
+
+    def test_update_many_by_ids(self, plan_engine: Engine):
+        """Test a bulk update by IDs looks tasks up by primary key."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.update_many(
+                    {"status": TaskStatus.COMPLETED}, ids=[3, 40, 41]
+                ),
+            )
+            _assert_indexed(plan_engine, statements, allow_sort=True)
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS[1:])
+    def test_delete_many(self, plan_engine: Engine, status, priority, category_id):
+        """Test the chunked DELETE ... RETURNING of a bulk delete by filter."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.delete_many(
+                    status=status,
+                    priority=priority,
+                    category_id=category_id,
+                    chunk_size=20,
+                ),
+            )
+            executed = [statement for statement, _ in statements]
+            assert any(sql.startswith("DELETE FROM tasks") for sql in executed)
+            _assert_indexed(plan_engine, statements)
+
+    def test_delete_many_by_ids(self, plan_engine: Engine):
+        """Test a bulk delete by IDs looks tasks up by primary key."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine, lambda: repository.delete_many(ids=[3, 40, 41])
+            )
+            _assert_indexed(plan_engine, statements)
+
+    def test_get_by_id(self, plan_engine: Engine):
+        """Test the primary key lookup."""
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(plan_engine, lambda: repository.get_by_id(42))
+            _assert_indexed(plan_engine, statements)
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS)
+    def test_search_page(self, plan_engine: Engine, status, priority, category_id):
+        """Test searches go through the full-text index, not a scan of tasks.
+
+        Ranked results are necessarily sorted by bm25 after matching, so a
+        temp sort of the matches is expected here.
+        """
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            for after in (None, (-1.0, 150)):
+                statements = _capture(
+                    plan_engine,
+                    lambda: repository.get_page(
+                        status=status,
+                        priority=priority,
+                        category_id=category_id,
+                        limit=20,
+                        after=after,
+                        search='"task"',
+                    ),
+                )
+                _assert_indexed(plan_engine, statements, allow_sort=True)
+
+    @pytest.mark.parametrize("status,priority,category_id", FILTER_COMBINATIONS)
+    def test_get_page_due_range(
+        self, plan_engine: Engine, status, priority, category_id
+    ):
+        """Test due-date filters never scan tasks, including completed history.
+
+        Matches may come from the partial due_date index in due_date order,
+        in which case the page is sorted afterwards.
+        """
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.get_page(
+                    status=status,
+                    priority=priority,
+                    category_id=category_id,
+                    limit=20,
+                    due_after=datetime(2026, 1, 5),
+                    due_before=datetime(2026, 1, 20),
+                ),
+            )
+            _assert_indexed(plan_engine, statements, allow_sort=True)
+
+    def test_due_calendar(self, plan_engine: Engine):
+        """Test the calendar reads only the partial index of open tasks.
+
+        Grouping by day needs a small sort of the rows in range.
+        """
+        with Session(plan_engine) as session:
+            repository = TaskRepository(session)
+            statements = _capture(
+                plan_engine,
+                lambda: repository.get_due_calendar(
+                    datetime(2026, 1, 5), datetime(2026, 1, 20)
+                ),
+            )
+            _assert_indexed(plan_engine, statements, allow_sort=True)
+            with plan_engine.connect() as conn:
+                statement, parameters = statements[0]
+                plan = [
+                    row[3]
+                    for row in conn.exec_driver_sql(
+                        "EXPLAIN QUERY PLAN " + statement, parameters
+                    )
+                ]
+            assert any("ix_tasks_open_due_date" in step for step in plan), plan
+
+
+class TestCategoryQueryPlans:
+    """Category aggregate queries must not scan the tasks table."""
+
+    def test_get_all_with_counts(self, plan_engine: Engine):
+        """Test counts are read from task_counters, never from tasks.
+
+        Ordering the grouped categories by name needs a small sort.
+        """
+        with Session(plan_engine) as session:
+            statements = _capture(
+                plan_engine, CategoryRepository(session).get_all_with_counts
+            )
+        assert len(statements) == 1
+        _assert_indexed(plan_engine, statements, allow_sort=True)
+        assert " tasks " not in statements[0][0]
+        with plan_engine.connect() as conn:
+            plan = [
+                row[3]
+                for row in conn.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statements[0][0], statements[0][1]
+                )
+            ]
+        assert any(
+            "ix_task_counters_category_id_status_count" in step for step in plan
+        ), plan
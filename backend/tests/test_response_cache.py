@@ -0,0 +1,165 @@
+"""Tests for the serialized response cache."""
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.compression import Encoded
+from app.core.response_cache import ResponseCache
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskCreate
+
+
+class Clock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Provide a clock starting at zero."""
+    return Clock()
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_hit_after_put(self, clock):
+        """Test a stored body is returned for the same generation and key."""
+        cache = ResponseCache(max_bytes=100, ttl=30, clock=clock)
+
+        assert cache.get("g1", "a") is None
+        cache.put("g1", "a", b"body")
+        assert cache.get("g1", "a") == Encoded(b"body")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_new_generation_drops_entries(self, clock):
+        """Test entries of a previous generation are never served."""
+        cache = ResponseCache(max_bytes=100, ttl=30, clock=clock)
+        cache.get("g1", "a")
+        cache.put("g1", "a", b"old")
+
+        assert cache.get("g2", "a") is None
+        assert cache.statistics()["bytes"] == 0
+        assert cache.invalidations == 1
+
+    def test_put_for_old_generation_ignored(self, clock):
+        """Test a body computed before a write is not stored after it."""
+        cache = ResponseCache(max_bytes=100, ttl=30, clock=clock)
+        cache.get("g1", "a")
+        cache.get("g2", "b")
+
+        cache.put("g1", "a", b"stale")
+        assert cache.get("g2", "a") is None
+
+    def test_lru_bounded_by_bytes(self, clock):
+        """Test least recently used bodies are evicted to respect max_bytes."""
+        cache = ResponseCache(max_bytes=10, ttl=30, clock=clock)
+        cache.get("g", "a")
+        cache.put("g", "a", b"aaaa")
+        cache.put("g", "b", b"bbbb")
+        cache.get("g", "a")
+        cache.put("g", "c", b"cccc")
+
+        assert cache.get("g", "b") is None
+        assert cache.get("g", "a") == Encoded(b"aaaa")
+        assert cache.get("g", "c") == Encoded(b"cccc")
+        assert cache.statistics()["bytes"] == 8
+        assert cache.evictions == 1
+
+    def test_oversized_body_not_stored(self, clock):
+        """Test a body larger than the whole cache is skipped."""
+        cache = ResponseCache(max_bytes=4, ttl=30, clock=clock)
+        cache.get("g", "a")
+        cache.put("g", "a", b"too large")
+        assert cache.statistics()["size"] == 0
+
+    def test_ttl(self, clock):
+        """Test entries expire after the TTL."""
+        cache = ResponseCache(max_bytes=100, ttl=30, clock=clock)
+        cache.get("g", "a")
+        cache.put("g", "a", b"body")
+
+        clock.now = 31
+        assert cache.get("g", "a") is None
+
+    def test_disabled(self, clock):
+        """Test a disabled cache stores and serves nothing."""
+        cache = ResponseCache(max_bytes=100, ttl=30, enabled=False, clock=clock)
+        cache.put("g", "a", b"body")
+        assert cache.get("g", "a") is None
+        assert cache.misses == 0
+
+
+class TestTaskListCache:
+    """Task list cache as used by GET /api/tasks."""
+
+    def _stats(self, client: TestClient) -> dict:
+        """Return the task list cache statistics."""
+        return client.get("/api/admin/cache").json()["caches"]["task_lists"]
+
+    def test_repeated_request_hits(self, client: TestClient):
+        """Test the same filters are answered from the cache."""
+        client.post("/api/tasks", json={"title": "Task"})
+
+        first = client.get("/api/tasks?status=todo")
+        second = client.get("/api/tasks?status=todo")
+
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+        stats = self._stats(client)
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["bytes"] == len(first.content)
+
+    def test_equivalent_parameters_share_entry(self, client: TestClient):
+        """Test defaults, parameter order and search spacing are normalized."""
+        client.post("/api/tasks", json={"title": "Write report", "priority": "high"})
+
+        client.get("/api/tasks?status=todo&priority=high")
+        client.get("/api/tasks?priority=high&status=todo&limit=100")
+        client.get("/api/tasks?q=write%20report")
+        client.get("/api/tasks?q=%20write%20%20report%20")
+
+        assert self._stats(client)["hits"] == 2
+
+    def test_matches_default_rendering(self, client: TestClient):
+        """Test cached bodies are byte-for-byte what JSONResponse would send."""
+        client.post(
+            "/api/tasks",
+            json={
+                "title": "Café ☕",
+                "description": "naïve",
+                "due_date": "2026-01-01T09:00:00",
+            },
+        )
+        client.get("/api/tasks")
+        response = client.get("/api/tasks")
+
+        assert self._stats(client)["hits"] == 1
+        assert response.content == JSONResponse(response.json()).body
+
+    def test_write_invalidates(self, client: TestClient):
+        """Test a task write is visible on the next request."""
+        client.get("/api/tasks")
+        client.post("/api/tasks", json={"title": "New"})
+
+        assert client.get("/api/tasks").json()["total"] == 1
+
+    def test_write_by_other_worker_invalidates(self, client: TestClient, db: Session):
+        """Test writes that bypass this process's API are never served stale."""
+        client.get("/api/tasks")
+
+        TaskRepository(db).create(TaskCreate(title="Elsewhere"))
+
+        assert client.get("/api/tasks").json()["total"] == 1
+
+    def test_errors_not_cached(self, client: TestClient):
+        """Test failed requests leave the cache empty."""
+        assert client.get("/api/tasks?category_id=9999").status_code == 404
+        assert self._stats(client)["size"] == 0
@@ -0,0 +1,189 @@
+"""Tests for single-pass JSON serialization of response models."""
+
+from typing import Any, Type
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.serialization import ModelJSONResponse, render_json
+from app.schemas.category import (
+    CategoryListResponse,
+    CategoryResponse,
+    CategoryWithCountsListResponse,
+)
+from app.schemas.task import (
+    TaskBulkCreateResponse,
+    TaskBulkDeleteResponse,
+    TaskBulkUpdateResponse,
+    TaskCalendarResponse,
+    TaskListResponse,
+    TaskResponse,
+    TaskStatsResponse,
+)
+
+# Text exercising escaping: quotes, backslashes, control characters,
+# non-ASCII letters and characters outside the BMP
+AWKWARD_TEXT = 'Say "hi" \\ tab\there\nnew line \x01\x1f é ☕ 😀  '
+
+
+def fastapi_body(model: BaseModel, response_model: Any) -> bytes:
+    """Return the body FastAPI sends when a route returns the model itself."""
+    app = FastAPI()
+
+    @app.get("/", response_model=response_model)
+    def endpoint():
+        return model
+
+    return TestClient(app).get("/").content
+
+
+@pytest.fixture
+def populated(client: TestClient) -> dict:
+    """Create a category and tasks with awkward text and every optional field."""
+    category = client.post(
+        "/api/categories", json={"name": AWKWARD_TEXT[:100], "color": "#A1B2C3"}
+    ).json()
+    task = client.post(
+        "/api/tasks",
+        json={
+            "title": AWKWARD_TEXT,
+            "description": AWKWARD_TEXT * 3,
+            "priority": "high",
+            "category_id": category["id"],
+            "due_date": "2025-11-01T09:30:00.123456",
+        },
+    ).json()
+    client.post("/api/tasks", json={"title": "Plain"})
+    return {"category": category, "task": task}
+
+
+class TestRenderJson:
+    """Test suite for render_json."""
+
+    def test_matches_fastapi(self):
+        """Test awkward text is escaped exactly as FastAPI does."""
+        model = CategoryResponse(id=1, name=AWKWARD_TEXT[:100], color=None)
+        assert render_json(model) == fastapi_body(model, CategoryResponse)
+
+    def test_response_passes_bytes_through(self):
+        """Test pre-serialized bytes are sent unchanged."""
+        response = ModelJSONResponse(b'{"a":1}', status_code=201, headers={"X-A": "b"})
+        assert response.body == b'{"a":1}'
+        assert response.status_code == 201
+        assert response.headers["x-a"] == "b"
+        assert response.media_type == "application/json"
+
+
+class TestEndpointBodies:
+    """Endpoint bodies are byte-for-byte what response_model would produce."""
+
+    @pytest.mark.parametrize(
+        "path,response_model",
+        [
+            ("/api/tasks", TaskListResponse),
+            ("/api/tasks?limit=1", TaskListResponse),
+            ("/api/tasks/{task_id}", TaskResponse),
+            ("/api/tasks/stats", TaskStatsResponse),
+            ("/api/tasks/calendar?from=2025-11-01&to=2025-11-30", TaskCalendarResponse),
+            ("/api/categories", CategoryListResponse),
+            ("/api/categories?with_counts=true", CategoryWithCountsListResponse),
+            ("/api/categories/{category_id}", CategoryResponse),
+        ],
+    )
+    def test_get(
+        self, client: TestClient, populated, path: str, response_model: Type[BaseModel]
+    ):
+        """Test GET bodies against FastAPI's own rendering of the same model."""
+        path = path.format(
+            task_id=populated["task"]["id"], category_id=populated["category"]["id"]
+        )
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert "etag" in response.headers
+
+        model = response_model.model_validate(response.json())
+        assert response.content == fastapi_body(model, response_model)
+
+    def test_writes(self, client: TestClient, populated):
+        """Test write endpoint bodies and status codes."""
+        task_id = populated["task"]["id"]
+        writes = [
+            (
+                client.post("/api/tasks", json={"title": AWKWARD_TEXT}),
+                201,
+                TaskResponse,
+            ),
+            (
+                client.put(f"/api/tasks/{task_id}", json={"title": "Renamed ☕"}),
+                200,
+                TaskResponse,
+            ),
+            (
+                client.patch(f"/api/tasks/{task_id}/status", json={"status": "completed"}),
+                200,
+                TaskResponse,
+            ),
+            (
+                client.post("/api/tasks/bulk", json={"tasks": [{"title": "é"}]}),
+                201,
+                TaskBulkCreateResponse,
+            ),
+            (
+                client.patch(
+                    "/api/tasks",
+                    json={
+                        "ids": [task_id],
+                        "changes": {"priority": "low"},
+                        "return_tasks": True,
+                    },
+                ),
+                200,
+                TaskBulkUpdateResponse,
+            ),
+            (
+                client.request("DELETE", "/api/tasks", json={"ids": [task_id]}),
+                200,
+                TaskBulkDeleteResponse,
+            ),
+            (
+                client.post("/api/categories", json={"name": "Ünïcode"}),
+                201,
+                CategoryResponse,
+            ),
+        ]
+        for response, status_code, response_model in writes:
+            assert response.status_code == status_code, response.text
+            model = response_model.model_validate(response.json())
+            assert response.content == fastapi_body(model, response_model)
+
+
+class TestOpenApi:
+    """Returning responses directly must not change the documented bodies."""
+
+    @pytest.mark.parametrize(
+        "method,path,status_code,model_name",
+        [
+            ("get", "/api/tasks", "200", "TaskListResponse"),
+            ("post", "/api/tasks", "201", "TaskResponse"),
+            ("patch", "/api/tasks", "200", "TaskBulkUpdateResponse"),
+            ("delete", "/api/tasks", "200", "TaskBulkDeleteResponse"),
+            ("post", "/api/tasks/bulk", "201", "TaskBulkCreateResponse"),
+            ("get", "/api/tasks/stats", "200", "TaskStatsResponse"),
+            ("get", "/api/tasks/calendar", "200", "TaskCalendarResponse"),
+            ("get", "/api/tasks/{task_id}", "200", "TaskResponse"),
+            ("put", "/api/tasks/{task_id}", "200", "TaskResponse"),
+            ("patch", "/api/tasks/{task_id}/status", "200", "TaskResponse"),
+            ("post", "/api/categories", "201", "CategoryResponse"),
+            ("get", "/api/categories/{category_id}", "200", "CategoryResponse"),
+        ],
+    )
+    def test_response_model_documented(
+        self, client: TestClient, method, path, status_code, model_name
+    ):
+        """Test each route still documents its response model."""
+        operation = client.get("/openapi.json").json()["paths"][path][method]
+        schema = operation["responses"][status_code]["content"]["application/json"]
+        assert schema["schema"]["$ref"].split("/")[-1].startswith(model_name)
@@ -0,0 +1,67 @@
+"""Tests for the SQLite connection PRAGMAs."""
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import Base, configure_sqlite, effective_sqlite_pragmas
+from app.models.task import Task
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    """Return the URL of a throwaway file-based SQLite database."""
+    return f"sqlite:///{tmp_path / 'pragmas.db'}"
+
+
+class TestSqlitePragmas:
+    """Test suite for PRAGMAs applied on connect."""
+
+    def test_defaults_applied(self, sqlite_url: str):
+        """Test every new connection gets the high-throughput settings."""
+        engine = create_engine(sqlite_url)
+        configure_sqlite(engine)
+        try:
+            pragmas = effective_sqlite_pragmas(engine)
+        finally:
+            engine.dispose()
+
+        assert pragmas == {
+            "busy_timeout": 5000,
+            "journal_mode": "wal",
+            "synchronous": "NORMAL",
+            "cache_size": -64000,
+            "mmap_size": 268435456,
+            "temp_store": "MEMORY",
+            "foreign_keys": "ON",
+        }
+
+    def test_settings_override(self, monkeypatch, sqlite_url: str):
+        """Test PRAGMA values come from settings."""
+        monkeypatch.setattr(settings, "SQLITE_JOURNAL_MODE", "DELETE")
+        monkeypatch.setattr(settings, "SQLITE_SYNCHRONOUS", "FULL")
+        monkeypatch.setattr(settings, "SQLITE_MMAP_SIZE", 0)
+        engine = create_engine(sqlite_url)
+        configure_sqlite(engine)
+        try:
+            pragmas = effective_sqlite_pragmas(engine)
+        finally:
+            engine.dispose()
+
+        assert pragmas["journal_mode"] == "delete"
+        assert pragmas["synchronous"] == "FULL"
+        assert pragmas["mmap_size"] == 0
+
+    def test_foreign_keys_enforced(self, sqlite_url: str):
+        """Test tasks cannot reference a missing category."""
+        engine = create_engine(sqlite_url)
+        configure_sqlite(engine)
+        Base.metadata.create_all(bind=engine)
+        try:
+            with Session(engine) as db:
+                db.add(Task(title="Orphan", category_id=999))
+                with pytest.raises(exc.IntegrityError):
+                    db.commit()
+        finally:
+            engine.dispose()
@@ -11,23 +11,38 @@ interface Task {
   created_at: string
 }
 
+interface TaskStats {
+  total: number
+  by_status: Record<string, number>
+  by_priority: Record<string, number>
+}
+
 export default function DashboardPage() {
   const { data, isLoading, error } = useQuery({
-    queryKey: ['tasks'],
+    queryKey: ['tasks', { limit: 5 }],
     queryFn: async () => {
-      const res = await fetch('/api/tasks')
+      const res = await fetch('/api/tasks?limit=5')
       if (!res.ok) throw new Error('Failed to fetch tasks')
       const json = await res.json()
       return json.tasks || []
     },
   })
 
+  const { data: statsData } = useQuery({
+    queryKey: ['tasks', 'stats'],
+    queryFn: async () => {
+      const res = await fetch('/api/tasks/stats')
+      if (!res.ok) throw new Error('Failed to fetch task statistics')
+      return res.json() as Promise<TaskStats>
+    },
+  })
+
   const tasks = data as Task[] || []
   const stats = {
-    total: tasks.length,
-    todo: tasks.filter((t: Task) => t.status === 'todo').length,
-    inProgress: tasks.filter((t: Task) => t.status === 'in_progress').length,
-    completed: tasks.filter((t: Task) => t.status === 'completed').length,
+    total: statsData?.total ?? 0,
+    todo: statsData?.by_status.todo ?? 0,
+    inProgress: statsData?.by_status.in_progress ?? 0,
+    completed: statsData?.by_status.completed ?? 0,
   }
 
   if (isLoading) return <div className="text-center py-8">Loading...</div>
@@ -4,7 +4,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { DndContext, DragEndEvent, closestCorners, useDroppable } from '@dnd-kit/core'
 import { SortableContext, verticalListSortingStrategy, useSortable } from '@dnd-kit/sortable'
 import { CSS } from '@dnd-kit/utilities'
-import { useState } from 'react'
+import { useRef, useState } from 'react'
 
 interface Task {
   id: number
@@ -15,6 +15,18 @@ interface Task {
   created_at: string
 }
 
+interface TaskChanges {
+  tasks: Task[]
+  deleted: number[]
+  next_cursor: string
+  has_more: boolean
+}
+
+// Newest first, like GET /api/tasks
+function byNewest(a: Task, b: Task) {
+  return b.created_at.localeCompare(a.created_at) || b.id - a.id
+}
+
 function TaskCard({ task }: { task: Task }) {
   const { attributes, listeners, setNodeRef, transform, transition } = useSortable({
     id: task.id,
@@ -78,13 +90,30 @@ export default function TasksPage() {
   const [showForm, setShowForm] = useState(false)
   const [newTask, setNewTask] = useState({ title: '', description: '', priority: 'medium' })
 
+  // Local copy kept in sync through the change feed: after the first load,
+  // refetches only download what changed since the last cursor
+  const sync = useRef<{ cursor: string | null; tasks: Map<number, Task> }>({
+    cursor: null,
+    tasks: new Map(),
+  })
+
   const { data, isLoading } = useQuery({
     queryKey: ['tasks'],
     queryFn: async () => {
-      const res = await fetch('/api/tasks')
-      if (!res.ok) throw new Error('Failed to fetch')
-      const json = await res.json()
-      return json.tasks || []
+      const state = sync.current
+      let hasMore = true
+      while (hasMore) {
+        const params = new URLSearchParams({ limit: '500' })
+        if (state.cursor) params.set('since', state.cursor)
+        const res = await fetch(`/api/tasks/changes?${params}`)
+        if (!res.ok) throw new Error('Failed to fetch')
+        const json: TaskChanges = await res.json()
+        json.deleted.forEach((id) => state.tasks.delete(id))
+        json.tasks.forEach((task) => state.tasks.set(task.id, task))
+        state.cursor = json.next_cursor
+        hasMore = json.has_more
+      }
+      return Array.from(state.tasks.values()).sort(byNewest)
     },
   })
 